@@ -3,7 +3,6 @@ import os
 import sys
 import logging
 from datetime import datetime, timedelta
-from sqlalchemy.orm import sessionmaker
 import time
 from sqlalchemy.exc import OperationalError
 from celery.schedules import crontab
@@ -29,12 +28,14 @@ from botocore.client import Config
 from .models import User, Notification
 from .rate_limiting import limiter
 from .extensions import db, socketio  # Import db and socketio from extensions
+from .db_pool import engine_options, instrument_engine
+from .realtime import socketio_options
+from .user_cache import load_session_user
 from .utils import make_celery
 from celery import Celery
 from config import *
 from flask import request
 from twilio.rest import Client
-from sqlalchemy import create_engine
 
 
 # Blueprint imports
@@ -82,6 +83,72 @@ formatted_date = today.strftime("%Y-%m-%d")
 celery = Celery(__name__)
 
 
+def database_url(app_env: str) -> str:
+    """Return the SQLAlchemy URL for ``app_env``.
+
+    Priority: environment-specific variable > generic DATABASE_URL.
+    """
+    if app_env == "staging":
+        db_url = os.getenv("DATABASE_URL_STAGING") or os.getenv("DATABASE_URL")
+    elif app_env == "production":
+        db_url = os.getenv("DATABASE_URL_PRODUCTION") or os.getenv("DATABASE_URL")
+    else:
+        db_url = os.getenv("DATABASE_URL_LOCAL") or os.getenv("DATABASE_URL")
+
+    if not db_url:
+        raise ValueError("No DATABASE_URL set for SQLAlchemy database.")
+    return db_url
+
+
+def configure_celery(app, is_testing: bool = False):
+    """Bind the module-level Celery instance to ``app`` and set the beat schedule."""
+    global celery
+
+    if is_testing:
+        app.config.setdefault("broker_url", "memory://")
+        app.config.setdefault("result_backend", "rpc://")
+        app.config.setdefault("task_always_eager", True)
+    else:
+        app.config.update(
+            broker_url     = broker_url,
+            result_backend = result_backend,
+            imports=("app.fetchers.news_fetcher", "app.tasks"),
+        )
+
+    celery = make_celery(app, celery)
+    celery.conf.broker_connection_retry_on_startup = True
+    
+    # ➊ Define your periodic schedule
+    celery.conf.beat_schedule = {
+        'fetch-news-every-5-minutes': {
+            'task': 'app.fetchers.news_fetcher.fetch_data',
+            'schedule': 300.0,        # 300 seconds = 5 minutes
+            'args': (news_source,)
+        },
+        'refresh-content-scores-every-15-minutes': {
+            'task': 'app.tasks.refresh_content_scores',
+            'schedule': 900.0,        # 900 seconds = 15 minutes
+        },
+        'reconcile-counters-every-6-hours': {
+            'task': 'app.tasks.reconcile_counters',
+            'schedule': 21600.0,      # 21600 seconds = 6 hours
+        },
+    }
+    
+    celery.conf.beat_max_loop_interval = 10.0
+
+    # Celery Logging
+    celery_logger = logging.getLogger('celery')
+    celery_logger.setLevel(logging.INFO)
+    if not any(getattr(h, "_seattlepulse", False) for h in celery_logger.handlers):
+        celery_handler = logging.StreamHandler()
+        celery_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        celery_handler.setFormatter(celery_formatter)
+        celery_handler._seattlepulse = True
+        celery_logger.addHandler(celery_handler)
+    return celery
+
+
 def create_app(config_name: str | None = None):
     global celery
 
@@ -149,18 +216,10 @@ def create_app(config_name: str | None = None):
     app.config["AWS_REGION"] = aws_region 
 
     # 2) Load the correct DATABASE_URL based on APP_ENV
-    # Priority: Environment-specific variable > Generic DATABASE_URL
-    if app_env == "staging":
-        db_url = os.getenv("DATABASE_URL_STAGING") or os.getenv("DATABASE_URL")
-    elif app_env == "production":
-        db_url = os.getenv("DATABASE_URL_PRODUCTION") or os.getenv("DATABASE_URL")
-    else:
-        db_url = os.getenv("DATABASE_URL_LOCAL") or os.getenv("DATABASE_URL")
-
-    if not db_url:
-        raise ValueError("No DATABASE_URL set for SQLAlchemy database.")
-
+    db_url = database_url(app_env)
     app.config["SQLALCHEMY_DATABASE_URI"] = db_url
+    # 3) One pool per process, owned by Flask-SQLAlchemy (see app/db_pool.py)
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(db_url)
 
     # 4) Secret key
     secret_key = os.getenv("SECRET_KEY")
@@ -232,10 +291,8 @@ def create_app(config_name: str | None = None):
 
     # 8) Initialize extensions
     db.init_app(app)
-    engine = create_engine(db_url)
-    
-    Session = sessionmaker(bind=engine)
-    app.db_session = Session()
+    with app.app_context():
+        instrument_engine(db.engine)
 
     # 9) Test DB connection with retries (skip during migrations)
     is_migration = sys.argv[0].endswith("flask") and "db" in sys.argv
@@ -243,7 +300,7 @@ def create_app(config_name: str | None = None):
         max_retries = 5
         for attempt in range(1, max_retries + 1):
             try:
-                with engine.connect():
+                with app.app_context(), db.engine.connect():
                     app.db_initialized = True
                     break
             except OperationalError as e:
@@ -255,14 +312,17 @@ def create_app(config_name: str | None = None):
 
     # 10) Continue init of other extensions
     migrate = Migrate(app, db)
-    socketio.init_app(app)
+    socketio.init_app(app, **socketio_options())
     login_manager = LoginManager()
     login_manager.init_app(app)
     
+    # Ids reused by the per-test database wipes must not hit stale snapshots
+    if is_testing:
+        app.config.setdefault("USER_CACHE_TTL_SECONDS", 0)
+
     @login_manager.user_loader
     def load_user(user_id: str):
-        from .models import User
-        return User.query.get(int(user_id))
+        return load_session_user(int(user_id))
 
     mail = Mail(app)
 
@@ -331,38 +391,7 @@ def create_app(config_name: str | None = None):
         app.config["WAITLIST_SNS_ARN"] = os.getenv("WAITLIST_SNS_ARN")
 
     # Update Celery Configuration
-    if is_testing:
-        app.config.setdefault("broker_url", "memory://")
-        app.config.setdefault("result_backend", "rpc://")
-        app.config.setdefault("task_always_eager", True)
-    else:
-        app.config.update(
-            broker_url     = broker_url,
-            result_backend = result_backend,
-            imports=("app.fetchers.news_fetcher",),
-        )
-
-    celery = make_celery(app, celery)
-    celery.conf.broker_connection_retry_on_startup = True
-    
-    # ➊ Define your periodic schedule
-    celery.conf.beat_schedule = {
-        'fetch-news-every-5-minutes': {
-            'task': 'app.fetchers.news_fetcher.fetch_data',
-            'schedule': 300.0,        # 300 seconds = 5 minutes
-            'args': (news_source,)
-        }
-    }
-    
-    celery.conf.beat_max_loop_interval = 10.0
-
-    # Celery Logging
-    celery_logger = logging.getLogger('celery')
-    celery_logger.setLevel(logging.INFO)
-    celery_handler = logging.StreamHandler()
-    celery_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    celery_handler.setFormatter(celery_formatter)
-    celery_logger.addHandler(celery_handler)
+    configure_celery(app, is_testing)
 
     # App Logging
     log_level = os.getenv("LOGGING_LEVEL", "DEBUG").upper()
@@ -3,8 +3,11 @@ from flask import request, jsonify, Blueprint, current_app
 from flask_login import current_user, login_required
 from sqlalchemy.orm import subqueryload
 from app import db
-from app.models import Comment, CommentReaction, Notification, User, UserContent,ContentReport,ReportReason
+from app.models import Comment, CommentReaction, User, UserContent,ContentReport,ReportReason
+from app.notifications import create_notification
 from app.socket_events import send_notification
+from app.counters import record_reply
+from app.engagement_scores import record_engagement
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -187,6 +190,9 @@ def post_api_comments():
             parent_id=parent_id,
         )
         db.session.add(new_comment)
+        record_engagement(int(content_id), comments=1)
+        if parent_id:
+            record_reply(parent_comment.id)
         db.session.commit()
         logger.info(
             f"New comment added by user {current_user.id} for content_id={content_id}."
@@ -194,14 +200,13 @@ def post_api_comments():
 
         # Send Notification (Avoid self-notifications)
         if notification_recipient and notification_recipient != current_user.id:
-            notification = Notification(
+            notification = create_notification(
                 user_id=notification_recipient,
                 sender_id=current_user.id,
                 type=notification_type,
                 content=notification_message,
                 post_id=content_id  # Fix: Use content_id instead of content.id
             )
-            db.session.add(notification)
             db.session.commit()
             logger.info(
                 f"Notification sent to user {notification_recipient} for {notification_type}"
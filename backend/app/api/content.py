@@ -19,6 +19,16 @@ from app.models import (
     ContentReport,
     HiddenContent,
     Location,
+    ContentScore,
+)
+from app.engagement_scores import content_counts, record_engagement
+from app.feed_hydration import hydrate_feed
+from app.pagination import (
+    InvalidCursor,
+    cursor_pagination,
+    decode_cursor,
+    encode_cursor,
+    fetch_keyset_page,
 )
 from app.utils import time_since_post, is_placeholder_image
 from utils.aws_moderation import moderate_text
@@ -36,6 +46,8 @@ import uuid
 from ..utils import (
     get_neighborhood,
     get_coordinates_from_location,
+    get_location_label,
+    get_seattle_neighborhood,
     is_coordinate_in_seattle,
 )
 from app.location_service import (
@@ -96,19 +108,50 @@ def most_recent_per_source(items):
 
 
 def avoid_consecutive_sources(items):
-    """Reorder items so consecutive entries from the same user are avoided."""
-    result = list(items)
-    for i in range(1, len(result)):
-        prev_id = _get_item_user_id(result[i - 1])
-        curr_id = _get_item_user_id(result[i])
-        if prev_id is not None and curr_id == prev_id:
-            swap_idx = None
-            for j in range(i + 1, len(result)):
-                if _get_item_user_id(result[j]) != prev_id:
-                    swap_idx = j
-                    break
-            if swap_idx is not None:
-                result[i], result[swap_idx] = result[swap_idx], result[i]
+    """Reorder items so consecutive entries from the same user are avoided.
+
+    When an item repeats the previous user, the next item from a different
+    user is pulled forward and the skipped run is kept aside in ``pending``
+    instead of being rescanned, so the whole pass is O(n). The output is the
+    same as swapping each collision with the first later item from another
+    user.
+    """
+    items = list(items)
+    total = len(items)
+    result = []
+    pending = deque()  # items from a single user waiting ahead of items[position:]
+    position = 0
+    prev_id = None
+
+    while pending or position < total:
+        if pending:
+            head = pending.popleft()
+        else:
+            head = items[position]
+            position += 1
+
+        head_id = _get_item_user_id(head)
+        if prev_id is None or head_id != prev_id:
+            result.append(head)
+            prev_id = head_id
+            continue
+
+        swap_idx = position
+        while swap_idx < total and _get_item_user_id(items[swap_idx]) == prev_id:
+            swap_idx += 1
+        if swap_idx == total:
+            # Only this user's items remain; keep their order
+            result.append(head)
+            result.extend(pending)
+            result.extend(items[position:])
+            break
+
+        result.append(items[swap_idx])
+        prev_id = _get_item_user_id(items[swap_idx])
+        pending.extend(items[position:swap_idx])
+        pending.append(head)
+        position = swap_idx + 1
+
     return result
 
 
@@ -117,21 +160,16 @@ def distribute_sources(items):
     groups = OrderedDict()
     for item in items:
         uid = _get_item_user_id(item)
-        groups.setdefault(uid, []).append(item)
+        groups.setdefault(uid, deque()).append(item)
 
+    # Sources rotate through the queue and drop out once exhausted
+    active = deque(groups.values())
     result = []
-    active_keys = list(groups.keys())
-    while active_keys:
-        finished = []
-        for uid in active_keys:
-            user_items = groups.get(uid)
-            if user_items:
-                result.append(user_items.pop(0))
-            if not user_items:
-                finished.append(uid)
-        for uid in finished:
-            active_keys.remove(uid)
-            groups.pop(uid, None)
+    while active:
+        user_items = active.popleft()
+        result.append(user_items.popleft())
+        if user_items:
+            active.append(user_items)
     return result
 
 
@@ -171,8 +209,7 @@ def is_in_seattle():
     inside = bool(inside_np)
     logger.info("Coordinate (%s, %s) → inside: %s", lat, lon, inside)
     
-    neighborhoods_gdf = load_seattle_neighborhoods()
-    neighborhood = get_seattle_neighborhood(lat, lon, neighborhoods_gdf)
+    neighborhood = get_seattle_neighborhood(lat, lon)
 
     return jsonify({
         "latitude": lat,
@@ -278,31 +315,15 @@ def post_add_story():
         return jsonify(success="error", message="Failed to add story", data=None), 500
 
 
-def fetch_high_score_content(page, per_page, user_id, location_spec=None, seeded_only=False):
-    # Define weights for different components of the score
-    weights = {
-        "reaction_weight": 2,
-        "comment_weight": 3,
-        "share_weight": 5,
-    }
-    decay_factor = 86400  # 1 day in seconds
-
-    # Calculate the score expression
-    score_expression = (
-        (
-            weights["reaction_weight"] * func.count(Reaction.id)
-            + weights["comment_weight"]  * func.count(Comment.id)
-            + weights["share_weight"]   * func.count(Share.id)
-        )
-        * func.exp(
-            -(
-                func.extract("epoch", func.now() - UserContent.created_at)
-                / decay_factor
-            )
-        )
-    ).label("score")
+def _high_score_query(user_id, location_spec=None, seeded_only=False):
+    """
+    Build the filtered query behind the score-ranked feed.
+
+    Scores live in ``content_scores`` and are kept current by the reaction,
+    comment and share endpoints (see ``app.engagement_scores``), so ranking is
+    a single indexed ORDER BY instead of an aggregate over every post.
+    """
 
-    # Base query joining to User and aggregating reactions/comments/shares
     q = (
         db.session.query(
             UserContent.id,
@@ -316,17 +337,15 @@ def fetch_high_score_content(page, per_page, user_id, location_spec=None, seeded
             User.username,
             User.profile_picture_url,
             UserContent.is_in_seattle,
-            UserContent.is_seeded,                 # ✅ Add this
-            UserContent.seed_type,                 # ✅ Add this
-            UserContent.seeded_likes_count,        # ✅ Add this
-            UserContent.seeded_comments_count,     # ✅ Add this
+            UserContent.is_seeded,
+            UserContent.seed_type,
+            UserContent.seeded_likes_count,
+            UserContent.seeded_comments_count,
             UserContent.news_link,
-            score_expression,
+            ContentScore.score.label("score"),
         )
+        .join(ContentScore, ContentScore.content_id == UserContent.id)
         .join(User, User.id == UserContent.user_id)
-        .outerjoin(Reaction, Reaction.content_id == UserContent.id)
-        .outerjoin(Comment,  Comment.content_id   == UserContent.id)
-        .outerjoin(Share,    Share.content_id     == UserContent.id)
     )
 
     if seeded_only:
@@ -360,28 +379,26 @@ def fetch_high_score_content(page, per_page, user_id, location_spec=None, seeded
     for prefix in placeholder_prefixes:
         q = q.filter(~UserContent.thumbnail.ilike(prefix + "%"))
 
-    # Grouping for aggregate counts
-    grouped = q.group_by(
-        UserContent.id,
-        UserContent.title,
-        UserContent.body,
-        UserContent.location,
-        UserContent.created_at,
-        UserContent.updated_at,
-        UserContent.thumbnail,
-        UserContent.user_id,
-        User.username,
-        User.profile_picture_url,
-        UserContent.is_in_seattle,
-    )
+    return q
+
+
+def fetch_high_score_content(page, per_page, user_id, location_spec=None, seeded_only=False):
+    """
+    Return one page of score-ranked content using page/per_page offsets.
+
+    Kept for clients that still page by number; new clients should use
+    ``fetch_high_score_content_after``.
+    """
+
+    q = _high_score_query(user_id, location_spec, seeded_only)
 
     # Count total items before pagination
-    total_items = grouped.count()
+    total_items = q.count()
 
     # Apply sorting and pagination
     items = (
-        grouped
-        .order_by(desc("score"))
+        q
+        .order_by(ContentScore.score.desc(), ContentScore.content_id.desc())
         .limit(per_page)
         .offset((page - 1) * per_page)
         .all()
@@ -390,41 +407,80 @@ def fetch_high_score_content(page, per_page, user_id, location_spec=None, seeded
     return items, total_items
 
 
+def fetch_high_score_content_after(after, per_page, user_id, location_spec=None, seeded_only=False):
+    """
+    Return ``(items, has_next)`` for the page following the ``(score, id)``
+    key in ``after`` (``None`` for the first page).
+
+    Seeks on the ``(score, content_id)`` index instead of counting and
+    skipping rows, so deep pages cost the same as the first one.
+    """
+
+    q = _high_score_query(user_id, location_spec, seeded_only)
+    return fetch_keyset_page(
+        q,
+        (ContentScore.score, ContentScore.content_id),
+        after,
+        per_page,
+    )
+
+
 from sqlalchemy.orm import joinedload
 
-def fetch_seeded_content_round_robin(page: int, per_page: int, location_spec=None):
+
+def _round_robin_page(query, page: int, per_page: int):
     """
-    Fetch only seeded content (news) and return it in round robin order.
-    No scoring algorithm, just newest first per source.
-    Includes joined user info so username/profile_picture_url are available.
+    Return ``(posts, total)`` for one page of ``query`` in round robin order.
+
+    Produces the same order as ``distribute_sources`` applied to the rows
+    sorted newest first, but ranks in SQL so only the requested page is
+    loaded: each post gets its position within its source (round number)
+    and rounds list sources in order of their newest post.
     """
 
-    # Only seeded content, with joined User relationship
-    query = (
+    newest_first = (UserContent.created_at.desc(), UserContent.id.desc())
+    per_source = {"partition_by": UserContent.user_id, "order_by": newest_first}
+
+    ranked = query.with_entities(
+        UserContent.id.label("id"),
+        func.row_number().over(**per_source).label("source_round"),
+        func.first_value(UserContent.created_at).over(**per_source).label("source_newest_at"),
+        func.first_value(UserContent.id).over(**per_source).label("source_newest_id"),
+    ).subquery()
+
+    total = db.session.query(func.count()).select_from(ranked).scalar()
+
+    posts = (
         UserContent.query
-        .filter_by(is_seeded=True)
+        .join(ranked, ranked.c.id == UserContent.id)
         .options(joinedload(UserContent.user))  # preload related user object
+        .order_by(
+            ranked.c.source_round,
+            ranked.c.source_newest_at.desc(),
+            ranked.c.source_newest_id.desc(),
+        )
+        .limit(per_page)
+        .offset((page - 1) * per_page)
+        .all()
     )
 
-    if location_spec:
-        query = apply_location_filter(query, location_spec)
+    return posts, total
 
-    # Newest first
-    query = query.order_by(UserContent.created_at.desc())
 
-    # Fetch all results
-    posts = query.all()
+def fetch_seeded_content_round_robin(page: int, per_page: int, location_spec=None):
+    """
+    Fetch only seeded content (news) and return it in round robin order.
+    No scoring algorithm, just newest first per source.
+    Includes joined user info so username/profile_picture_url are available.
+    """
 
-    # Apply round robin distribution
-    posts = distribute_sources(posts)
+    # Only seeded content
+    query = UserContent.query.filter_by(is_seeded=True)
 
-    # Pagination AFTER round robin ordering
-    total = len(posts)
-    start = (page - 1) * per_page
-    end = start + per_page
-    posts = posts[start:end]
+    if location_spec:
+        query = apply_location_filter(query, location_spec)
 
-    return posts, total
+    return _round_robin_page(query, page, per_page)
 
 
 def fetch_combined_content_round_robin(page: int, per_page: int, location_spec=None):
@@ -435,31 +491,13 @@ def fetch_combined_content_round_robin(page: int, per_page: int, location_spec=N
     """
 
     # Get BOTH seeded content AND user content
-    query = (
-        UserContent.query
-        .options(joinedload(UserContent.user))  # preload related user object
-    )
+    query = UserContent.query
 
     # Optional location filter with same behavior as /content endpoint
     if location_spec:
         query = apply_location_filter(query, location_spec)
 
-    # Newest first
-    query = query.order_by(UserContent.created_at.desc())
-
-    # Fetch all results
-    posts = query.all()
-
-    # Apply round robin distribution
-    posts = distribute_sources(posts)
-
-    # Pagination AFTER round robin ordering
-    total = len(posts)
-    start = (page - 1) * per_page
-    end = start + per_page
-    posts = posts[start:end]
-
-    return posts, total
+    return _round_robin_page(query, page, per_page)
 
 
 
@@ -497,10 +535,13 @@ def get_content():
     page = request.args.get("page", default=1, type=int)
     per_page = request.args.get("per_page", default=10, type=int)
     raw_location = request.args.get("location")
+    # Passing ``cursor`` (empty for the first page) switches to keyset paging
+    cursor = request.args.get("cursor")
 
     try:
         location_spec = parse_location_filter(raw_location)
-    except InvalidLocation as exc:
+        after = decode_cursor(cursor, 2)
+    except (InvalidLocation, InvalidCursor) as exc:
         return (
             jsonify(
                 success="error",
@@ -532,36 +573,30 @@ def get_content():
             per_page,
             location_spec,
         )
-        paginated_content, total_items = fetch_high_score_content(
-            page=page,
-            per_page=per_page,
-            user_id=user_id,
-            location_spec=location_spec,
-        )
+        if cursor is not None:
+            paginated_content, has_next = fetch_high_score_content_after(
+                after,
+                per_page=per_page,
+                user_id=user_id,
+                location_spec=location_spec,
+            )
+        else:
+            paginated_content, total_items = fetch_high_score_content(
+                page=page,
+                per_page=per_page,
+                user_id=user_id,
+                location_spec=location_spec,
+            )
 
 
         # Log the fetched content length
         current_app.logger.debug(f"Fetched {len(paginated_content)} items")
 
-        # Initialize default values for unauthenticated users
-        user_reacted_content_ids = set()
-        user_reactions_dict = {}
-        user_reposted_content_ids = set()
-
-        if is_authenticated:
-            # Fetch user reactions
-            user_reactions = Reaction.query.filter_by(user_id=user_id).all()
-            user_reacted_content_ids = {
-                reaction.content_id for reaction in user_reactions
-            }
-            user_reactions_dict = {
-                reaction.content_id: reaction.reaction_type.value
-                for reaction in user_reactions
-            }
-
-            # Fetch user's reposts
-            user_reposts = Repost.query.filter_by(user_id=user_id).all()
-            user_reposted_content_ids = {repost.content_id for repost in user_reposts}
+        # Counts, top reactions and viewer flags for the whole page at once
+        hydration = hydrate_feed(
+            [item.id for item in paginated_content],
+            viewer_id=user_id,
+        )
 
         # Format content for response
         content_list = []
@@ -569,28 +604,9 @@ def get_content():
             thumbnail = getattr(item, "thumbnail", None)
             if thumbnail and is_placeholder_image(thumbnail):
                 continue
-            if item.is_seeded:
-                reactions_count = item.seeded_likes_count
-                comments_count = item.seeded_comments_count
-            else:
-                reactions_count = Reaction.query.filter_by(content_id=item.id).count()
-                comments_count = Comment.query.filter_by(content_id=item.id).count()
+            reactions_count, comments_count = hydration.counts_for(item)
+            top_reactions = hydration.top_reactions.get(item.id, [])
 
-            # Calculate top 2 reactions
-            top_reaction_counts = (
-                db.session.query(
-                    Reaction.reaction_type, db.func.count(Reaction.reaction_type)
-                )
-                .filter_by(content_id=item.id)
-                .group_by(Reaction.reaction_type)
-                .order_by(db.func.count(Reaction.reaction_type).desc())
-                .limit(2)
-                .all()
-            )
-            top_reactions = [
-                reaction_type.value for reaction_type, count in top_reaction_counts
-            ]
-            
             # 👇 Prepare link and body_text based on content type
             if item.is_seeded and item.seed_type == 'news':
                 link = item.news_link
@@ -630,39 +646,38 @@ def get_content():
 
             # Add user-specific fields only if authenticated
             if is_authenticated:
-                content_item["user_has_reacted"] = item.id in user_reacted_content_ids
-                content_item["user_reaction_type"] = user_reactions_dict.get(
-                    item.id, None
-                )
-                content_item["has_user_reposted"] = item.id in user_reposted_content_ids
+                content_item.update(hydration.viewer_fields(item.id))
 
             content_list.append(content_item)
 
         # Pagination Logic
-        # Pagination Logic
-        total_pages = total_items // per_page + (1 if total_items % per_page > 0 else 0)
+        if cursor is not None:
+            last = paginated_content[-1] if paginated_content else None
+            next_cursor = encode_cursor([last.score, last.id]) if last else None
+            pagination = cursor_pagination(next_cursor, has_next, per_page)
+            query = {"cursor": cursor, "per_page": per_page, "location": response_location}
+        else:
+            total_pages = total_items // per_page + (1 if total_items % per_page > 0 else 0)
 
-        has_next = page < total_pages
-        has_prev = page > 1
-        current_app.logger.debug(f"Has next: {has_next}, Has prev: {has_prev}")
+            has_next = page < total_pages
+            has_prev = page > 1
+            current_app.logger.debug(f"Has next: {has_next}, Has prev: {has_prev}")
+            pagination = {
+                "current_page": page,
+                "total_pages": total_pages,
+                "total_items": total_items,
+                "has_next": has_next,
+                "has_prev": has_prev,
+            }
+            query = {"page": page, "per_page": per_page, "location": response_location}
 
         # Response structure
         response = {
             "success": "success",
             "message": "Content fetched successfully",
             "data": {"content": content_list},
-            "query": {
-                "page": page,
-                "per_page": per_page,
-                "location": response_location,
-            },
-            "pagination": {
-                "current_page": page,
-                "total_pages": total_pages,
-                "total_items": total_items,
-                "has_next": has_next,
-                "has_prev": has_prev,
-            },
+            "query": query,
+            "pagination": pagination,
         }
 
         return jsonify(response), 200
@@ -737,7 +752,10 @@ def get_content_detail(content_type, content_id):
         ).count()
 
         # Count total reactions
-        total_reactions = Reaction.query.filter_by(content_id=content.id).count()
+        if content_type == "user_content":
+            total_reactions = content_counts(content.id)["reactions"]
+        else:
+            total_reactions = Reaction.query.filter_by(content_id=content.id).count()
 
         # Calculate top 2 reactions
         top_reaction_counts = (
@@ -836,9 +854,7 @@ def get_content_detail(content_type, content_id):
                             "profile_picture_url": comment.user.profile_picture_url
                             or "",
                         },
-                        "replies_count": Comment.query.filter_by(
-                            parent_id=comment.id
-                        ).count(),
+                        "replies_count": comment.replies_count,
                         "top_comment_reactions": top_comment_reactions,
                     }
 
@@ -949,11 +965,14 @@ def get_guest_feed():
             location_spec=location_spec,
         )
 
+        hydration = hydrate_feed([item.id for item in posts])
+
         content_list = []
         for item in posts:
             thumbnail = getattr(item, "thumbnail", None)
             if thumbnail and is_placeholder_image(thumbnail):
                 continue
+            reactions_count, comments_count = hydration.counts_for(item)
             content_list.append(
                 {
                     "id": item.id,
@@ -972,8 +991,9 @@ def get_guest_feed():
                     "thumbnail": item.thumbnail,
                     "is_seeded": item.is_seeded,
                     "seed_type": item.seed_type,
-                    "reactions_count": item.seeded_likes_count,
-                    "comments_count": item.seeded_comments_count,
+                    "reactions_count": reactions_count,
+                    "comments_count": comments_count,
+                    "top_reactions": hydration.top_reactions.get(item.id, []),
                     "link": item.news_link,
                     "is_in_seattle": item.is_in_seattle,
                 }
@@ -1050,44 +1070,44 @@ def get_combined_feed():
             location_spec=location_spec,
         )
 
+        viewer_id = current_user.id if current_user.is_authenticated else None
+        hydration = hydrate_feed([item.id for item in posts], viewer_id=viewer_id)
+
         content_list = []
         for item in posts:
             thumbnail = getattr(item, "thumbnail", None)
             if thumbnail and is_placeholder_image(thumbnail):
                 continue
-            if item.is_seeded:
-                reactions_count = item.seeded_likes_count
-                comments_count = item.seeded_comments_count
-                link = item.news_link
-            else:
-                reactions_count = Reaction.query.filter_by(content_id=item.id).count()
-                comments_count = Comment.query.filter_by(content_id=item.id).count()
-                link = None
+            reactions_count, comments_count = hydration.counts_for(item)
+            link = item.news_link if item.is_seeded else None
 
-            content_list.append(
-                {
-                    "id": item.id,
-                    "title": item.title,
-                    "body": item.body,
-                    "location": item.location,
-                    "location_label": format_post_location(item),
-                    "created_at": item.created_at.isoformat() if item.created_at else None,
-                    "updated_at": item.updated_at.isoformat() if item.updated_at else None,
-                    "time_since_post": time_since_post(item.created_at) if item.created_at else None,
-                    "user": {
-                        "id": item.user_id,
-                        "username": item.user.username if item.user else None,
-                        "profile_picture_url": item.user.profile_picture_url if item.user else None,
-                    },
-                    "thumbnail": item.thumbnail,
-                    "is_seeded": item.is_seeded,
-                    "seed_type": item.seed_type,
-                    "reactions_count": reactions_count,
-                    "comments_count": comments_count,
-                    "link": link,
-                    "is_in_seattle": item.is_in_seattle,
-                }
-            )
+            content_item = {
+                "id": item.id,
+                "title": item.title,
+                "body": item.body,
+                "location": item.location,
+                "location_label": format_post_location(item),
+                "created_at": item.created_at.isoformat() if item.created_at else None,
+                "updated_at": item.updated_at.isoformat() if item.updated_at else None,
+                "time_since_post": time_since_post(item.created_at) if item.created_at else None,
+                "user": {
+                    "id": item.user_id,
+                    "username": item.user.username if item.user else None,
+                    "profile_picture_url": item.user.profile_picture_url if item.user else None,
+                },
+                "thumbnail": item.thumbnail,
+                "is_seeded": item.is_seeded,
+                "seed_type": item.seed_type,
+                "reactions_count": reactions_count,
+                "comments_count": comments_count,
+                "top_reactions": hydration.top_reactions.get(item.id, []),
+                "link": link,
+                "is_in_seattle": item.is_in_seattle,
+            }
+            if viewer_id is not None:
+                content_item.update(hydration.viewer_fields(item.id))
+
+            content_list.append(content_item)
 
         total_pages = total // per_page + (1 if total % per_page else 0)
         response = {
@@ -1240,6 +1260,7 @@ def create_share(content_id):
     # Log the new share in the Share model
     share = Share(user_id=current_user.id, content_id=content.id, platform=platform)
     db.session.add(share)
+    record_engagement(content.id, shares=1)
     db.session.commit()
 
     # Generate frontend-accessible shareable link
@@ -1281,7 +1302,7 @@ def get_shared_content_detail(share_id):
     )
 
     # Reaction breakdown and total reactions
-    total_reactions = Reaction.query.filter_by(content_id=content.id).count()
+    total_reactions = content_counts(content.id)["reactions"]
     reaction_breakdown = {
         "LIKE": Reaction.query.filter_by(
             content_id=content.id, reaction_type="LIKE"
@@ -1333,7 +1354,7 @@ def get_shared_content_detail(share_id):
                 "username": comment.user.username,
                 "profile_picture_url": comment.user.profile_picture_url or "",
             },
-            "replies_count": Comment.query.filter_by(parent_id=comment.id).count(),
+            "replies_count": comment.replies_count,
         }
         for comment in top_level_comments_paginated.items
     ]
@@ -1617,14 +1638,34 @@ def delete_story(content_id):
 
 @content_v1_blueprint.route("/user-content", methods=["GET"])
 def api_user_content():
+    cursor = request.args.get("cursor")
+    try:
+        after = decode_cursor(cursor, 2)
+    except InvalidCursor as exc:
+        return jsonify(status="error", message=str(exc)), 400
+
     try:
         page = request.args.get("page", 1, type=int)
         per_page = 10
-        pagination = UserContent.query.order_by(UserContent.created_at.desc()).paginate(
-            page=page, per_page=per_page
-        )
+        next_cursor = None
+        if cursor is not None:
+            # Keyset paging on (created_at, id): no COUNT and no OFFSET scan
+            page_items, has_more = fetch_keyset_page(
+                UserContent.query,
+                (UserContent.created_at, UserContent.id),
+                after,
+                per_page,
+            )
+            if has_more:
+                last = page_items[-1]
+                next_cursor = encode_cursor([last.created_at, last.id])
+        else:
+            pagination = UserContent.query.order_by(UserContent.created_at.desc()).paginate(
+                page=page, per_page=per_page
+            )
+            page_items, has_more = pagination.items, pagination.has_next
         items = []
-        for content_item in pagination.items:
+        for content_item in page_items:
             items.append(
                 {
                     "id": content_item.id,
@@ -1648,7 +1689,10 @@ def api_user_content():
                     ).count(),
                 }
             )
-        return jsonify(status="success", content=items, hasMore=pagination.has_next)
+        response = {"status": "success", "content": items, "hasMore": has_more}
+        if cursor is not None:
+            response["nextCursor"] = next_cursor
+        return jsonify(response)
     except Exception as e:
         print(f"Error fetching user content: {e}")
         return (
@@ -1683,6 +1727,8 @@ def add_comment(content_type, content_id):
         user_id=current_user.id if current_user.is_authenticated else None,
     )
     db.session.add(new_comment)
+    if content_type == "usercontent":
+        record_engagement(content.id, comments=1)
     db.session.commit()
 
     return jsonify(status="success", message="Comment added successfully")
@@ -2004,6 +2050,7 @@ def repost_content(content_id):
             user_id=current_user.id, content_id=content_id, thoughts=thoughts
         )
         db.session.add(new_repost)
+        record_engagement(content.id, reposts=1)
         db.session.commit()
 
         return (
@@ -2045,6 +2092,7 @@ def undo_repost_content(content_id):
 
         # Remove repost record
         db.session.delete(repost)
+        record_engagement(content.id, reposts=-1)
         db.session.commit()
 
         return (
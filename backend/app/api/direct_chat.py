@@ -5,16 +5,31 @@ from app.models import (
     User,
     DirectChat,
     DirectMessage,
-    GroupChat,
-    GroupMessage,
-    GroupChatMember,
     db,
 )
 from sqlalchemy.exc import SQLAlchemyError
 from app.extensions import socketio
 from app.socket_events import send_notification  # Import the reusable function
+from app.chat_history import (
+    fetch_history,
+    history_pagination,
+    history_request,
+    serialize_messages,
+)
+from app.chat_inbox import (
+    combined_inbox_query,
+    direct_inbox_query,
+    record_direct_message,
+    refresh_direct_chat,
+)
+from app.pagination import (
+    InvalidCursor,
+    cursor_pagination,
+    decode_cursor,
+    encode_cursor,
+    fetch_keyset_page,
+)
 from datetime import datetime, timedelta
-from sqlalchemy.orm import aliased
 from werkzeug.exceptions import BadRequest
 
 # Configure Logging
@@ -130,6 +145,7 @@ def send_direct_message():
             chat_id=chat_id, sender_id=current_user.id, content=content
         )
         db.session.add(new_message)
+        record_direct_message(new_message)
         db.session.commit()
 
         logger.info(f"New message sent in chat {chat_id} by user {current_user.id}")
@@ -172,41 +188,41 @@ def fetch_all_chats():
     try:
         page = request.args.get("page", 1, type=int)
         limit = request.args.get("limit", 10, type=int)
+        # Passing ``cursor`` (empty for the first page) switches to keyset paging
+        cursor = request.args.get("cursor")
 
         if page < 1 or limit < 1:
             return create_response(
                 "error", "Invalid page or limit values.", status_code=400
             )
 
-        # ✅ Get chats involving the current user that have at least one message
-        user_chats_query = DirectChat.query \
-            .filter(
-                (DirectChat.user1_id == current_user.id) | (DirectChat.user2_id == current_user.id)
-            ) \
-            .join(DirectChat.messages) \
-            .options(
-                db.joinedload(DirectChat.user1),
-                db.joinedload(DirectChat.user2),
-                db.joinedload(DirectChat.messages).joinedload(DirectMessage.sender)
-            ) \
-            .group_by(DirectChat.id) \
-            .order_by(db.func.max(DirectMessage.created_at).desc())
-
-        paginated_chats = user_chats_query.paginate(
-            page=page, per_page=limit, error_out=False
-        )
+        try:
+            after = decode_cursor(cursor, 2)
+        except InvalidCursor as exc:
+            return create_response("error", str(exc), status_code=400)
+
+        # ✅ Chats involving the current user that have at least one message,
+        # newest first, using the denormalized last message
+        chats_query = direct_inbox_query(current_user.id)
+        order_columns = (DirectChat.last_message_at, DirectChat.id)
+
+        if cursor is not None:
+            rows, has_next = fetch_keyset_page(chats_query, order_columns, after, limit)
+        else:
+            total_chats = chats_query.count()
+            rows = (
+                chats_query.order_by(*[column.desc() for column in order_columns])
+                .offset((page - 1) * limit)
+                .limit(limit)
+                .all()
+            )
 
         # ✅ Build the response list
         chats_data = []
-        for chat in paginated_chats.items:
+        for chat, latest_message in rows:
             # Determine receiver
             receiver = chat.user2 if chat.user1_id == current_user.id else chat.user1
 
-            # Get the latest message
-            if not chat.messages:
-                continue  # skip if no messages
-            latest_message = sorted(chat.messages, key=lambda m: m.created_at, reverse=True)[0]
-
             chat_dict = {
                 "chat_id": chat.id,
                 "receiver": {
@@ -218,22 +234,32 @@ def fetch_all_chats():
                     "profile_picture_url": receiver.profile_picture_url or "",
                 },
                 "latest_message": latest_message.to_dict(),
-                "last_updated": latest_message.created_at.isoformat()
+                "last_updated": chat.last_message_at.isoformat()
             }
 
             chats_data.append(chat_dict)
 
         logger.info(f"User {current_user.id} fetched chats: page {page}, limit {limit}")
 
+        if cursor is not None:
+            last = rows[-1][0] if rows else None
+            next_cursor = encode_cursor([last.last_message_at, last.id]) if last else None
+            data = {
+                "chats": chats_data,
+                "pagination": cursor_pagination(next_cursor, has_next, limit),
+            }
+        else:
+            data = {
+                "total_chats": total_chats,
+                "total_pages": (total_chats + limit - 1) // limit,
+                "current_page": page,
+                "chats": chats_data,
+            }
+
         return create_response(
             "success",
             "Chats retrieved successfully.",
-            {
-                "total_chats": paginated_chats.total,
-                "total_pages": paginated_chats.pages,
-                "current_page": paginated_chats.page,
-                "chats": chats_data,
-            },
+            data,
             status_code=200,
         )
 
@@ -256,6 +282,12 @@ def fetch_chat_messages(chat_id):
         if page < 1 or limit < 1:
             return create_response("error", "Invalid page or limit values.", 400)
 
+        # Passing ``before`` or ``after`` (a message id) switches to keyset paging
+        try:
+            direction, anchor_id = history_request(request.args)
+        except InvalidCursor as exc:
+            return create_response("error", str(exc), status_code=400)
+
         # ✅ Check chat existence and user access
         chat = DirectChat.query \
             .options(
@@ -272,24 +304,34 @@ def fetch_chat_messages(chat_id):
         # ✅ Identify the receiver
         receiver = chat.user2 if chat.user1_id == current_user.id else chat.user1
 
-        # ✅ Paginate messages
-        messages_query = DirectMessage.query \
-            .filter_by(chat_id=chat_id) \
-            .order_by(DirectMessage.created_at.desc())
-
-        paginated_messages = messages_query.paginate(page=page, per_page=limit, error_out=False)
-
-        # ✅ Prepare pagination metadata
-        pagination = {
-            "current_page": paginated_messages.page,
-            "total_pages": paginated_messages.pages,
-            "total_items": paginated_messages.total,
-            "has_next": paginated_messages.page < paginated_messages.pages,
-            "has_prev": paginated_messages.page > 1
-        }
+        if direction:
+            try:
+                messages, has_more = fetch_history(
+                    DirectMessage, DirectMessage.chat_id, chat_id, limit, anchor_id, direction
+                )
+            except InvalidCursor as exc:
+                return create_response("error", str(exc), status_code=400)
+            pagination = history_pagination(messages, has_more, limit, direction)
+        else:
+            # ✅ Paginate messages
+            messages_query = DirectMessage.query \
+                .filter_by(chat_id=chat_id) \
+                .order_by(DirectMessage.created_at.desc(), DirectMessage.id.desc())
+
+            paginated_messages = messages_query.paginate(page=page, per_page=limit, error_out=False)
+            messages = paginated_messages.items
+
+            # ✅ Prepare pagination metadata
+            pagination = {
+                "current_page": paginated_messages.page,
+                "total_pages": paginated_messages.pages,
+                "total_items": paginated_messages.total,
+                "has_next": paginated_messages.page < paginated_messages.pages,
+                "has_prev": paginated_messages.page > 1
+            }
 
-        # ✅ Prepare response
-        messages_data = [message.to_dict() for message in paginated_messages.items]
+        # ✅ Prepare response (senders loaded in one query)
+        messages_data = serialize_messages(messages)
 
         return create_response(
             "success",
@@ -362,7 +404,10 @@ def delete_direct_message(message_id):
 
         # ✅ Full delete for both users
         if delete_for_all:
+            chat_id = message.chat_id
             db.session.delete(message)
+            db.session.flush()
+            refresh_direct_chat(chat_id)
             db.session.commit()
             return jsonify({"status": "success", "message": "Message deleted for both users."}), 200
 
@@ -481,9 +526,6 @@ def edit_direct_message(message_id):
             "error", "An unexpected error occurred.", status_code=500
         )
 
-from sqlalchemy.orm import aliased
-from sqlalchemy.sql import func
-
 @chat_v1_blueprint.route("/list/all", methods=["GET"])
 @login_required
 def fetch_all_chats_combined_sorted():
@@ -491,90 +533,31 @@ def fetch_all_chats_combined_sorted():
         limit = request.args.get("limit", 10, type=int)
         page = request.args.get("page", 1, type=int)
         offset = (page - 1) * limit
-
-        Receiver = aliased(User)
-
-        # ========== Latest Direct Messages ==========
-        latest_direct_subquery = (
-            db.session.query(
-                DirectMessage.chat_id,
-                func.max(DirectMessage.created_at).label("latest_created_at")
-            )
-            .join(DirectChat, DirectMessage.chat_id == DirectChat.id)
-            .filter((DirectChat.user1_id == current_user.id) | (DirectChat.user2_id == current_user.id))
-            .group_by(DirectMessage.chat_id)
-            .subquery()
-        )
-
-        latest_direct_messages = (
-            db.session.query(
-                DirectChat.id.label("chat_id"),
-                DirectMessage.content.label("content"),
-                DirectMessage.created_at.label("created_at"),
-                DirectMessage.sender_id.label("sender_id"),
-                Receiver.id.label("receiver_id"),
-                Receiver.first_name.label("receiver_first_name"),
-                Receiver.last_name.label("receiver_last_name"),
-                Receiver.username.label("receiver_username"),
-                Receiver.email.label("receiver_email"),
-                Receiver.profile_picture_url.label("receiver_profile_picture_url"),
-                db.literal("direct").label("chat_type"),
-                db.null().label("group_name")
-            )
-            .join(DirectMessage, DirectChat.id == DirectMessage.chat_id)
-            .join(latest_direct_subquery,
-                  (DirectMessage.chat_id == latest_direct_subquery.c.chat_id) &
-                  (DirectMessage.created_at == latest_direct_subquery.c.latest_created_at)
-            )
-            .join(
-                Receiver,
-                db.case(
-                    (DirectChat.user1_id == current_user.id, DirectChat.user2_id),
-                    else_=DirectChat.user1_id
-                ) == Receiver.id
-            )
-        )
-
-        # ========== Latest Group Messages ==========
-        latest_group_subquery = (
-            db.session.query(
-                GroupMessage.group_chat_id.label("chat_id"),
-                func.max(GroupMessage.created_at).label("latest_created_at")
+        # Passing ``cursor`` (empty for the first page) switches to keyset paging
+        cursor = request.args.get("cursor")
+
+        try:
+            after = decode_cursor(cursor, 3)
+        except InvalidCursor as exc:
+            return create_response("error", str(exc), status_code=400)
+
+        # Direct and group chats with their denormalized last message; ids
+        # overlap between the two, so the chat type breaks ties
+        combined = combined_inbox_query(current_user.id)
+        ordered_query = db.session.query(combined)
+        order_columns = (combined.c.last_message_at, combined.c.chat_type, combined.c.chat_id)
+
+        if cursor is not None:
+            paginated_results, has_next = fetch_keyset_page(
+                ordered_query, order_columns, after, limit
             )
-            .join(GroupChatMember, GroupMessage.group_chat_id == GroupChatMember.group_chat_id)
-            .filter(GroupChatMember.user_id == current_user.id)
-            .group_by(GroupMessage.group_chat_id)
-            .subquery()
-        )
-
-        latest_group_messages = (
-            db.session.query(
-                GroupChat.id.label("chat_id"),
-                GroupMessage.content.label("content"),
-                GroupMessage.created_at.label("created_at"),
-                GroupMessage.sender_id.label("sender_id"),
-                db.null().label("receiver_id"),
-                db.null().label("receiver_first_name"),
-                db.null().label("receiver_last_name"),
-                db.null().label("receiver_username"),
-                db.null().label("receiver_email"),
-                db.null().label("receiver_profile_picture_url"),
-                db.literal("group").label("chat_type"),
-                GroupChat.name.label("group_name")
-            )
-            .join(GroupMessage, GroupChat.id == GroupMessage.group_chat_id)
-            .join(latest_group_subquery,
-                  (GroupMessage.group_chat_id == latest_group_subquery.c.chat_id) &
-                  (GroupMessage.created_at == latest_group_subquery.c.latest_created_at)
+        else:
+            paginated_results = (
+                ordered_query.order_by(*[column.desc() for column in order_columns])
+                .offset(offset)
+                .limit(limit)
+                .all()
             )
-        )
-
-        # ========== Combine ==========
-        combined = latest_direct_messages.union_all(latest_group_messages).subquery("combined_chats")
-
-        # ========== Order & Paginate ==========
-        ordered_query = db.session.query(combined).order_by(combined.c.created_at.desc())
-        paginated_results = ordered_query.offset(offset).limit(limit).all()
 
         # ========== Format Response ==========
         chats = []
@@ -604,19 +587,24 @@ def fetch_all_chats_combined_sorted():
                 "latest_message": {
                     "sender_id": row.sender_id,
                     "content": row.content,
-                    "created_at": row.created_at.isoformat()
+                    "created_at": row.last_message_at.isoformat()
                 },
-                "last_updated": row.created_at.isoformat()
+                "last_updated": row.last_message_at.isoformat()
             })
 
+        if cursor is not None:
+            last = paginated_results[-1] if paginated_results else None
+            next_cursor = (
+                encode_cursor([last.last_message_at, last.chat_type, last.chat_id]) if last else None
+            )
+            data = {"chats": chats, "pagination": cursor_pagination(next_cursor, has_next, limit)}
+        else:
+            data = {"current_page": page, "limit": limit, "chats": chats}
+
         return create_response(
             "success",
             "Combined chat list retrieved and sorted.",
-            {
-                "current_page": page,
-                "limit": limit,
-                "chats": chats
-            },
+            data,
             200
         )
 
@@ -11,6 +11,7 @@ from app.models import (
     CommentReaction,
     Repost,
     Follow,
+    ContentScore,
 )
 from app.location_service import (
     InvalidLocation,
@@ -19,6 +20,15 @@ from app.location_service import (
     format_post_location,
     parse_location_filter,
 )
+from app.engagement_scores import content_counts
+from app.feed_hydration import hydrate_feed
+from app.pagination import (
+    InvalidCursor,
+    cursor_pagination,
+    decode_cursor,
+    encode_cursor,
+    fetch_keyset_page,
+)
 import logging
 from sqlalchemy.sql import func, desc
 from sqlalchemy.orm import subqueryload
@@ -28,37 +38,15 @@ logger = logging.getLogger(__name__)
 feed_v1_blueprint = Blueprint("feed_v1", __name__, url_prefix="/api/v1/feed")
 
 
-# Scoring function based on reactions, comments, and shares with time decay
-def get_mypulse_score():
-    weights = {
-        "reaction_weight": 2,
-        "comment_weight": 3,
-        "share_weight": 5,
-    }
-    decay_factor = 86400  # 1 day in seconds
-
-    score_expression = (
-        (
-            weights["reaction_weight"] * func.count(Reaction.id)
-            + weights["comment_weight"] * func.count(Comment.id)
-            + weights["share_weight"] * func.count(Share.id)
-        )
-        * func.exp(
-            -(func.extract("epoch", func.now() - UserContent.created_at) / decay_factor)
-        )
-    ).label("score")
-
-    return score_expression
-
-
-# Function to fetch ranked mypulse content, excluding blocked users
-def fetch_mypulse_content(page, per_page, user_id, location_spec=None):
-    score_expression = get_mypulse_score()
-    followed_users_ids = [follow.followed_id for follow in current_user.followed]
-
-    if not followed_users_ids:
-        return [], 0  # Return empty list and zero count
+def _mypulse_query(user_id, location_spec=None):
+    """
+    Build the query for posts by accounts ``user_id`` follows, ranked by the
+    materialized engagement score in ``content_scores``.
+    """
 
+    followed_users_subquery = db.session.query(Follow.followed_id).filter(
+        Follow.follower_id == user_id
+    )
     blocked_users_subquery = db.session.query(Block.blocked_id).filter(
         Block.blocker_id == user_id
     )
@@ -66,7 +54,7 @@ def fetch_mypulse_content(page, per_page, user_id, location_spec=None):
         Block.blocked_id == user_id
     )
 
-    base_query = (
+    query = (
         db.session.query(
             UserContent.id,
             UserContent.title,
@@ -79,43 +67,34 @@ def fetch_mypulse_content(page, per_page, user_id, location_spec=None):
             User.username,
             User.profile_picture_url,
             UserContent.is_in_seattle,
-            score_expression,
+            ContentScore.score.label("score"),
         )
+        .join(ContentScore, ContentScore.content_id == UserContent.id)
         .join(User, User.id == UserContent.user_id)
-        .outerjoin(Reaction, Reaction.content_id == UserContent.id)
-        .outerjoin(Comment, Comment.content_id == UserContent.id)
-        .outerjoin(Share, Share.content_id == UserContent.id)
         .filter(
-            UserContent.user_id.in_(followed_users_ids),
+            UserContent.user_id.in_(followed_users_subquery),
             ~UserContent.user_id.in_(blocked_users_subquery),
             ~UserContent.user_id.in_(blocked_by_users_subquery),
         )
     )
 
     if location_spec:
-        base_query = apply_location_filter(base_query, location_spec)
-
-    grouped_query = base_query.group_by(
-        UserContent.id,
-        UserContent.title,
-        UserContent.body,
-        UserContent.location,
-        UserContent.created_at,
-        UserContent.updated_at,
-        UserContent.thumbnail,
-        UserContent.user_id,
-        User.username,
-        User.profile_picture_url,
-        UserContent.is_in_seattle,
-    )
+        query = apply_location_filter(query, location_spec)
+
+    return query
+
+
+# Function to fetch ranked mypulse content, excluding blocked users
+def fetch_mypulse_content(page, per_page, user_id, location_spec=None):
+    query = _mypulse_query(user_id, location_spec)
 
     # Total count before pagination
-    total_items = grouped_query.count()
+    total_items = query.count()
 
     # Paginated result
     content = (
-        grouped_query
-        .order_by(desc("score"))
+        query
+        .order_by(ContentScore.score.desc(), ContentScore.content_id.desc())
         .limit(per_page)
         .offset((page - 1) * per_page)
         .all()
@@ -124,16 +103,30 @@ def fetch_mypulse_content(page, per_page, user_id, location_spec=None):
     return content, total_items
 
 
+def fetch_mypulse_content_after(after, per_page, user_id, location_spec=None):
+    """Return ``(items, has_next)`` for the page after the ``(score, id)`` key."""
+
+    return fetch_keyset_page(
+        _mypulse_query(user_id, location_spec),
+        (ContentScore.score, ContentScore.content_id),
+        after,
+        per_page,
+    )
+
+
 @feed_v1_blueprint.route("/mypulse", methods=["GET"])
 @login_required
 def mypulse():
     raw_location = request.args.get("location")
     page = request.args.get("page", 1, type=int)
     per_page = request.args.get("per_page", 10, type=int)
+    # Passing ``cursor`` (empty for the first page) switches to keyset paging
+    cursor = request.args.get("cursor")
 
     try:
         location_spec = parse_location_filter(raw_location)
-    except InvalidLocation as exc:
+        after = decode_cursor(cursor, 2)
+    except (InvalidLocation, InvalidCursor) as exc:
         return (
             jsonify(
                 success="error",
@@ -148,78 +141,33 @@ def mypulse():
     response_location = display_location_value(raw_location, location_spec)
 
     try:
-        paginated_content, total_items = fetch_mypulse_content(
-            page=page,
-            per_page=per_page,
-            user_id=current_user.id,
-            location_spec=location_spec,
-        )
-
-        # Fetch user reactions
-        user_reactions = Reaction.query.filter_by(user_id=current_user.id).all()
-
-        # Fetch user's reposts
-        user_reposts = Repost.query.filter_by(user_id=current_user.id).all()
-
-        # Create a set of content_ids the user has reacted to
-        user_reacted_content_ids = {reaction.content_id for reaction in user_reactions}
-
-        # Store reaction details in a dictionary for quick lookup
-        user_reactions_dict = {
-            reaction.content_id: reaction.reaction_type.value
-            for reaction in user_reactions
-        }
+        if cursor is not None:
+            paginated_content, has_next = fetch_mypulse_content_after(
+                after,
+                per_page=per_page,
+                user_id=current_user.id,
+                location_spec=location_spec,
+            )
+        else:
+            paginated_content, total_items = fetch_mypulse_content(
+                page=page,
+                per_page=per_page,
+                user_id=current_user.id,
+                location_spec=location_spec,
+            )
 
-        # Create a set of content_ids the user has reposted
-        user_reposted_content_ids = {repost.content_id for repost in user_reposts}
+        # Counts, top reactions and viewer flags for the whole page at once
+        hydration = hydrate_feed(
+            [item.id for item in paginated_content],
+            viewer_id=current_user.id,
+        )
 
         content_list = []
         for item in paginated_content:
-            reactions_count = Reaction.query.filter_by(content_id=item.id).count()
-            comments_count = Comment.query.filter_by(content_id=item.id).count()
-
-            # Check if the user has reacted to this post
-            user_has_reacted = item.id in user_reacted_content_ids
-            user_reaction_type = user_reactions_dict.get(item.id, None)
-
-            # Check if the user has reposted this post
-            has_user_reposted = item.id in user_reposted_content_ids
-
-            # Calculate top 2 reactions for content
-            top_reaction_counts = (
-                db.session.query(
-                    Reaction.reaction_type, db.func.count(Reaction.reaction_type)
-                )
-                .filter_by(content_id=item.id)
-                .group_by(Reaction.reaction_type)
-                .order_by(
-                    db.func.count(Reaction.reaction_type).desc(), Reaction.reaction_type
-                )  # Secondary ordering by reaction type
-                .limit(2)
-                .all()
-            )
-            top_reactions = [
-                reaction_type.value for reaction_type, count in top_reaction_counts
-            ]
-
-            # Fetch comments for the content
-            comments = Comment.query.filter_by(content_id=item.id).all()
-            for comment in comments:
-                # Calculate top 2 reactions for each comment
-                top_comment_reaction_counts = (
-                    db.session.query(
-                        CommentReaction.reaction_type,
-                        db.func.count(CommentReaction.reaction_type),
-                    )
-                    .filter_by(content_id=comment.id)
-                    .group_by(CommentReaction.reaction_type)
-                    .order_by(
-                        db.func.count(CommentReaction.reaction_type).desc(),
-                        CommentReaction.reaction_type,
-                    )  # Secondary ordering by reaction type
-                    .limit(2)
-                    .all()
-                )
+            reactions_count = hydration.reactions_count.get(item.id, 0)
+            comments_count = hydration.comments_count.get(item.id, 0)
+            top_reactions = hydration.top_reactions.get(item.id, [])
+            viewer_fields = hydration.viewer_fields(item.id)
 
             content_list.append(
                 {
@@ -244,17 +192,31 @@ def mypulse():
                     },
                     "thumbnail": item.thumbnail,
                     "body": item.body,
-                    "user_has_reacted": user_has_reacted,  # Indicates if the user has reacted
-                    "user_reaction_type": user_reaction_type,  # Shows the type of reaction user gave
-                    "has_user_reposted": has_user_reposted,  # Indicates if the user has reposted
+                    "user_has_reacted": viewer_fields["user_has_reacted"],  # Indicates if the user has reacted
+                    "user_reaction_type": viewer_fields["user_reaction_type"],  # Shows the type of reaction user gave
+                    "has_user_reposted": viewer_fields["has_user_reposted"],  # Indicates if the user has reposted
                     "is_in_seattle": item.is_in_seattle,
                 }
             )
             
-        total_pages = total_items // per_page + (1 if total_items % per_page > 0 else 0)
-        has_next = page < total_pages
-        has_prev = page > 1
-        
+        if cursor is not None:
+            last = paginated_content[-1] if paginated_content else None
+            next_cursor = encode_cursor([last.score, last.id]) if last else None
+            pagination = cursor_pagination(next_cursor, has_next, per_page)
+            query = {"cursor": cursor, "per_page": per_page, "location": response_location}
+        else:
+            total_pages = total_items // per_page + (1 if total_items % per_page > 0 else 0)
+            has_next = page < total_pages
+            has_prev = page > 1
+            pagination = {
+                "current_page": page,
+                "total_pages": total_pages,
+                "total_items": total_items,
+                "has_next": has_next,
+                "has_prev": has_prev,
+            }
+            query = {"page": page, "per_page": per_page, "location": response_location}
+
         response = {
             "success": "success",
             "message": "My Pulse content fetched successfully",
@@ -267,21 +229,11 @@ def mypulse():
                         "reaction_type": reaction.reaction_type.value,
                         "timestamp": reaction.created_at.isoformat(),
                     }
-                    for reaction in user_reactions
+                    for reaction in hydration.viewer_reactions.values()
                 ],
             },
-            "query": {
-                "page": page,
-                "per_page": per_page,
-                "location": response_location,
-            },
-            "pagination": {
-                "current_page": page,
-                "total_pages": total_pages,
-                "total_items": total_items,
-                "has_next": has_next,
-                "has_prev": has_prev,
-            },
+            "query": query,
+            "pagination": pagination,
         }
 
         return jsonify(response), 200
@@ -338,7 +290,7 @@ def mypulse_detail(content_id):
         )
 
     # Step 3: Fetch total reactions and breakdown of reactions by type
-    total_reactions = Reaction.query.filter_by(content_id=content.id).count()
+    total_reactions = content_counts(content.id)["reactions"]
     reaction_breakdown = {
         "LIKE": Reaction.query.filter_by(
             content_id=content.id, reaction_type="LIKE"
@@ -455,7 +407,7 @@ def mypulse_detail(content_id):
                     "profile_picture_url": comment.user.profile_picture_url
                     or "https://default-profile.png",
                 },
-                "replies_count": Comment.query.filter_by(parent_id=comment.id).count(),
+                "replies_count": comment.replies_count,
                 "reactions_count": Reaction.query.filter_by(
                     content_id=comment.id
                 ).count(),
@@ -625,21 +577,7 @@ def friend_suggestions():
         data = []
         page_users = suggestions.items
 
-        # Batch fetch follower counts for page users to avoid N+1
-        if page_users:
-            page_user_ids = [u.id for u in page_users]
-            follower_counts = (
-                db.session.query(
-                    Follow.followed_id.label("user_id"),
-                    func.count(Follow.follower_id).label("followers_count"),
-                )
-                .filter(Follow.followed_id.in_(page_user_ids))
-                .group_by(Follow.followed_id)
-                .all()
-            )
-            follower_count_map = {row.user_id: row.followers_count for row in follower_counts}
-        else:
-            follower_count_map = {}
+        page_user_ids = [u.id for u in page_users]
 
         # Batch fetch news flag and post counts for page users
         news_counts_page = (
@@ -669,7 +607,7 @@ def friend_suggestions():
         posts_count_map = {row.user_id: row.posts_count for row in posts_counts_page}
 
         for user in page_users:
-            total_followers = follower_count_map.get(user.id, 0)
+            total_followers = user.followers_count
             news_posts_count = news_count_map.get(user.id, 0)
             posts_count = posts_count_map.get(user.id, 0)
 
@@ -2,6 +2,7 @@ import logging
 from flask import Blueprint, request, jsonify,current_app
 from flask_login import login_required, current_user
 from sqlalchemy.exc import SQLAlchemyError
+from app import realtime
 from app.models import db, GroupChat, GroupChatMember, GroupMessage, RoleEnum, User
 from app.socket_events import (
     handle_join_group,
@@ -9,6 +10,10 @@ from app.socket_events import (
     send_notification,
     broadcast_group_message,
 )  # Import the function
+from app.chat_history import fetch_history, history_pagination, history_request, serialize_messages
+from app.chat_inbox import record_group_message, refresh_group_chat
+from app.group_fanout import start_group_notification_emits
+from app.pagination import InvalidCursor
 from datetime import datetime, timedelta
 
 # Configure Logging
@@ -128,25 +133,28 @@ def send_group_message():
             content=content
         )
         db.session.add(new_message)
+        record_group_message(new_message)
         db.session.commit()
         logger.info(f"Message created in group {group_chat_id} by user {current_user.id}.")
 
         message_payload = new_message.to_dict()
         logger.info(f"Message payload: {message_payload}")
 
-        # Send group onboarding notifications to other members
-        group_members = GroupChatMember.query.filter_by(group_chat_id=group_chat_id).all()
-        logger.info(f"Found {len(group_members)} member(s) in group {group_chat_id}. Sending notifications...")
-        for member in group_members:
-            if member.user_id != current_user.id:
-                notification_data = {
-                    "type": "group_onboarding",
-                    "group_chat_id": group_chat_id,
-                    "message": message_payload,
-                    "info": f"{current_user.username} posted a new message in {group.name}."
-                }
-                send_notification(member.user_id, notification_data)
-                logger.info(f"Notification sent to user {member.user_id} for group {group_chat_id}.")
+        # Notify the other members in the background so sending does not
+        # slow down with the size of the group. Without a Socket.IO message
+        # queue the worker cannot reach the members' sockets, so the task
+        # only stores the notifications and this node emits them from a
+        # background task once the response is on its way.
+        from app.tasks import fan_out_group_message
+        emit_here = not realtime.has_message_queue()
+        try:
+            fan_out_group_message.delay(new_message.id, emit=not emit_here)
+            logger.info(f"Queued notifications for members of group {group_chat_id}.")
+        except Exception as e:
+            # The message is saved; only its stored notifications are lost
+            logger.error(f"Could not queue notifications for group {group_chat_id}: {str(e)}", exc_info=True)
+        if emit_here:
+            start_group_notification_emits(new_message)
 
         # Use the shared broadcast function to send the group message in real-time
         broadcast_group_message(group_chat_id, message_payload)
@@ -197,15 +205,36 @@ def fetch_group_messages(group_chat_id):
                 "error", "Invalid page or limit values.", status_code=400
             )
 
+        # Passing ``before`` or ``after`` (a message id) switches to keyset paging
+        try:
+            direction, anchor_id = history_request(request.args)
+            if direction:
+                messages, has_more = fetch_history(
+                    GroupMessage, GroupMessage.group_chat_id, group_chat_id, limit, anchor_id, direction
+                )
+        except InvalidCursor as exc:
+            return create_response("error", str(exc), status_code=400)
+
+        if direction:
+            return create_response(
+                "success",
+                "Messages retrieved successfully.",
+                {
+                    "messages": serialize_messages(messages),
+                    "pagination": history_pagination(messages, has_more, limit, direction),
+                },
+                status_code=200,
+            )
+
         # Query messages with pagination
         messages_query = GroupMessage.query.filter_by(
             group_chat_id=group_chat_id
-        ).order_by(GroupMessage.created_at.desc())
+        ).order_by(GroupMessage.created_at.desc(), GroupMessage.id.desc())
         paginated_messages = messages_query.paginate(
             page=page, per_page=limit, error_out=False
         )
 
-        messages_data = [message.to_dict() for message in paginated_messages.items]
+        messages_data = serialize_messages(paginated_messages.items)
 
         return create_response(
             "success",
@@ -829,6 +858,8 @@ def delete_group_message():
         # ✅ Full delete (admins & sender)
         if delete_for_all and (is_admin or is_sender):
             db.session.delete(message)
+            db.session.flush()
+            refresh_group_chat(group.id)
             db.session.commit()
             return create_response(
                 "success", "Message deleted for everyone.", status_code=200
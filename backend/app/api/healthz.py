@@ -1,5 +1,7 @@
 from flask import Blueprint, jsonify, current_app
+from flask_login import login_required
 from datetime import datetime
+from app.db_pool import pool_metrics
 from app.extensions import db
 from sqlalchemy import text
 import os
@@ -60,3 +62,10 @@ def health_check():
         return jsonify({**checks, "error": error_details or "Unknown error"}), 500
 
     return jsonify(checks), 200
+
+
+@healthz_blueprint.route("healthz/db-pool", methods=["GET"])
+@login_required
+def db_pool_metrics():
+    """Connection pool gauges and checkout wait times for this process."""
+    return jsonify(pool_metrics(db.engine)), 200
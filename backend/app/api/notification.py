@@ -3,6 +3,13 @@ from flask import Blueprint, jsonify, request
 from sqlalchemy.exc import SQLAlchemyError
 from flask_login import login_required, current_user
 from app.models import Notification, db
+from app.notifications import (
+    delete_notifications,
+    fetch_notifications_page,
+    mark_read,
+    unread_count,
+)
+from app.pagination import InvalidCursor, cursor_pagination, decode_cursor, encode_cursor
 
 # Configure Logging
 logging.basicConfig(level=logging.INFO)
@@ -13,26 +20,64 @@ notification_v1_blueprint = Blueprint(
     "notification_v1", __name__, url_prefix="/api/v1/notifications"
 )
 
+DEFAULT_PER_PAGE = 20
+MAX_PER_PAGE = 100
+MAX_BULK_IDS = 500
+
+
+def _notification_page(user_id, unread_only, message):
+    """Serve one ``(created_at, id)`` keyset page of a user's inbox."""
+    per_page = min(max(request.args.get("per_page", DEFAULT_PER_PAGE, type=int), 1), MAX_PER_PAGE)
+    try:
+        after = decode_cursor(request.args.get("cursor"), 2)
+    except InvalidCursor as exc:
+        return jsonify({"status": "error", "message": str(exc)}), 400
+
+    notifications, has_next = fetch_notifications_page(
+        user_id, after, per_page, unread_only=unread_only
+    )
+    last = notifications[-1] if notifications else None
+    next_cursor = encode_cursor([last.created_at, last.id]) if last else None
+    return (
+        jsonify(
+            {
+                "status": "success",
+                "message": message,
+                "data": [n.to_dict() for n in notifications],
+                "pagination": cursor_pagination(next_cursor, has_next, per_page),
+            }
+        ),
+        200,
+    )
+
+
+def _requested_ids():
+    """Return the ``ids`` list from the JSON body, or ``None`` if it is invalid."""
+    ids = (request.get_json(silent=True) or {}).get("ids")
+    if (
+        not isinstance(ids, list)
+        or not ids
+        or len(ids) > MAX_BULK_IDS
+        or not all(isinstance(i, int) and not isinstance(i, bool) for i in ids)
+    ):
+        return None
+    return ids
+
 
 # ✅ Fetch all notifications for a user
 @notification_v1_blueprint.route("/<int:user_id>", methods=["GET"])
 @login_required
 def get_all_notifications(user_id):
-    """Fetch all notifications for a specific user."""
+    """Fetch a page of a user's notifications, newest first.
+
+    Pass the previous response's ``next_cursor`` as ``cursor`` for the next page.
+    """
     if current_user.id != user_id:
         return jsonify({"status": "error", "message": "Unauthorized access"}), 403
 
     try:
-        notifications = Notification.query.filter_by(user_id=user_id).all()
-        return (
-            jsonify(
-                {
-                    "status": "success",
-                    "message": "Notifications retrieved successfully.",
-                    "data": [n.to_dict() for n in notifications],
-                }
-            ),
-            200,
+        return _notification_page(
+            user_id, False, "Notifications retrieved successfully."
         )
     except SQLAlchemyError as db_error:
         logger.error(
@@ -45,27 +90,43 @@ def get_all_notifications(user_id):
 @notification_v1_blueprint.route("/unread/<int:user_id>", methods=["GET"])
 @login_required
 def get_unread_notifications(user_id):
-    """Fetch only unread notifications for a specific user."""
+    """Fetch a page of a user's unread notifications, newest first."""
+    if current_user.id != user_id:
+        return jsonify({"status": "error", "message": "Unauthorized access"}), 403
+
+    try:
+        return _notification_page(
+            user_id, True, "Unread notifications retrieved successfully."
+        )
+    except SQLAlchemyError as db_error:
+        logger.error(
+            f"Database error fetching unread notifications for user {user_id}: {str(db_error)}"
+        )
+        return jsonify({"status": "error", "message": "Database error occurred"}), 500
+
+
+# ✅ Unread badge count
+@notification_v1_blueprint.route("/unread/count/<int:user_id>", methods=["GET"])
+@login_required
+def get_unread_count(user_id):
+    """Return the number of unread notifications from the maintained counter."""
     if current_user.id != user_id:
         return jsonify({"status": "error", "message": "Unauthorized access"}), 403
 
     try:
-        notifications = Notification.query.filter_by(
-            user_id=user_id, is_read=False
-        ).all()
         return (
             jsonify(
                 {
                     "status": "success",
-                    "message": "Unread notifications retrieved successfully.",
-                    "data": [n.to_dict() for n in notifications],
+                    "message": "Unread count retrieved successfully.",
+                    "data": {"unread_count": unread_count(user_id)},
                 }
             ),
             200,
         )
     except SQLAlchemyError as db_error:
         logger.error(
-            f"Database error fetching unread notifications for user {user_id}: {str(db_error)}"
+            f"Database error fetching unread count for user {user_id}: {str(db_error)}"
         )
         return jsonify({"status": "error", "message": "Database error occurred"}), 500
 
@@ -112,10 +173,11 @@ def get_single_notification(user_id, notification_id):
 def mark_notification_as_read(notification_id):
     """Mark a single notification as read."""
     try:
-        notification = Notification.query.get(notification_id)
-        if notification:
-            notification.is_read = True
-            db.session.commit()
+        marked = mark_read(current_user.id, [notification_id])
+        db.session.commit()
+        if marked or Notification.query.filter_by(
+            user_id=current_user.id, id=notification_id
+        ).first():
             return (
                 jsonify(
                     {
@@ -142,10 +204,8 @@ def mark_all_notifications_as_read(user_id):
         return jsonify({"status": "error", "message": "Unauthorized access"}), 403
 
     try:
-        notifications = Notification.query.filter_by(
-            user_id=user_id, is_read=False
-        ).all()
-        if not notifications:
+        if not mark_read(user_id):
+            db.session.rollback()
             return (
                 jsonify(
                     {
@@ -156,8 +216,6 @@ def mark_all_notifications_as_read(user_id):
                 200,
             )
 
-        for notification in notifications:
-            notification.is_read = True
         db.session.commit()
         return (
             jsonify(
@@ -175,15 +233,51 @@ def mark_all_notifications_as_read(user_id):
         return jsonify({"status": "error", "message": "Database error occurred"}), 500
 
 
+# ✅ Mark a batch of notifications as read
+@notification_v1_blueprint.route("/read", methods=["PUT"])
+@login_required
+def mark_notifications_as_read():
+    """Mark the notifications listed in ``{"ids": [...]}`` as read."""
+    ids = _requested_ids()
+    if ids is None:
+        return (
+            jsonify(
+                {
+                    "status": "error",
+                    "message": f"ids must be a list of 1-{MAX_BULK_IDS} notification ids",
+                }
+            ),
+            400,
+        )
+
+    try:
+        marked = mark_read(current_user.id, ids)
+        db.session.commit()
+        return (
+            jsonify(
+                {
+                    "status": "success",
+                    "message": "Notifications marked as read.",
+                    "data": {"updated": marked},
+                }
+            ),
+            200,
+        )
+    except SQLAlchemyError as db_error:
+        db.session.rollback()
+        logger.error(
+            f"Database error marking notifications as read for user {current_user.id}: {str(db_error)}"
+        )
+        return jsonify({"status": "error", "message": "Database error occurred"}), 500
+
+
 # ✅ Delete a specific notification
 @notification_v1_blueprint.route("/delete/<int:notification_id>", methods=["DELETE"])
 @login_required
 def delete_notification(notification_id):
     """Delete a specific notification."""
     try:
-        notification = Notification.query.get(notification_id)
-        if notification:
-            db.session.delete(notification)
+        if delete_notifications(current_user.id, [notification_id]):
             db.session.commit()
             return (
                 jsonify(
@@ -211,8 +305,8 @@ def delete_all_notifications(user_id):
         return jsonify({"status": "error", "message": "Unauthorized access"}), 403
 
     try:
-        notifications = Notification.query.filter_by(user_id=user_id).all()
-        if not notifications:
+        if not delete_notifications(user_id):
+            db.session.rollback()
             return (
                 jsonify(
                     {
@@ -223,8 +317,6 @@ def delete_all_notifications(user_id):
                 200,
             )
 
-        for notification in notifications:
-            db.session.delete(notification)
         db.session.commit()
         return (
             jsonify(
@@ -240,3 +332,41 @@ def delete_all_notifications(user_id):
             f"Database error deleting all notifications for user {user_id}: {str(db_error)}"
         )
         return jsonify({"status": "error", "message": "Database error occurred"}), 500
+
+
+# ✅ Delete a batch of notifications
+@notification_v1_blueprint.route("/delete", methods=["DELETE"])
+@login_required
+def delete_notification_batch():
+    """Delete the notifications listed in ``{"ids": [...]}``."""
+    ids = _requested_ids()
+    if ids is None:
+        return (
+            jsonify(
+                {
+                    "status": "error",
+                    "message": f"ids must be a list of 1-{MAX_BULK_IDS} notification ids",
+                }
+            ),
+            400,
+        )
+
+    try:
+        deleted = delete_notifications(current_user.id, ids)
+        db.session.commit()
+        return (
+            jsonify(
+                {
+                    "status": "success",
+                    "message": "Notifications deleted successfully.",
+                    "data": {"deleted": deleted},
+                }
+            ),
+            200,
+        )
+    except SQLAlchemyError as db_error:
+        db.session.rollback()
+        logger.error(
+            f"Database error deleting notifications for user {current_user.id}: {str(db_error)}"
+        )
+        return jsonify({"status": "error", "message": "Database error occurred"}), 500
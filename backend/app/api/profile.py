@@ -11,7 +11,9 @@ from app.models import (
     Repost,
     UserDeletionLog,
 )
+from app.engagement_scores import record_engagement
 from app.location_service import format_post_location
+from app.user_cache import invalidate_user
 from io import BytesIO
 import base64
 from werkzeug.utils import secure_filename
@@ -95,8 +97,8 @@ def get_user_profile(username):
 
         user_relationships = {
             "total_posts": UserContent.query.filter_by(user_id=user.id).count(),
-            "followers": user.followers.count(),
-            "following": user.followed.count(),
+            "followers": user.followers_count,
+            "following": user.following_count,
         }
 
         # Check if the current user is following the profile user
@@ -326,6 +328,7 @@ def edit_profile_api():
     # Commit changes to database
     try:
         db.session.commit()
+        invalidate_user(current_user.id)
 
         # Construct the updated user response
         user_data = {
@@ -454,6 +457,7 @@ def delete_user():
         try:
             db.session.delete(user)
             db.session.commit()
+            invalidate_user(user.id)
 
             # Verify if deletion log still exists
             log_check = UserDeletionLog.query.filter_by(user_id=user.id).first()
@@ -504,6 +508,7 @@ def undo_repost(content_id):
             return jsonify(success="error", message="Repost not found", data=None), 404
 
         db.session.delete(repost)
+        record_engagement(content_id, reposts=-1)
         db.session.commit()
         return (
             jsonify(
@@ -9,9 +9,10 @@ from app.models import (
     News,
     CommentReaction,
     ReactionType,
-    Notification,
 )
+from app.notifications import create_notification
 from app.socket_events import send_notification  # Import WebSocket function
+from app.engagement_scores import content_counts, record_engagement
 import logging
 
 reaction_v1_blueprint = Blueprint(
@@ -59,10 +60,12 @@ def react_to_content(content_type, content_id):
             # If the reaction type is the same, remove the reaction (unreact)
             db.session.delete(reaction)
             message = "Reaction removed successfully"
+            reaction_delta = -1
         else:
             # If the reaction type is different, update the reaction type
             reaction.reaction_type = reaction_type
             message = "Reaction updated successfully"
+            reaction_delta = 0
     else:
         reaction = Reaction(
             user_id=current_user.id,
@@ -72,6 +75,11 @@ def react_to_content(content_type, content_id):
         )
         db.session.add(reaction)
         message = "Reaction added successfully"
+        reaction_delta = 1
+
+    # Keep the materialized feed score in step with the reaction count
+    if content_type == "user_content" and reaction_delta:
+        record_engagement(content.id, reactions=reaction_delta)
 
     try:
         db.session.commit()
@@ -82,14 +90,13 @@ def react_to_content(content_type, content_id):
 
     # ✅ **Send Notification to Content Owner**
     if content.user_id != current_user.id:  # Avoid notifying self-reactions
-        notification = Notification(
+        notification = create_notification(
             user_id=content.user_id,  # Content owner
             sender_id=current_user.id,  # User who reacted
             type="content_reaction",
             content=f"{current_user.username} reacted to your post.",
             post_id=content.id  # Add this line if post_id exists in the model
         )
-        db.session.add(notification)
         db.session.commit()
 
         # Convert notification to dict format
@@ -98,9 +105,12 @@ def react_to_content(content_type, content_id):
         # ✅ Emit WebSocket notification
         send_notification(content.user_id, notification_data)
 
-    total_reactions = Reaction.query.filter_by(
-        content_id=content_id, content_type=content_type
-    ).count()
+    if content_type == "user_content":
+        total_reactions = content_counts(content.id)["reactions"]
+    else:
+        total_reactions = Reaction.query.filter_by(
+            content_id=content_id, content_type=content_type
+        ).count()
 
     return jsonify(
         data={"user_reaction": reaction_type.value, "total_reactions": total_reactions},
@@ -212,13 +222,12 @@ def react_to_comment(content_id, comment_id):
             logger.info(f"Preparing to send notification for comment {comment_id}")
 
             # Create notification entry in the database
-            notification = Notification(
+            notification = create_notification(
                 user_id=comment.user_id,  # Comment owner
                 sender_id=current_user.id,  # User who reacted
                 type="comment_reaction",
                 content=f"{current_user.username} reacted to your comment.",
             )
-            db.session.add(notification)
             logger.info(
                 f"Notification created for comment owner {comment.user_id} by user {current_user.id}"
             )
@@ -8,6 +8,7 @@ from app.models import (
     GroupChatMember,
     GroupMessage,
 )
+from app.chat_inbox import record_direct_message
 from faker import Faker
 import random
 import logging
@@ -82,6 +83,7 @@ def create_direct_message(chat, sender):
             chat_id=chat.id, sender_id=sender.id, content=fake.text()
         )
         db.session.add(message)
+        record_direct_message(message)
         db.session.commit()
         logger.info(f"Message sent by {sender.username} in chat {chat.id}")
     except Exception as e:
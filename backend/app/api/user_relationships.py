@@ -1,7 +1,10 @@
 from flask import Blueprint, jsonify, request
 from flask_login import current_user, login_required
-from app.models import User, db, Follow, Notification
+from app.models import User, db, Follow
+from app.counters import record_follow
+from app.notifications import create_notification
 from app.socket_events import send_notification
+from app.user_cache import invalidate_user
 
 # Create the user relationships blueprint
 user_relationships_v1_blueprint = Blueprint(
@@ -28,16 +31,17 @@ def follow_user(user_id):
 
     # Follow the user
     current_user.follow(user)
+    record_follow(current_user.id, user.id)
     db.session.commit()
+    invalidate_user(current_user.id, user.id)
 
     # Create a notification for the followed user
-    notification = Notification(
+    notification = create_notification(
         user_id=user.id,
         sender_id=current_user.id,
         type="follow",
         content=f"{current_user.username} started following you.",
     )
-    db.session.add(notification)
     db.session.commit()
 
     # Convert notification to dict format
@@ -68,7 +72,9 @@ def unfollow_user(user_id):
 
     # Unfollow the user
     current_user.unfollow(user)
+    record_follow(current_user.id, user.id, -1)
     db.session.commit()
+    invalidate_user(current_user.id, user.id)
     # Return a success response
     return jsonify(status="success", message="User unfollowed successfully")
 
@@ -157,6 +163,7 @@ def block_user(user_id):
 
     current_user.block(user)
     db.session.commit()
+    invalidate_user(current_user.id, user.id)
     return jsonify(status="success", message="User blocked successfully")
 
 
@@ -173,4 +180,5 @@ def unblock_user(user_id):
 
     current_user.unblock(user)
     db.session.commit()
+    invalidate_user(current_user.id, user.id)
     return jsonify(status="success", message="User unblocked successfully")
@@ -1,6 +1,6 @@
 from flask import Blueprint, jsonify, request
 from flask_login import current_user
-from app.models import User, Follow, SearchHistory, Block
+from app.models import User, SearchHistory, Block
 from app import db
 from sqlalchemy import or_, func
 
@@ -53,7 +53,7 @@ def search_users():
                 "last_name": user.last_name,
                 "profile_picture_url": user.profile_picture_url,
                 "location": user.location,
-                "total_followers": db.session.query(Follow).filter_by(followed_id=user.id).count(),
+                "total_followers": user.followers_count,
             }
             for user in paginated.items
         ]
@@ -1,6 +1,7 @@
 from flask import Blueprint, request, jsonify, current_app, render_template
 from app.extensions import db
 from app.models import WaitlistSignup, User
+from app.user_cache import invalidate_user
 from app.utils import (
     is_valid_rfc_email,
     is_valid_e164_phone,
@@ -221,6 +222,8 @@ def delete_user():
 
         # Commit the changes
         db.session.commit()
+        if user_entry:
+            invalidate_user(user_entry.id)
 
         return jsonify(
             success="success",
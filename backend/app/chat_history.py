@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select, tuple_
+
+from app.extensions import db
+from app.models import User
+from app.pagination import InvalidCursor, fetch_keyset_page
+
+
+def parse_message_id(value: Optional[str]) -> Optional[int]:
+    """Parse a ``before``/``after`` message id; empty means "from the newest/oldest"."""
+
+    if not value:
+        return None
+    try:
+        message_id = int(value)
+    except ValueError as exc:
+        raise InvalidCursor("Message cursor must be a message id") from exc
+    if message_id < 1:
+        raise InvalidCursor("Message cursor must be a message id")
+    return message_id
+
+
+def fetch_history(
+    model,
+    chat_column,
+    chat_id: int,
+    limit: int,
+    anchor_id: Optional[int] = None,
+    direction: str = "before",
+) -> Tuple[list, bool]:
+    """Return ``(messages, has_more)`` for one page of a chat's history.
+
+    ``before`` pages back from ``anchor_id`` (or the newest message), newest
+    first. ``after`` returns the messages sent after ``anchor_id`` (or from
+    the start), oldest first, so a client can sync by passing the last id it
+    has. Rows are found by seeking the ``(chat, created_at, id)`` index, so
+    deep pages cost the same as the first. Raises ``InvalidCursor`` when the
+    anchor is not a message of this chat.
+    """
+
+    anchor = None
+    if anchor_id is not None:
+        anchor = db.session.execute(
+            select(model.created_at, model.id).where(model.id == anchor_id, chat_column == chat_id)
+        ).first()
+        if anchor is None:
+            raise InvalidCursor("Message cursor does not belong to this chat")
+
+    query = model.query.filter(chat_column == chat_id)
+    key = (model.created_at, model.id)
+    if direction == "before":
+        return fetch_keyset_page(query, key, tuple(anchor) if anchor else None, limit)
+
+    if anchor is not None:
+        query = query.filter(tuple_(*key) > tuple_(*anchor))
+    rows = query.order_by(*[column.asc() for column in key]).limit(limit + 1).all()
+    return rows[:limit], len(rows) > limit
+
+
+def history_request(args) -> Tuple[Optional[str], Optional[int]]:
+    """Read ``before``/``after`` from query args as ``(direction, anchor_id)``.
+
+    ``direction`` is ``None`` when neither is given (legacy page mode).
+    """
+
+    if "before" in args and "after" in args:
+        raise InvalidCursor("Pass either before or after, not both")
+    for direction in ("before", "after"):
+        if direction in args:
+            return direction, parse_message_id(args.get(direction))
+    return None, None
+
+
+def serialize_messages(messages: Sequence) -> List[Dict]:
+    """``to_dict`` every message, loading all senders with one query."""
+
+    sender_ids = {message.sender_id for message in messages}
+    senders = {}
+    if sender_ids:
+        senders = {user.id: user for user in User.query.filter(User.id.in_(sender_ids))}
+    return [message.to_dict(sender=senders.get(message.sender_id)) for message in messages]
+
+
+def history_pagination(messages: Sequence, has_more: bool, limit: int, direction: str) -> Dict:
+    """Pagination block for ``before``/``after`` mode; send ``next_cursor`` back as ``direction``."""
+
+    return {
+        "mode": "cursor",
+        "direction": direction,
+        "per_page": limit,
+        "has_more": has_more,
+        "next_cursor": messages[-1].id if messages and has_more else None,
+    }
+
+
+__all__ = [
+    "fetch_history",
+    "history_pagination",
+    "history_request",
+    "parse_message_id",
+    "serialize_messages",
+]
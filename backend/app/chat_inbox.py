@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from sqlalchemy import case, literal, null, or_, select, update
+from sqlalchemy.orm import aliased
+
+from app.extensions import db
+from app.models import DirectChat, DirectMessage, GroupChat, GroupChatMember, GroupMessage, User
+
+
+def _record(chat_model, chat_id: int, message) -> None:
+    if message.id is None:
+        db.session.flush()
+    db.session.execute(
+        update(chat_model)
+        .where(
+            chat_model.id == chat_id,
+            # A slower concurrent send must not move the pointer backwards
+            or_(chat_model.last_message_at.is_(None), chat_model.last_message_at <= message.created_at),
+        )
+        .values(last_message_id=message.id, last_message_at=message.created_at),
+        execution_options={"synchronize_session": False},
+    )
+
+
+def _refresh(chat_model, message_model, chat_column, chat_id: int) -> None:
+    latest = db.session.execute(
+        select(message_model.id, message_model.created_at)
+        .where(chat_column == chat_id)
+        .order_by(message_model.created_at.desc(), message_model.id.desc())
+        .limit(1)
+    ).first()
+    db.session.execute(
+        update(chat_model)
+        .where(chat_model.id == chat_id)
+        .values(
+            last_message_id=latest.id if latest else None,
+            last_message_at=latest.created_at if latest else None,
+        ),
+        execution_options={"synchronize_session": False},
+    )
+
+
+def record_direct_message(message: DirectMessage) -> None:
+    """Point the message's chat at it; the caller commits both together."""
+
+    _record(DirectChat, message.chat_id, message)
+
+
+def record_group_message(message: GroupMessage) -> None:
+    """Point the message's group at it; the caller commits both together."""
+
+    _record(GroupChat, message.group_chat_id, message)
+
+
+def refresh_direct_chat(chat_id: int) -> None:
+    """Recompute a chat's last message, e.g. after one was deleted (flushed)."""
+
+    _refresh(DirectChat, DirectMessage, DirectMessage.chat_id, chat_id)
+
+
+def refresh_group_chat(group_chat_id: int) -> None:
+    """Recompute a group's last message, e.g. after one was deleted (flushed)."""
+
+    _refresh(GroupChat, GroupMessage, GroupMessage.group_chat_id, group_chat_id)
+
+
+def direct_inbox_query(user_id: int):
+    """``(DirectChat, DirectMessage)`` rows for ``user_id``'s chats that have messages.
+
+    Chats come from the ``(user1_id|user2_id, last_message_at, id)`` indexes
+    and the newest message is a primary-key join, so the cost depends on the
+    number of chats, not on how many messages they hold. Order by
+    ``DirectChat.last_message_at, DirectChat.id`` (descending) to page.
+    """
+
+    return (
+        db.session.query(DirectChat, DirectMessage)
+        .join(DirectMessage, DirectMessage.id == DirectChat.last_message_id)
+        .filter(or_(DirectChat.user1_id == user_id, DirectChat.user2_id == user_id))
+        .options(
+            db.joinedload(DirectChat.user1),
+            db.joinedload(DirectChat.user2),
+            db.joinedload(DirectMessage.sender),
+        )
+    )
+
+
+def combined_inbox_query(user_id: int):
+    """Direct and group chats of ``user_id`` with their newest message, as one subquery.
+
+    Columns match the chat list payload; page on ``(last_message_at,
+    chat_type, chat_id)`` descending, since direct and group ids overlap.
+    """
+
+    receiver = aliased(User)
+    direct = (
+        db.session.query(
+            DirectChat.id.label("chat_id"),
+            DirectChat.last_message_at.label("last_message_at"),
+            DirectMessage.content.label("content"),
+            DirectMessage.sender_id.label("sender_id"),
+            receiver.id.label("receiver_id"),
+            receiver.first_name.label("receiver_first_name"),
+            receiver.last_name.label("receiver_last_name"),
+            receiver.username.label("receiver_username"),
+            receiver.email.label("receiver_email"),
+            receiver.profile_picture_url.label("receiver_profile_picture_url"),
+            literal("direct").label("chat_type"),
+            null().label("group_name"),
+        )
+        .join(DirectMessage, DirectMessage.id == DirectChat.last_message_id)
+        .join(
+            receiver,
+            receiver.id
+            == case((DirectChat.user1_id == user_id, DirectChat.user2_id), else_=DirectChat.user1_id),
+        )
+        .filter(or_(DirectChat.user1_id == user_id, DirectChat.user2_id == user_id))
+    )
+    group = (
+        db.session.query(
+            GroupChat.id.label("chat_id"),
+            GroupChat.last_message_at.label("last_message_at"),
+            GroupMessage.content.label("content"),
+            GroupMessage.sender_id.label("sender_id"),
+            null().label("receiver_id"),
+            null().label("receiver_first_name"),
+            null().label("receiver_last_name"),
+            null().label("receiver_username"),
+            null().label("receiver_email"),
+            null().label("receiver_profile_picture_url"),
+            literal("group").label("chat_type"),
+            GroupChat.name.label("group_name"),
+        )
+        .join(GroupChatMember, GroupChatMember.group_chat_id == GroupChat.id)
+        .join(GroupMessage, GroupMessage.id == GroupChat.last_message_id)
+        .filter(GroupChatMember.user_id == user_id)
+    )
+    return direct.union_all(group).subquery("combined_chats")
+
+
+__all__ = [
+    "combined_inbox_query",
+    "direct_inbox_query",
+    "record_direct_message",
+    "record_group_message",
+    "refresh_direct_chat",
+    "refresh_group_chat",
+]
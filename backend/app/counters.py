@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from typing import Dict
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import aliased
+
+from app.engagement_scores import repair_content_scores
+from app.extensions import db
+from app.models import Comment, Follow, Notification, User
+from app.user_cache import ALL_USERS, invalidate_after_commit
+
+
+def record_follow(follower_id: int, followed_id: int, delta: int = 1) -> None:
+    """Apply a follow (``delta=1``) or unfollow (``delta=-1``) to both users' counters.
+
+    Like ``record_engagement``, the counters are incremented in place and the
+    caller commits them together with the Follow row it added or deleted.
+    """
+
+    db.session.execute(
+        update(User)
+        .where(User.id == follower_id)
+        .values(following_count=User.following_count + delta)
+    )
+    db.session.execute(
+        update(User)
+        .where(User.id == followed_id)
+        .values(followers_count=User.followers_count + delta)
+    )
+    invalidate_after_commit(follower_id, followed_id)
+
+
+def record_reply(parent_id: int, delta: int = 1) -> None:
+    """Apply a reply added to (or removed from) ``parent_id`` to its ``replies_count``."""
+
+    db.session.execute(
+        update(Comment)
+        .where(Comment.id == parent_id)
+        .values(replies_count=Comment.replies_count + delta)
+    )
+
+
+def _repair(model, column, actual) -> int:
+    """Set ``column`` to ``actual`` on rows where they differ; returns rows fixed."""
+
+    result = db.session.execute(
+        update(model).where(column != actual).values({column.key: actual}),
+        execution_options={"synchronize_session": False},
+    )
+    return result.rowcount
+
+
+def reconcile_counters() -> Dict[str, int]:
+    """Recount every denormalized counter from its source table and fix drift.
+
+    Covers follower/following counts, unread notification counts, comment
+    reply counts and the per-post counters in ``content_scores``. Counters
+    only drift when rows are written around the endpoints (bulk deletes,
+    scripts, manual fixes); the periodic task reports how many rows it had
+    to repair.
+    """
+
+    replies = aliased(Comment)
+    repaired = {
+        "followers": _repair(
+            User,
+            User.followers_count,
+            select(func.count()).where(Follow.followed_id == User.id).scalar_subquery(),
+        ),
+        "following": _repair(
+            User,
+            User.following_count,
+            select(func.count()).where(Follow.follower_id == User.id).scalar_subquery(),
+        ),
+        "unread_notifications": _repair(
+            User,
+            User.unread_notifications_count,
+            select(func.count())
+            .where(Notification.user_id == User.id, Notification.is_read == False)
+            .scalar_subquery(),
+        ),
+        "replies": _repair(
+            Comment,
+            Comment.replies_count,
+            select(func.count()).select_from(replies).where(replies.parent_id == Comment.id).scalar_subquery(),
+        ),
+    }
+    if repaired["followers"] or repaired["following"] or repaired["unread_notifications"]:
+        invalidate_after_commit(ALL_USERS)
+    db.session.commit()
+
+    repaired["content_scores"] = repair_content_scores()
+    db.session.commit()
+    return repaired
+
+
+__all__ = [
+    "reconcile_counters",
+    "record_follow",
+    "record_reply",
+]
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from typing import Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import NullPool, Pool, QueuePool
+
+from config import (
+    DB_MAX_OVERFLOW,
+    DB_PGBOUNCER,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+)
+
+
+class PoolMetrics:
+    """Checkout counters for one connection pool, safe to update from any thread."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.in_use = 0
+        self.peak_in_use = 0
+
+    def checked_out(self) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+
+    def waited(self, seconds: float) -> None:
+        with self._lock:
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def timed_out(self, waited: float) -> None:
+        with self._lock:
+            self.timeouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def checked_in(self) -> None:
+        with self._lock:
+            self.in_use = max(self.in_use - 1, 0)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "in_use": self.in_use,
+                "peak_in_use": self.peak_in_use,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+                "wait_seconds_avg": round(self.wait_seconds_total / self.checkouts, 6) if self.checkouts else 0.0,
+            }
+
+
+# Metrics of each instrumented engine
+_metrics: "weakref.WeakKeyDictionary[Engine, PoolMetrics]" = weakref.WeakKeyDictionary()
+
+
+def _time_checkouts(pool: Pool, metrics: PoolMetrics) -> None:
+    """Time how long ``pool.connect()`` waits for a free connection."""
+
+    connect = pool.connect
+
+    def timed_connect():
+        started = time.perf_counter()
+        try:
+            connection = connect()
+        except PoolTimeoutError:
+            metrics.timed_out(time.perf_counter() - started)
+            raise
+        metrics.waited(time.perf_counter() - started)
+        return connection
+
+    pool.connect = timed_connect
+
+
+def instrument_engine(engine: Engine) -> PoolMetrics:
+    """Record checkouts, connections in use and checkout waits for ``engine``.
+
+    Counts come from the pool's ``checkout``/``checkin`` events, which are
+    registered on the engine and so carry over when ``dispose()`` recreates
+    the pool; the wait timing is re-applied to each new pool. Calling it
+    again returns the existing metrics.
+    """
+
+    metrics = _metrics.get(engine)
+    if metrics is not None:
+        return metrics
+    metrics = _metrics[engine] = PoolMetrics()
+
+    event.listen(engine, "checkout", lambda *args: metrics.checked_out())
+    event.listen(engine, "checkin", lambda *args: metrics.checked_in())
+    event.listen(engine, "engine_disposed", lambda engine: _time_checkouts(engine.pool, metrics))
+    _time_checkouts(engine.pool, metrics)
+    return metrics
+
+
+def engine_options(db_url: str) -> Dict:
+    """``SQLALCHEMY_ENGINE_OPTIONS`` for the process-wide engine.
+
+    SQLite keeps Flask-SQLAlchemy's defaults. With ``DB_PGBOUNCER`` the app
+    opens a connection per checkout and leaves pooling to PgBouncer;
+    psycopg2 never uses server-side prepared statements, so nothing else
+    has to change for transaction pooling.
+    """
+    if make_url(db_url).get_backend_name() == "sqlite":
+        return {}
+    if DB_PGBOUNCER:
+        return {"poolclass": NullPool}
+    return {
+        "poolclass": QueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+
+def pool_metrics(engine: Engine) -> Dict:
+    """Current pool state plus the checkout counters, for the metrics endpoint."""
+    pool = engine.pool
+    stats = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+        )
+    metrics = _metrics.get(engine)
+    if metrics is not None:
+        stats.update(metrics.snapshot())
+    return stats
+
+
+__all__ = [
+    "PoolMetrics",
+    "engine_options",
+    "instrument_engine",
+    "pool_metrics",
+]
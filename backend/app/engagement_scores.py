@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+from datetime import datetime
+from math import exp
+from typing import Dict, Optional
+
+from sqlalchemy import func, or_, select, update
+
+from app.extensions import db
+from app.models import Comment, ContentScore, Reaction, Repost, Share, UserContent
+
+# Weights for the different engagement signals that make up a post's score.
+SCORE_WEIGHTS = {
+    "reaction_weight": 2,
+    "comment_weight": 3,
+    "share_weight": 5,
+}
+
+# Scores decay by a factor of ``e`` for every day a post has been live.
+DECAY_SECONDS = 86400
+
+DECAY_BATCH_SIZE = 1000
+
+
+def weighted_score(reactions: int, comments: int, shares: int) -> float:
+    """Return the undecayed engagement score for the given counts."""
+
+    return float(
+        SCORE_WEIGHTS["reaction_weight"] * reactions
+        + SCORE_WEIGHTS["comment_weight"] * comments
+        + SCORE_WEIGHTS["share_weight"] * shares
+    )
+
+
+def decay_factor(created_at: Optional[datetime], now: Optional[datetime] = None) -> float:
+    """Return the multiplicative time decay for a post created at ``created_at``."""
+
+    if created_at is None:
+        return 0.0
+
+    now = now or datetime.utcnow()
+    age_seconds = (now - created_at).total_seconds()
+    return exp(-(age_seconds / DECAY_SECONDS))
+
+
+def record_engagement(
+    content_id: int,
+    reactions: int = 0,
+    comments: int = 0,
+    shares: int = 0,
+    now: Optional[datetime] = None,
+    reposts: int = 0,
+) -> None:
+    """Apply engagement deltas to a post's materialized score.
+
+    The counters are incremented in a single ``UPDATE`` so concurrent writers
+    never lose each other's deltas. The caller owns the transaction and is
+    expected to commit alongside the reaction/comment/share it just wrote.
+    Reposts are counted for display but don't contribute to the score.
+    """
+
+    if not (reactions or comments or shares or reposts):
+        return
+
+    row = (
+        db.session.query(ContentScore.content_created_at)
+        .filter(ContentScore.content_id == content_id)
+        .first()
+    )
+    if row is None:
+        # Posts created before the score table existed: rebuild from the source
+        # tables, which already include the write being recorded.
+        rebuild_content_scores([content_id], now=now)
+        return
+
+    created_at = row.content_created_at
+    delta = weighted_score(reactions, comments, shares)
+    factor = decay_factor(created_at, now)
+
+    db.session.execute(
+        update(ContentScore)
+        .where(ContentScore.content_id == content_id)
+        .values(
+            reactions_count=ContentScore.reactions_count + reactions,
+            comments_count=ContentScore.comments_count + comments,
+            shares_count=ContentScore.shares_count + shares,
+            reposts_count=ContentScore.reposts_count + reposts,
+            raw_score=ContentScore.raw_score + delta,
+            score=(ContentScore.raw_score + delta) * factor,
+            updated_at=datetime.utcnow(),
+        )
+    )
+
+
+def _count_by_content(column, content_ids):
+    query = db.session.query(column, func.count()).group_by(column)
+    if content_ids is not None:
+        query = query.filter(column.in_(content_ids))
+    return dict(query.all())
+
+
+def rebuild_content_scores(content_ids=None, now: Optional[datetime] = None) -> int:
+    """Recompute score rows from the Reaction, Comment, Share and Repost tables.
+
+    Used to backfill posts that predate the score table and to repair any
+    drift in the incrementally maintained counters. Pass ``content_ids`` to
+    limit the rebuild to specific posts. Returns the number of rows written.
+    """
+
+    now = now or datetime.utcnow()
+
+    posts = db.session.query(UserContent.id, UserContent.created_at)
+    if content_ids is not None:
+        content_ids = list(content_ids)
+        if not content_ids:
+            return 0
+        posts = posts.filter(UserContent.id.in_(content_ids))
+    posts = posts.all()
+
+    reactions = _count_by_content(Reaction.content_id, content_ids)
+    comments = _count_by_content(Comment.content_id, content_ids)
+    shares = _count_by_content(Share.content_id, content_ids)
+    reposts = _count_by_content(Repost.content_id, content_ids)
+
+    existing_query = db.session.query(ContentScore.content_id)
+    if content_ids is not None:
+        existing_query = existing_query.filter(ContentScore.content_id.in_(content_ids))
+    existing = {content_id for (content_id,) in existing_query}
+
+    inserts, updates = [], []
+    for post_id, created_at in posts:
+        raw = weighted_score(
+            reactions.get(post_id, 0), comments.get(post_id, 0), shares.get(post_id, 0)
+        )
+        row = {
+            "content_id": post_id,
+            "reactions_count": reactions.get(post_id, 0),
+            "comments_count": comments.get(post_id, 0),
+            "shares_count": shares.get(post_id, 0),
+            "reposts_count": reposts.get(post_id, 0),
+            "raw_score": raw,
+            "score": raw * decay_factor(created_at, now),
+            "content_created_at": created_at,
+            "updated_at": now,
+        }
+        (updates if post_id in existing else inserts).append(row)
+
+    if inserts:
+        db.session.execute(ContentScore.__table__.insert(), inserts)
+    if updates:
+        db.session.execute(update(ContentScore), updates)
+
+    return len(inserts) + len(updates)
+
+
+def repair_content_scores(now: Optional[datetime] = None) -> int:
+    """Fix score rows whose counters drifted from the source tables.
+
+    One set-based ``UPDATE`` recounts every row but only writes the ones
+    that differ; their decayed scores are then recomputed, and posts with no
+    score row are rebuilt. Returns the number of rows repaired.
+    """
+
+    now = now or datetime.utcnow()
+    counts = {
+        "reactions_count": select(func.count()).where(Reaction.content_id == ContentScore.content_id),
+        "comments_count": select(func.count()).where(Comment.content_id == ContentScore.content_id),
+        "shares_count": select(func.count()).where(Share.content_id == ContentScore.content_id),
+        "reposts_count": select(func.count()).where(Repost.content_id == ContentScore.content_id),
+    }
+    counts = {column: query.scalar_subquery() for column, query in counts.items()}
+    raw_score = (
+        SCORE_WEIGHTS["reaction_weight"] * counts["reactions_count"]
+        + SCORE_WEIGHTS["comment_weight"] * counts["comments_count"]
+        + SCORE_WEIGHTS["share_weight"] * counts["shares_count"]
+    )
+
+    repaired = db.session.execute(
+        update(ContentScore)
+        .where(or_(*(getattr(ContentScore, column) != actual for column, actual in counts.items())))
+        .values(raw_score=raw_score, updated_at=now, **counts)
+        .returning(ContentScore.content_id, ContentScore.raw_score, ContentScore.content_created_at),
+        execution_options={"synchronize_session": False},
+    ).all()
+    if repaired:
+        db.session.execute(
+            update(ContentScore),
+            [
+                {"content_id": content_id, "score": raw * decay_factor(created_at, now)}
+                for content_id, raw, created_at in repaired
+            ],
+        )
+
+    missing = db.session.execute(
+        select(UserContent.id).where(
+            ~select(ContentScore.content_id).where(ContentScore.content_id == UserContent.id).exists()
+        )
+    ).scalars().all()
+    return len(repaired) + rebuild_content_scores(missing, now=now)
+
+
+def content_counts(content_id: int) -> Dict[str, int]:
+    """Return a post's reaction/comment/share/repost totals from its score row.
+
+    A single primary-key lookup instead of a ``COUNT`` per source table;
+    posts without a score row report zeros.
+    """
+
+    row = db.session.get(ContentScore, content_id)
+    return {
+        "reactions": row.reactions_count if row else 0,
+        "comments": row.comments_count if row else 0,
+        "shares": row.shares_count if row else 0,
+        "reposts": row.reposts_count if row else 0,
+    }
+
+
+def decay_content_scores(
+    now: Optional[datetime] = None, batch_size: int = DECAY_BATCH_SIZE
+) -> int:
+    """Re-apply time decay to every post that has engagement.
+
+    Posts without engagement keep a score of zero and are skipped, so the
+    cost of this job follows the number of engaged posts, not all posts.
+    Returns the number of rows updated.
+    """
+
+    now = now or datetime.utcnow()
+    updated = 0
+    last_id = 0
+
+    while True:
+        rows = (
+            db.session.query(
+                ContentScore.content_id,
+                ContentScore.raw_score,
+                ContentScore.content_created_at,
+            )
+            .filter(ContentScore.raw_score > 0, ContentScore.content_id > last_id)
+            .order_by(ContentScore.content_id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            break
+
+        db.session.execute(
+            update(ContentScore),
+            [
+                {
+                    "content_id": content_id,
+                    "score": raw_score * decay_factor(created_at, now),
+                }
+                for content_id, raw_score, created_at in rows
+            ],
+        )
+        db.session.commit()
+
+        updated += len(rows)
+        last_id = rows[-1].content_id
+
+    return updated
+
+
+__all__ = [
+    "DECAY_SECONDS",
+    "SCORE_WEIGHTS",
+    "content_counts",
+    "decay_content_scores",
+    "decay_factor",
+    "rebuild_content_scores",
+    "record_engagement",
+    "repair_content_scores",
+    "weighted_score",
+]
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import func
+
+from app.extensions import db
+from app.models import Comment, Reaction, ReactionType, Repost
+
+# Ties in the top-reactions list are broken by enum declaration order, which
+# is also how PostgreSQL sorts the ``reactiontype`` enum.
+_REACTION_ORDER = {reaction_type: index for index, reaction_type in enumerate(ReactionType)}
+
+TOP_REACTIONS_LIMIT = 2
+
+
+@dataclass
+class FeedHydration:
+    """Per-page engagement data keyed by content id."""
+
+    reactions_count: Dict[int, int] = field(default_factory=dict)
+    comments_count: Dict[int, int] = field(default_factory=dict)
+    top_reactions: Dict[int, List[str]] = field(default_factory=dict)
+    viewer_reactions: Dict[int, Reaction] = field(default_factory=dict)
+    viewer_reposts: Set[int] = field(default_factory=set)
+
+    def counts_for(self, item: Any) -> tuple[int, int]:
+        """Return ``(reactions_count, comments_count)`` for a feed item.
+
+        Seeded posts keep reporting their seeded counters, matching the
+        behaviour of the feeds before hydration was batched.
+        """
+
+        if getattr(item, "is_seeded", False):
+            return item.seeded_likes_count, item.seeded_comments_count
+        return (
+            self.reactions_count.get(item.id, 0),
+            self.comments_count.get(item.id, 0),
+        )
+
+    def viewer_fields(self, content_id: int) -> Dict[str, Any]:
+        """Return the viewer-specific flags serialized on each feed item."""
+
+        reaction = self.viewer_reactions.get(content_id)
+        return {
+            "user_has_reacted": reaction is not None,
+            "user_reaction_type": reaction.reaction_type.value if reaction else None,
+            "has_user_reposted": content_id in self.viewer_reposts,
+        }
+
+
+def hydrate_feed(content_ids: Iterable[int], viewer_id: Optional[int] = None) -> FeedHydration:
+    """Load counts, top reactions and viewer flags for a page of content.
+
+    Runs a fixed number of set-based queries regardless of page size: one
+    GROUP BY over reactions (which yields both totals and the top reactions),
+    one GROUP BY over comments and, for authenticated viewers, one lookup each
+    for the viewer's reactions and reposts restricted to ``content_ids``.
+    """
+
+    content_ids = list(dict.fromkeys(content_ids))
+    hydration = FeedHydration()
+    if not content_ids:
+        return hydration
+
+    reaction_rows = (
+        db.session.query(Reaction.content_id, Reaction.reaction_type, func.count(Reaction.id))
+        .filter(Reaction.content_id.in_(content_ids))
+        .group_by(Reaction.content_id, Reaction.reaction_type)
+        .all()
+    )
+    by_content: Dict[int, List[tuple]] = {}
+    for content_id, reaction_type, count in reaction_rows:
+        by_content.setdefault(content_id, []).append((reaction_type, count))
+        hydration.reactions_count[content_id] = (
+            hydration.reactions_count.get(content_id, 0) + count
+        )
+    for content_id, breakdown in by_content.items():
+        breakdown.sort(key=lambda row: (-row[1], _REACTION_ORDER[row[0]]))
+        hydration.top_reactions[content_id] = [
+            reaction_type.value for reaction_type, _ in breakdown[:TOP_REACTIONS_LIMIT]
+        ]
+
+    hydration.comments_count = dict(
+        db.session.query(Comment.content_id, func.count(Comment.id))
+        .filter(Comment.content_id.in_(content_ids))
+        .group_by(Comment.content_id)
+        .all()
+    )
+
+    if viewer_id is not None:
+        hydration.viewer_reactions = {
+            reaction.content_id: reaction
+            for reaction in db.session.query(Reaction).filter(
+                Reaction.user_id == viewer_id,
+                Reaction.content_id.in_(content_ids),
+            )
+        }
+        hydration.viewer_reposts = {
+            content_id
+            for (content_id,) in db.session.query(Repost.content_id).filter(
+                Repost.user_id == viewer_id,
+                Repost.content_id.in_(content_ids),
+            )
+        }
+
+    return hydration
+
+
+__all__ = [
+    "FeedHydration",
+    "TOP_REACTIONS_LIMIT",
+    "hydrate_feed",
+]
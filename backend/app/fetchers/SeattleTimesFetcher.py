@@ -24,19 +24,33 @@ class SeattleTimesFetcher(DataFetcher):
             "profile_picture": "https://avatar.iran.liara.run/username?username=SeattleTimes"
         }
 
+    def _anchors(self, response):
+        """Up to 5 story links from the Local News block, or None if it is missing."""
+        soup = BeautifulSoup(response.content, "html.parser")
+        block = soup.select_one("div.storyBlock.Local-News")
+        if not block:
+            return None
+        return block.select("ul.jVUVllsLYRVpiPaEcmvR li a.NZUc3l6EBaSxtympQiak")[:5]
+
+    def _link(self, href):
+        return href if href.startswith("http") else urljoin(self.BASE_URL, href)
+
+    def detail_links(self, response):
+        return [
+            self._link(a.get("href", ""))
+            for a in self._anchors(response) or []
+            if a.select_one("span[data-mrf-layout-title]")
+        ]
+
     def parse_data(self, response):
         logger.info(f"{log_prefix} Parsing HTML response...")
-        soup = BeautifulSoup(response.content, "html.parser")
         parsed = []
 
-        # 1) Locate the Local News block
-        block = soup.select_one("div.storyBlock.Local-News")
-        if not block:
+        # 1) Locate the Local News block and grab up to 5 story links
+        anchors = self._anchors(response)
+        if anchors is None:
             logger.warning(f"{log_prefix} Couldn't find Local-News block")
             return parsed
-
-        # 2) Grab up to 5 story links
-        anchors = block.select("ul.jVUVllsLYRVpiPaEcmvR li a.NZUc3l6EBaSxtympQiak")[:5]
         logger.info(f"{log_prefix} Found {len(anchors)} Local News links")
 
         for i, a in enumerate(anchors, 1):
@@ -50,7 +64,7 @@ class SeattleTimesFetcher(DataFetcher):
 
                 # — link (absolute)
                 href = a.get("href", "")
-                link = href if href.startswith("http") else urljoin(self.BASE_URL, href)
+                link = self._link(href)
 
                 # — image
                 img_tag = a.select_one("img[src]")
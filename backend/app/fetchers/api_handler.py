@@ -1,5 +1,13 @@
-import requests 
+import logging
+import os
+import tempfile
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import config as config
+from app.geocode_cache import build_store
 import time
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -13,29 +21,134 @@ from selenium.webdriver.support.ui import Select
 from selenium.common.exceptions import TimeoutException
 from selenium import webdriver
 
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# Validators for a page that stops changing are kept this long
+VALIDATOR_TTL_SECONDS = 14 * 86400
+DEFAULT_VALIDATOR_PATH = os.path.join(tempfile.gettempdir(), "seattlepulse_http_validators.sqlite3")
+
+_session = None
+_validators = None
+_shared_lock = threading.Lock()
+
+
+def get_session():
+    """Process-wide keep-alive session with retry/backoff on transient errors."""
+    global _session
+    with _shared_lock:
+        if _session is None:
+            retry = Retry(
+                total=config.NEWS_HTTP_RETRIES,
+                backoff_factor=config.NEWS_HTTP_BACKOFF_SECONDS,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["GET", "HEAD"]),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=max(config.NEWS_FETCH_MAX_WORKERS, 10),
+                max_retries=retry,
+            )
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers["User-Agent"] = USER_AGENT
+            _session = session
+        return _session
+
+
+def _validator_store():
+    global _validators
+    with _shared_lock:
+        if _validators is None:
+            _validators = build_store(
+                config.NEWS_HTTP_VALIDATOR_CACHE_URL, DEFAULT_VALIDATOR_PATH, prefix="http-validators:"
+            )
+        return _validators
+
+
+def is_not_modified(response):
+    """True for a 304 from a conditional request: the page has not changed."""
+    return response is not None and getattr(response, "status_code", None) == 304
+
+
 class APIHandler:
-    def get_news_data(self, source):
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
-        response = self.send_request(source, headers=headers)
-        with open('/tmp/api_response.txt', 'w', encoding='utf-8') as file:
-            file.write(response.text)
-        if response:
-            return response
-        else:
-            return None  
-    
-    def send_request(self, url, params=None, headers=None):
+    def __init__(self, session=None, validators=None):
+        self.session = session or get_session()
+        self.validators = validators if validators is not None else _validator_store()
+
+    def get_news_data(self, source, conditional=False):
+        headers = {"User-Agent": USER_AGENT}
+        response = self.send_request(source, headers=headers, conditional=conditional)
+        if response is not None and config.NEWS_DEBUG_DUMP:
+            with open('/tmp/api_response.txt', 'w', encoding='utf-8') as file:
+                file.write(response.text)
+        return response
+
+    def get_if_modified(self, source):
+        """Fetch a homepage, returning a 304 response if it has not changed
+        since the last ``remember_validators`` call for it."""
+        return self.get_news_data(source, conditional=True)
+
+    def send_request(self, url, params=None, headers=None, conditional=False):
+        headers = dict(headers or {})
+        if conditional:
+            headers.update(self._conditional_headers(url))
         try:
-            response = requests.get(url, params=params, headers=headers)
-            if response.status_code == 200:
-                return response
-            else:
-                # Log error here
-                print(f"Failed to retrieve data. Status code: {response.status_code}")
-                return None
+            response = self.session.get(
+                url,
+                params=params,
+                headers=headers,
+                timeout=(config.NEWS_HTTP_CONNECT_TIMEOUT, config.NEWS_HTTP_READ_TIMEOUT),
+            )
         except requests.RequestException as e:
-            # Log exception here
-            print(f"Request failed: {e}")
-            return None
\ No newline at end of file
+            logger.warning(f"[APIHandler] Request to {url} failed: {e}")
+            return None
+
+        if response.status_code == 304 and conditional:
+            logger.info(f"[APIHandler] {url} not modified since last fetch")
+            return response
+        if response.status_code == 200:
+            response.validator_key = url if conditional else None
+            return response
+        logger.warning(f"[APIHandler] Failed to retrieve {url}. Status code: {response.status_code}")
+        return None
+
+    def remember_validators(self, response):
+        """Store a homepage's ETag/Last-Modified once its items are saved, so
+        the next conditional fetch can come back as 304."""
+        key = getattr(response, "validator_key", None)
+        if not key or self.validators is None:
+            return
+        validators = {
+            name: response.headers[name]
+            for name in ("ETag", "Last-Modified")
+            if response.headers.get(name)
+        }
+        if not validators:
+            return
+        try:
+            self.validators.set(key, validators, VALIDATOR_TTL_SECONDS)
+        except Exception as e:
+            logger.warning(f"[APIHandler] Could not store validators for {key}: {e}")
+
+    def _conditional_headers(self, url):
+        if self.validators is None:
+            return {}
+        try:
+            validators = self.validators.get(url)
+        except Exception as e:
+            logger.warning(f"[APIHandler] Could not read validators for {url}: {e}")
+            return {}
+        if not isinstance(validators, dict):
+            return {}
+        headers = {}
+        if validators.get("ETag"):
+            headers["If-None-Match"] = validators["ETag"]
+        if validators.get("Last-Modified"):
+            headers["If-Modified-Since"] = validators["Last-Modified"]
+        return headers
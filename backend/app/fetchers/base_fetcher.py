@@ -5,5 +5,9 @@ class DataFetcher:
     def parse_data(self, raw_data):
         raise NotImplementedError
 
+    def detail_links(self, raw_data):
+        """Article pages parse_data will download, so they can be fetched ahead."""
+        return []
+
     def save_data(self, parsed_data):
         raise NotImplementedError
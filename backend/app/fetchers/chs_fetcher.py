@@ -22,10 +22,17 @@ class CHSFetcher(DataFetcher):
             "profile_picture": "https://www.capitolhillseattle.com/wp-content/uploads/2013/05/header1-2.png"
         }
 
+    def _articles(self, response):
+        soup = BeautifulSoup(response.content, "html.parser")
+        return soup.select("header.entry-header")[:5]
+
+    def detail_links(self, response):
+        title_tags = (header.select_one("h1.entry-title a") for header in self._articles(response))
+        return [title_tag["href"] for title_tag in title_tags if title_tag]
+
     def parse_data(self, response):
         logger.info(f"{log_prefix} Parsing homepage HTML...")
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = soup.select("header.entry-header")[:5]
+        articles = self._articles(response)
         parsed = []
 
         logger.info(f"{log_prefix} Found {len(articles)} articles to process.")
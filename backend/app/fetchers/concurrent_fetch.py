@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from config import NEWS_FETCH_MAX_WORKERS, NEWS_FETCH_PER_HOST
+
+from .api_handler import is_not_modified
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+log_prefix = "[ConcurrentFetch]"
+
+
+class HostLimitedPool:
+    """Thread pool that runs at most ``per_host`` downloads per host at once.
+
+    Downloads over a host's limit wait in that host's queue, not in a pool
+    thread, and go to the executor when one of its running downloads ends,
+    so a slow host never holds threads that other hosts could use.
+    """
+
+    def __init__(self, max_workers: int = NEWS_FETCH_MAX_WORKERS, per_host: int = NEWS_FETCH_PER_HOST):
+        self.per_host = per_host
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="news-fetch")
+        self._running: Dict[str, int] = {}
+        self._waiting: Dict[str, Deque[Tuple[Future, Callable, tuple]]] = {}
+        self._outstanding = 0
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+
+    def submit(self, url: str, fn: Callable, *args) -> Future:
+        host = urlparse(url).netloc.lower()
+        future: Future = Future()
+        with self._lock:
+            self._outstanding += 1
+            start = self._running.get(host, 0) < self.per_host
+            if start:
+                self._running[host] = self._running.get(host, 0) + 1
+            else:
+                self._waiting.setdefault(host, deque()).append((future, fn, args))
+        if start:
+            self._start(host, future, fn, args)
+        return future
+
+    def _start(self, host: str, future: Future, fn: Callable, args: tuple) -> None:
+        def run():
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(fn(*args))
+                    except BaseException as exc:
+                        future.set_exception(exc)
+            finally:
+                self._finished(host)
+
+        self._executor.submit(run)
+
+    def _finished(self, host: str) -> None:
+        """Hand the host's slot to its next waiting download, if any."""
+
+        with self._lock:
+            self._outstanding -= 1
+            waiting = self._waiting.get(host)
+            following = waiting.popleft() if waiting else None
+            if following is None:
+                self._running[host] -= 1
+            if self._outstanding == 0:
+                self._idle.notify_all()
+        if following is not None:
+            self._start(host, *following)
+
+    def shutdown(self) -> None:
+        # Waiting downloads are only handed to the executor as others end
+        with self._idle:
+            self._idle.wait_for(lambda: self._outstanding == 0)
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+
+class PrefetchingAPIHandler:
+    """Drop-in for APIHandler whose downloads run on a ``HostLimitedPool``.
+
+    ``prefetch`` starts downloads in the background; ``get_news_data`` returns
+    the (possibly already finished) download for a URL, so fetchers keep
+    calling it one article at a time while the pages arrive in parallel. Each
+    URL is downloaded once per handler.
+    """
+
+    def __init__(self, api_handler, pool: HostLimitedPool):
+        self.api_handler = api_handler
+        self.pool = pool
+        self._downloads: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def prefetch(self, urls, fetch: Optional[Callable] = None) -> List[Future]:
+        fetch = fetch or self.api_handler.get_news_data
+        futures = []
+        with self._lock:
+            for url in urls:
+                future = self._downloads.get(url)
+                if future is None:
+                    future = self._downloads[url] = self.pool.submit(url, fetch, url)
+                futures.append(future)
+        return futures
+
+    def get_news_data(self, url):
+        return self.prefetch([url])[0].result()
+
+    def __getattr__(self, name):
+        return getattr(self.api_handler, name)
+
+
+class NewsSource:
+    """One site in a multi-source fetch.
+
+    ``fetch`` downloads the homepage; it defaults to the fetcher's
+    ``fetch_with_headers`` when it has one, else a conditional
+    ``APIHandler.get_if_modified``.
+    """
+
+    def __init__(self, name: str, url: str, fetcher_class, fetch: Optional[Callable] = None):
+        self.name = name
+        self.url = url
+        self.fetcher_class = fetcher_class
+        self.fetch = fetch
+
+
+def fetch_sources(sources: List[NewsSource], api_handler, pool: Optional[HostLimitedPool] = None) -> List[dict]:
+    """Download every source and its article pages concurrently, then parse
+    and save each source in list order.
+
+    Homepages are downloaded in parallel; as each one arrives, its article
+    links (``fetcher.detail_links``) are queued so detail pages overlap with
+    the remaining homepages. Parsing and saving run afterwards on the calling
+    thread, in the order of ``sources``, against the downloaded pages, so the
+    database writes are the same as a sequential run.
+    """
+
+    own_pool = pool is None
+    pool = pool or HostLimitedPool()
+    handler = PrefetchingAPIHandler(api_handler, pool)
+    started = time.monotonic()
+
+    try:
+        homepages = []
+        for source in sources:
+            fetcher = source.fetcher_class(handler)
+            fetch = (
+                source.fetch
+                or getattr(fetcher, "fetch_with_headers", None)
+                or getattr(api_handler, "get_if_modified", None)
+            )
+            logger.info(f"{log_prefix} → Fetching {source.name} from {source.url}")
+            homepages.append((handler.prefetch([source.url], fetch)[0], fetcher))
+
+        fetcher_for = {id(future): fetcher for future, fetcher in homepages}
+        for future in as_completed([future for future, _ in homepages]):
+            fetcher = fetcher_for[id(future)]
+            try:
+                response = future.result()
+                if response and not is_not_modified(response):
+                    handler.prefetch(fetcher.detail_links(response))
+            except Exception as exc:
+                # parse_data reports the failure when it runs
+                logger.warning(f"{log_prefix} Could not queue article pages: {exc}")
+
+        logger.info(f"{log_prefix} Downloads queued in {time.monotonic() - started:.2f}s")
+
+        results = []
+        for (future, fetcher), source in zip(homepages, sources):
+            try:
+                response = future.result()
+            except Exception as exc:
+                logger.warning(f"{log_prefix} ⚠️ {source.name} fetch raised: {exc}")
+                response = None
+            if not response:
+                logger.warning(f"{log_prefix} ⚠️ No response from {source.name}")
+                results.append({"source": source.name, "status": "fetch_failed"})
+                continue
+            if is_not_modified(response):
+                logger.info(f"{log_prefix} {source.name} unchanged since last run; skipping parse")
+                results.append({"source": source.name, "status": "not_modified"})
+                continue
+
+            parsed = fetcher.parse_data(response)
+            logger.info(f"{log_prefix} ✅ {source.name} parsed {len(parsed)} articles")
+
+            saved = fetcher.save_data(parsed)
+            saved_count = saved.get("saved", 0) if isinstance(saved, dict) else len(saved)
+            logger.info(f"{log_prefix} ✅ {source.name} saved {saved_count} new items")
+
+            remember_validators = getattr(api_handler, "remember_validators", None)
+            if remember_validators:
+                remember_validators(response)
+
+            results.append({"source": source.name, "parsed": len(parsed), "saved": saved_count})
+        return results
+    finally:
+        if own_pool:
+            pool.shutdown()
+
+
+__all__ = [
+    "HostLimitedPool",
+    "NewsSource",
+    "PrefetchingAPIHandler",
+    "fetch_sources",
+]
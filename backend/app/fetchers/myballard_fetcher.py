@@ -9,7 +9,6 @@ from app.utils import fetch_google_image_url
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 log_prefix = "[MyBallardFetcher]"
-import requests
 
 class MyBallardFetcher(DataFetcher):
     def __init__(self, api_handler):
@@ -35,10 +34,10 @@ class MyBallardFetcher(DataFetcher):
             )
         }
         try:
-            response = requests.get(url, headers=headers, timeout=10)
-            if response.status_code != 200:
-                logger.error(f"{log_prefix} ❌ Failed to fetch {url} — Status {response.status_code}")
-                return None
+            # Conditional request on the shared session: a 304 means nothing new
+            response = self.api_handler.send_request(url, headers=headers, conditional=True)
+            if response is None:
+                logger.error(f"{log_prefix} ❌ Failed to fetch {url}")
             return response
         except Exception as e:
             logger.error(f"{log_prefix} ❌ Exception while fetching {url}: {e}")
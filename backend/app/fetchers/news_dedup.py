@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from sqlalchemy import func
+
+# Lowest similarity threshold check_for_duplicates applies (same-domain rule)
+MIN_SIMILARITY = 0.8
+HIGH_SIMILARITY = 0.9
+
+# A title is only compared with SequenceMatcher when it shares at least this
+# fraction of the smaller trigram set with the headline. Titles at ratio 0.8
+# keep well over half their trigrams unless edits are spread one per word, so
+# this is deliberately loose: it only has to rule out unrelated headlines.
+MIN_TRIGRAM_OVERLAP = 0.2
+
+# Rebuild the process-wide index from scratch at least this often
+INDEX_MAX_AGE_SECONDS = 3600
+
+
+def _normalize(text):
+    # Imported lazily: news_saver imports this module
+    from .news_saver import normalize_text
+
+    return normalize_text(text)
+
+
+def _domain(url):
+    from .news_saver import get_domain_from_url
+
+    return get_domain_from_url(url)
+
+
+_TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "mc_cid", "mc_eid")
+
+
+def normalize_news_link(link: Optional[str]) -> Optional[str]:
+    """Key identifying an article URL regardless of scheme, ``www.``, case,
+    fragment, trailing slash and tracking parameters."""
+
+    if not link or not link.strip():
+        return None
+    parts = urlsplit(link.strip().lower())
+    host = parts.netloc[4:] if parts.netloc.startswith("www.") else parts.netloc
+    query = [
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.startswith(_TRACKING_PARAMS)
+    ]
+    key = host + parts.path.rstrip("/")
+    if query:
+        key += "?" + urlencode(sorted(query))
+    return key
+
+
+def trigrams(normalized: str) -> Set[str]:
+    """Character trigrams of ``normalized``, padded so short titles get some."""
+
+    padded = f"  {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class _Entry:
+    __slots__ = ("title", "link", "normalized", "domain")
+
+    def __init__(self, title: str, link: str):
+        self.title = title
+        self.link = link
+        self.normalized = _normalize(title)
+        self.domain = _domain(link)
+
+
+class NewsDedupIndex:
+    """In-memory index over existing news rows for ``check_for_duplicates``.
+
+    Exact matches (title, link, normalized title) are hash lookups. Fuzzy
+    matches are found through a trigram inverted index, and only the
+    candidates it returns are aligned with ``SequenceMatcher``. Candidates
+    are checked in insertion order with the same rules as the linear scan,
+    so the earliest matching row decides the reason, as before.
+    """
+
+    def __init__(self):
+        self._entries: List[Optional[_Entry]] = []
+        self._by_title: Dict[str, int] = {}
+        self._by_link: Dict[str, int] = {}
+        self._by_normalized: Dict[str, int] = {}
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self._trigram_counts: List[int] = []
+        self.last_id = 0
+        self.id_sum = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, title, link, row_id: Optional[int] = None) -> None:
+        """Append a row; rows without a title or link are counted but never match."""
+
+        if row_id is not None:
+            self.last_id = max(self.last_id, row_id)
+            self.id_sum += row_id
+        if not title or not link:
+            self._entries.append(None)
+            self._trigram_counts.append(0)
+            return
+
+        position = len(self._entries)
+        entry = _Entry(title.strip(), link.strip())
+        self._entries.append(entry)
+        self._by_title.setdefault(entry.title.lower(), position)
+        self._by_link.setdefault(entry.link.lower(), position)
+        self._by_normalized.setdefault(entry.normalized, position)
+
+        grams = trigrams(entry.normalized)
+        self._trigram_counts.append(len(grams))
+        for gram in grams:
+            self._postings[gram].append(position)
+
+    def _candidates(self, headline: str, link: str, normalized: str) -> List[int]:
+        found = set()
+        for table, key in (
+            (self._by_title, headline.lower()),
+            (self._by_link, link.lower()),
+            (self._by_normalized, normalized),
+        ):
+            position = table.get(key)
+            if position is not None:
+                found.add(position)
+
+        grams = trigrams(normalized)
+        shared = Counter()
+        for gram in grams:
+            postings = self._postings.get(gram)
+            if postings:
+                shared.update(postings)
+
+        length = len(normalized)
+        for position, count in shared.items():
+            if position in found:
+                continue
+            smaller = min(len(grams), self._trigram_counts[position])
+            if count < MIN_TRIGRAM_OVERLAP * smaller:
+                continue
+            # ratio() can never exceed 2 * min(len) / (len_a + len_b)
+            other = len(self._entries[position].normalized)
+            if 2 * min(length, other) < MIN_SIMILARITY * (length + other):
+                continue
+            found.add(position)
+        return sorted(found)
+
+    def find(self, headline: str, link: str) -> Tuple[bool, Optional[str]]:
+        """Return ``(is_duplicate, reason)`` exactly like ``check_for_duplicates``."""
+
+        normalized = _normalize(headline)
+        current_domain = _domain(link)
+
+        for position in self._candidates(headline, link, normalized):
+            entry = self._entries[position]
+            if headline.lower() == entry.title.lower():
+                return True, "exact_title_match"
+            if link.lower() == entry.link.lower():
+                return True, "exact_link_match"
+            if normalized == entry.normalized:
+                return True, "normalized_title_match"
+
+            if not headline or not entry.title:
+                similarity = 0.0  # as calculate_similarity() does
+            else:
+                similarity = SequenceMatcher(None, normalized, entry.normalized).ratio()
+
+            if current_domain and current_domain == entry.domain and similarity >= MIN_SIMILARITY:
+                return True, "similar_title_same_domain"
+            if similarity >= HIGH_SIMILARITY:
+                return True, f"high_similarity_{similarity:.2f}"
+        return False, None
+
+
+def _seeded_news(UserContent):
+    return UserContent.query.filter_by(is_seeded=True, seed_type="news")
+
+
+def _build(index: NewsDedupIndex, UserContent) -> NewsDedupIndex:
+    """Add seeded news rows newer than ``index.last_id`` in id order."""
+
+    rows = (
+        _seeded_news(UserContent)
+        .filter(UserContent.id > index.last_id)
+        .order_by(UserContent.id)
+        .with_entities(UserContent.id, UserContent.title, UserContent.news_link)
+        .all()
+    )
+    for row_id, title, link in rows:
+        index.add(title, link, row_id)
+    return index
+
+
+class _IndexHolder:
+    def __init__(self):
+        self.index: Optional[NewsDedupIndex] = None
+        self.built_at = 0.0
+
+
+_indexes: Dict[str, _IndexHolder] = {}
+_indexes_lock = threading.Lock()
+
+
+def seeded_news_index(db, UserContent) -> NewsDedupIndex:
+    """Return the process-wide index of seeded news, refreshed incrementally.
+
+    Only rows with an id above the last one indexed are loaded on each call.
+    If the count or sum of ids no longer matches the table (deleted rows,
+    reused ids, or ids committed out of order by another writer) or the index
+    is older than ``INDEX_MAX_AGE_SECONDS``, it is rebuilt from scratch.
+    """
+
+    key = str(db.engine.url)
+    with _indexes_lock:
+        holder = _indexes.setdefault(key, _IndexHolder())
+
+        index = holder.index
+        if index is None or time.monotonic() - holder.built_at > INDEX_MAX_AGE_SECONDS:
+            index = _build(NewsDedupIndex(), UserContent)
+            holder.built_at = time.monotonic()
+        else:
+            _build(index, UserContent)
+
+        count, id_sum = _seeded_news(UserContent).with_entities(
+            func.count(UserContent.id), func.coalesce(func.sum(UserContent.id), 0)
+        ).one()
+        if (count, id_sum) != (len(index), index.id_sum):
+            index = _build(NewsDedupIndex(), UserContent)
+            holder.built_at = time.monotonic()
+
+        holder.index = index
+        return index
+
+
+def reset_news_indexes() -> None:
+    with _indexes_lock:
+        _indexes.clear()
+
+
+__all__ = [
+    "NewsDedupIndex",
+    "normalize_news_link",
+    "reset_news_indexes",
+    "seeded_news_index",
+    "trigrams",
+]
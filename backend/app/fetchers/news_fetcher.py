@@ -2,9 +2,9 @@ from fileinput import filename
 import json
 import logging
 from .base_fetcher import DataFetcher
-from .api_handler import APIHandler
-from app import create_app
+from .api_handler import APIHandler, is_not_modified
 from app import celery
+from app.worker import worker_app_context
 from ..models import News, User,UserContent
 from ..models import db
 from ..utils import clear_news
@@ -38,20 +38,21 @@ def fetch_data(self, source):
     logger.info(f"Starting news fetch task {task_id} at {datetime.now()}")
     
     try:
-        # Create a Flask application context instead of using celery.app
-        app, _ = create_app()
-        with app.app_context():
+        # Reuse the worker's app and engine instead of building a new app per run
+        with worker_app_context():
             logger.info(f"Task {task_id}: Initializing API handler")
             api_handler_instance = APIHandler()
             news_fetcher = NewsFetcher(api_handler_instance)
             
             logger.info(f"Task {task_id}: Fetching news data from {source}")
             fetch_start = time.time()
-            news_data = news_fetcher.api_handler.get_news_data(source)
+            news_data = news_fetcher.api_handler.get_if_modified(source)
             fetch_duration = time.time() - fetch_start
             logger.info(f"Task {task_id}: News data fetch completed in {fetch_duration:.2f} seconds")
             
-            if news_data:
+            if is_not_modified(news_data):
+                logger.info(f"Task {task_id}: {source} unchanged since last fetch; skipping parse")
+            elif news_data:
                 logger.info(f"Task {task_id}: Parsing fetched news data")
                 parse_start = time.time()
                 parsed_news = news_fetcher.parse_data(news_data)
@@ -63,6 +64,7 @@ def fetch_data(self, source):
                 news_fetcher.save_data(parsed_news)
                 save_duration = time.time() - save_start
                 logger.info(f"Task {task_id}: News items saved to database in {save_duration:.2f} seconds")
+                news_fetcher.api_handler.remember_validators(news_data)
             else:
                 logger.error(f"Task {task_id}: No data fetched from API")
                 raise self.retry(exc=Exception("No data fetched from API"))
@@ -79,30 +81,32 @@ class NewsFetcher(DataFetcher):
     def __init__(self, api_handler):
         self.api_handler = api_handler
                 
-    def parse_data(self, data):
+    def _story_items(self, data):
+        """Hero story, up to 2 secondary and up to 7 tertiary stories, in page order."""
         soup = BeautifulSoup(data.content, 'html.parser')
-        parsed_news = []
-
         main_headline_item = soup.select_one("ul[class^='heroLayout-module_heroPrimary'] li")
-        if main_headline_item:
-            main_headline = self.extract_news_item(main_headline_item)
-            if main_headline:
-                parsed_news.append(main_headline)
-
-        mini_headline_items = soup.select("ul[class^='heroLayout-module_heroSecondary'] li")[:2]
-        for item in mini_headline_items:
-            mini_headline = self.extract_news_item(item)
-            if mini_headline:
-                parsed_news.append(mini_headline)
-
-        other_story_items = soup.select("ul[class^='heroLayout-module_heroTertiary'] li")[:7]
-        for item in other_story_items:
-            other_story = self.extract_news_item(item)
-            if other_story:
-                parsed_news.append(other_story)
+        items = [main_headline_item] if main_headline_item else []
+        items += soup.select("ul[class^='heroLayout-module_heroSecondary'] li")[:2]
+        items += soup.select("ul[class^='heroLayout-module_heroTertiary'] li")[:7]
+        return items
+
+    def _full_link(self, link):
+        return "https://komonews.com" + link if link.startswith('/') else link
+
+    def detail_links(self, data):
+        headline_links = (item.find("a", href=True) for item in self._story_items(data))
+        return [self._full_link(a['href']) for a in headline_links if a]
+
+    def parse_data(self, data):
+        parsed_news = []
+        for item in self._story_items(data):
+            news_item = self.extract_news_item(item)
+            if news_item:
+                parsed_news.append(news_item)
         
-        with open('/tmp/parsed_news.json', 'w', encoding='utf-8') as file:
-            json.dump(parsed_news, file, indent=4, ensure_ascii=False, default=str)
+        if config.NEWS_DEBUG_DUMP:
+            with open('/tmp/parsed_news.json', 'w', encoding='utf-8') as file:
+                json.dump(parsed_news, file, indent=4, ensure_ascii=False, default=str)
                
         return parsed_news
 
@@ -116,7 +120,7 @@ class NewsFetcher(DataFetcher):
             headline = headline_link.get_text(strip=True)
 
         link = headline_link['href']
-        full_link = "https://komonews.com" + link if link.startswith('/') else link
+        full_link = self._full_link(link)
 
         # Default placeholder
         image_url = "https://placeholder.pagebee.io/api/plain/500/300?text=Image+Unavailable&bg=cccccc&color=333333"
@@ -3,11 +3,12 @@ import logging
 import re
 from datetime import datetime
 from difflib import SequenceMatcher
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, select
 from sqlalchemy.orm import sessionmaker
 from app import create_app
 import os
 from urllib.parse import urlparse
+from .news_dedup import NewsDedupIndex, normalize_news_link, seeded_news_index
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -53,41 +54,19 @@ def check_for_duplicates(headline, link, existing_news_data):
     """
     Comprehensive duplicate checking function.
     Returns (is_duplicate, reason) tuple.
+
+    Rows are checked in order and the first one that matches decides the
+    reason: exact title, exact link, normalized title, similar title on the
+    same domain (>= 0.8), then very high similarity (>= 0.9).
+    ``existing_news_data`` may be a NewsDedupIndex (as save_parsed_news
+    passes) or any iterable of rows with ``title`` and ``news_link``.
     """
-    normalized_headline = normalize_text(headline)
-    current_domain = get_domain_from_url(link)
-    
-    for existing_uc in existing_news_data:
-        if not existing_uc.title or not existing_uc.news_link:
-            continue
-            
-        existing_title = existing_uc.title.strip()
-        existing_link = existing_uc.news_link.strip()
-        existing_domain = get_domain_from_url(existing_link)
-        
-        # 1. Exact title match
-        if headline.lower() == existing_title.lower():
-            return True, "exact_title_match"
-            
-        # 2. Exact link match
-        if link.lower() == existing_link.lower():
-            return True, "exact_link_match"
-            
-        # 3. Normalized title match (removes punctuation, extra spaces)
-        if normalized_headline == normalize_text(existing_title):
-            return True, "normalized_title_match"
-            
-        # 4. Same domain with similar title
-        if current_domain and current_domain == existing_domain:
-            if is_similar_title(headline, existing_title, threshold=0.8):
-                return True, "similar_title_same_domain"
-                
-        # 5. Very high content similarity (90%+)
-        similarity = calculate_similarity(headline, existing_title)
-        if similarity >= 0.9:
-            return True, f"high_similarity_{similarity:.2f}"
-    
-    return False, None
+    if not isinstance(existing_news_data, NewsDedupIndex):
+        index = NewsDedupIndex()
+        for existing_uc in existing_news_data:
+            index.add(existing_uc.title, existing_uc.news_link)
+        existing_news_data = index
+    return existing_news_data.find(headline, link)
 
 def get_alternate_db_url():
     """Get the alternate database URL based on the current environment"""
@@ -156,11 +135,28 @@ def save_to_alternate_db(db_url, links, site_config, User, UserContent, parsed_n
         if 'alt_db' in locals():
             alt_db.close()
 
-def save_parsed_news(parsed_news, site_config, db, User, UserContent):
-    logger.info(f"[save_parsed_news] Starting save for: {site_config['username']}")
-    logger.info(f"[save_parsed_news] Parsed news count: {len(parsed_news)}")
 
-    # Get or create user
+# Rows per INSERT statement; keeps bound parameters well under SQLite's limit
+INSERT_BATCH_SIZE = 500
+
+# (database URL, username) -> user id of each news source account
+_source_user_ids = {}
+
+
+def reset_source_user_cache():
+    _source_user_ids.clear()
+
+
+def get_source_user_id(site_config, db, User):
+    """Return the id of the source's user, creating it on first use.
+
+    The id is cached per process, so steady-state runs skip the lookup.
+    """
+    key = (str(db.engine.url), site_config["username"])
+    user_id = _source_user_ids.get(key)
+    if user_id is not None:
+        return user_id
+
     user = User.query.filter_by(username=site_config["username"]).first()
     if not user:
         logger.info(f"[save_parsed_news] Creating new user: {site_config['username']}")
@@ -179,63 +175,175 @@ def save_parsed_news(parsed_news, site_config, db, User, UserContent):
     else:
         logger.info(f"[save_parsed_news] Found existing user: {site_config['username']}")
 
-    # ✅ Get ALL existing seeded news for comprehensive duplicate checking
-    existing_news_data = UserContent.query.filter_by(is_seeded=True, seed_type="news").all()
-    logger.info(f"[save_parsed_news] Existing seeded post count: {len(existing_news_data)}")
+    _source_user_ids[key] = user.id
+    return user.id
 
-    skipped_invalid = 0
-    skipped_duplicates = 0
-    duplicate_reasons = {}
-    new_items = []
 
-    for news in parsed_news:
-        headline = news.get("headline", "").strip()
-        link = news.get("link", "").strip()
+def _dialect_insert(session):
+    """The dialect's ``insert`` with ``ON CONFLICT`` support, or ``None``."""
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+    return insert
 
-        if not headline or not link:
-            logger.warning(f"[save_parsed_news] Skipping invalid news item (missing headline or link)")
-            skipped_invalid += 1
-            continue
 
-        # ✅ Explicit duplicate checking
-        is_duplicate, reason = check_for_duplicates(headline, link, existing_news_data)
-        
-        if is_duplicate:
+def _insert_new_rows(session, table, batch):
+    """Insert the rows of ``batch`` whose link key is not saved yet, one at a time.
+
+    Used on dialects without ``ON CONFLICT``; yields ``(id, news_link_key)``
+    like the ``RETURNING`` clause of the bulk path.
+    """
+    for row in batch:
+        exists = session.execute(
+            select(table.c.id).where(table.c.news_link_key == row["news_link_key"]).limit(1)
+        ).first()
+        if exists is None:
+            result = session.execute(table.insert().values(row))
+            yield result.inserted_primary_key[0], row["news_link_key"]
+
+
+def insert_news_rows(session, UserContent, rows):
+    """Insert ``rows`` (column dicts including ``news_link_key``) in batches.
+
+    Rows whose link key already exists, e.g. saved moments ago by a
+    concurrent fetcher, are skipped by ``ON CONFLICT DO NOTHING``; other
+    dialects check for the key before inserting each row. Returns
+    ``{news_link_key: id}`` for the rows actually inserted, after creating
+    their content_scores rows (the ORM ``after_insert`` hook does not run
+    for Core inserts).
+    """
+    from app.models import ContentScore
+
+    insert = _dialect_insert(session)
+    table = UserContent.__table__
+    inserted = {}
+    scores = []
+    now = datetime.utcnow()
+
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        batch = rows[start:start + INSERT_BATCH_SIZE]
+        created_at = {row["news_link_key"]: row["created_at"] for row in batch}
+        if insert is None:
+            results = _insert_new_rows(session, table, batch)
+        else:
+            results = session.execute(
+                insert(table)
+                .values(batch)
+                .on_conflict_do_nothing(index_elements=[table.c.news_link_key])
+                .returning(table.c.id, table.c.news_link_key)
+            )
+        for content_id, key in results:
+            inserted[key] = content_id
+            scores.append({
+                "content_id": content_id,
+                "reactions_count": 0,
+                "comments_count": 0,
+                "shares_count": 0,
+                "reposts_count": 0,
+                "raw_score": 0.0,
+                "score": 0.0,
+                "content_created_at": created_at[key],
+                "updated_at": now,
+            })
+
+    if scores:
+        session.execute(ContentScore.__table__.insert(), scores)
+    return inserted
+
+
+def save_parsed_news(parsed_news, site_config, db, User, UserContent):
+    logger.info(f"[save_parsed_news] Starting save for: {site_config['username']}")
+    logger.info(f"[save_parsed_news] Parsed news count: {len(parsed_news)}")
+
+    try:
+        user_id = get_source_user_id(site_config, db, User)
+
+        # ✅ Index of ALL existing seeded news for comprehensive duplicate checking;
+        # kept warm across runs, so only rows added since the last run are loaded
+        existing_news_index = seeded_news_index(db, UserContent)
+        batch_index = NewsDedupIndex()
+        logger.info(f"[save_parsed_news] Existing seeded post count: {len(existing_news_index)}")
+
+        skipped_invalid = 0
+        skipped_duplicates = 0
+        duplicate_reasons = {}
+        rows = []
+        batch_keys = set()
+
+        def skip(reason, headline):
+            nonlocal skipped_duplicates
             logger.info(f"[save_parsed_news] Skipping duplicate ({reason}): {headline[:60]}")
             skipped_duplicates += 1
             duplicate_reasons[reason] = duplicate_reasons.get(reason, 0) + 1
-            continue
-
-        # ✅ All checks passed - save the news item
-        logger.info(f"[save_parsed_news] Saving new headline: {headline[:60]}")
-        uc = UserContent(
-            title=headline,
-            body=news.get("body", news["headline"]),
-            news_link=link,
-            thumbnail=news.get("image_url"),
-            created_at=news.get("timestamp") or datetime.utcnow(),
-            user_id=user.id,
-            is_seeded=True,
-            seed_type="news",
-            is_in_seattle=True,
-            location=LOCATION_MAP.get(site_config["username"], None),
-            seeded_likes_count=random.randint(15, 60),
-            seeded_comments_count=0,
-            unique_id=random.randint(1_000_000_000, 9_999_999_999),
-        )
-        db.session.add(uc)
-        new_items.append((headline, link))
-        
-        # Add to existing data for this batch to prevent duplicates within the same run
-        existing_news_data.append(uc)
 
-    # Save to primary database
-    db.session.commit()
-    logger.info(f"[save_parsed_news] ✅ Committed {len(new_items)} new news items to primary database.")
-    
-    # Save to alternate database if in production or staging
-   
-    
+        for news in parsed_news:
+            headline = news.get("headline", "").strip()
+            link = news.get("link", "").strip()
+
+            if not headline or not link:
+                logger.warning(f"[save_parsed_news] Skipping invalid news item (missing headline or link)")
+                skipped_invalid += 1
+                continue
+
+            # ✅ Explicit duplicate checking
+            is_duplicate, reason = check_for_duplicates(headline, link, existing_news_index)
+            if not is_duplicate:
+                is_duplicate, reason = check_for_duplicates(headline, link, batch_index)
+            link_key = normalize_news_link(link)
+            if not is_duplicate and link_key in batch_keys:
+                is_duplicate, reason = True, "normalized_link_match"
+
+            if is_duplicate:
+                skip(reason, headline)
+                continue
+
+            # ✅ All checks passed - queue the news item
+            logger.info(f"[save_parsed_news] Saving new headline: {headline[:60]}")
+            created_at = news.get("timestamp") or datetime.utcnow()
+            rows.append({
+                "title": headline,
+                "body": news.get("body", news["headline"]),
+                "news_link": link,
+                "news_link_key": link_key,
+                "thumbnail": news.get("image_url"),
+                "created_at": created_at,
+                "updated_at": created_at,
+                "user_id": user_id,
+                "is_seeded": True,
+                "seed_type": "news",
+                "is_in_seattle": True,
+                "location": LOCATION_MAP.get(site_config["username"], None),
+                "seeded_likes_count": random.randint(15, 60),
+                "seeded_comments_count": 0,
+                "unique_id": random.randint(1_000_000_000, 9_999_999_999),
+            })
+            batch_keys.add(link_key)
+
+            # Add to the batch index to prevent duplicates within the same run; the
+            # shared index picks committed rows up by id on the next run
+            batch_index.add(headline, link)
+
+        # One INSERT ... ON CONFLICT DO NOTHING per batch; links already saved
+        # under another spelling, or by a concurrent run since the index was
+        # read, are skipped by the database
+        inserted = insert_news_rows(db.session, UserContent, rows) if rows else {}
+        for row in rows:
+            if row["news_link_key"] not in inserted:
+                skip("normalized_link_match", row["title"])
+
+        # Save to primary database
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        reset_source_user_cache()
+        raise
+
+    logger.info(f"[save_parsed_news] ✅ Committed {len(inserted)} new news items to primary database.")
+
     # Log detailed duplicate statistics
     if duplicate_reasons:
         logger.info(f"[save_parsed_news] Duplicate breakdown:")
@@ -243,7 +351,8 @@ def save_parsed_news(parsed_news, site_config, db, User, UserContent):
             logger.info(f"[save_parsed_news]   - {reason}: {count}")
 
     return {
-        "saved": len(new_items),
+        "saved": len(inserted),
+        "saved_ids": [inserted[row["news_link_key"]] for row in rows if row["news_link_key"] in inserted],
         "skipped_duplicates": skipped_duplicates,
         "duplicate_reasons": duplicate_reasons,
         "skipped_invalid": skipped_invalid
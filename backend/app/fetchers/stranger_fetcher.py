@@ -24,10 +24,17 @@ class StrangerFetcher(DataFetcher):
             "profile_picture": "https://www.thestranger.com/assets/sites/stranger/images/site-logo.png?20220525222143"
         }
 
+    def _articles(self, response):
+        soup = BeautifulSoup(response.content, "html.parser")
+        return soup.select("div.item")[:5]
+
+    def detail_links(self, response):
+        title_links = (article.select_one("h2.headline a, h3.headline a") for article in self._articles(response))
+        return [urljoin(self.BASE_URL, title_a["href"]) for title_a in title_links if title_a]
+
     def parse_data(self, response):
         logger.info(f"{log_prefix} Parsing HTML...")
-        soup = BeautifulSoup(response.content, "html.parser")
-        items = soup.select("div.item")[:5]
+        items = self._articles(response)
         parsed = []
 
         for i, article in enumerate(items, 1):
@@ -24,10 +24,20 @@ class TheNeedlingFetcher(DataFetcher):
             "profile_picture": "https://theneedling.com/wp-content/uploads/2018/10/Needling_banner_102118.jpg"
         }
 
+    def _articles(self, response):
+        soup = BeautifulSoup(response.content, "html.parser")
+        return soup.select("div.td_module_flex")[:5]
+
+    def _link(self, href):
+        return href if href.startswith("http") else urljoin(self.BASE_URL, href)
+
+    def detail_links(self, response):
+        title_tags = (article.select_one("h3.entry-title.td-module-title a") for article in self._articles(response))
+        return [self._link(title_tag["href"]) for title_tag in title_tags if title_tag]
+
     def parse_data(self, response):
         logger.info(f"{log_prefix} Parsing HTML...")
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = soup.select("div.td_module_flex")[:5]
+        articles = self._articles(response)
         logger.info(f"{log_prefix} Found {len(articles)} article blocks")
         parsed = []
 
@@ -42,7 +52,7 @@ class TheNeedlingFetcher(DataFetcher):
 
             headline = title_tag.get_text(strip=True)
             href     = title_tag["href"]
-            link     = href if href.startswith("http") else urljoin(self.BASE_URL, href)
+            link     = self._link(href)
             logger.info(f"{log_prefix} Headline: {headline}")
             logger.info(f"{log_prefix} Link: {link}")
 
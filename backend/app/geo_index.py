@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, List, Optional, Sequence
+
+import numpy as np
+import shapely
+from shapely.strtree import STRtree
+
+_NO_MATCH = -1
+
+
+class PolygonIndex:
+    """Point-in-polygon lookups over a fixed set of geometries.
+
+    Geometries are kept in an ``STRtree`` and prepared once, so a lookup only
+    runs exact predicates against the few candidates whose bounding boxes
+    contain the point. Matches follow the order the geometries were given in:
+    the first containing geometry wins, mirroring ``gdf[gdf.contains(p)].iloc[0]``.
+    """
+
+    def __init__(self, geometries: Iterable[Any], names: Optional[Sequence[Any]] = None):
+        # STRtree skips missing/empty geometries but keeps positions aligned
+        self._geometries = np.asarray(list(geometries), dtype=object)
+        shapely.prepare(self._geometries)
+        self._tree = STRtree(self._geometries)
+        self._names: List[Optional[str]] = (
+            [_clean_name(name) for name in names]
+            if names is not None
+            else [None] * len(self._geometries)
+        )
+
+    @classmethod
+    def from_geodataframe(cls, gdf, name_column: str = "name") -> "PolygonIndex":
+        """Build an index from a GeoDataFrame, tolerating empty frames."""
+
+        if gdf is None or gdf.empty or "geometry" not in gdf:
+            return cls([])
+        names = list(gdf[name_column]) if name_column in gdf else None
+        return cls(gdf.geometry.values, names)
+
+    def __len__(self) -> int:
+        return len(self._geometries)
+
+    # -- single point -----------------------------------------------------
+
+    def locate(self, lat: float, lon: float, max_distance: Optional[float] = None) -> Optional[int]:
+        """Return the index of the first geometry containing the point.
+
+        With ``max_distance`` (in degrees), fall back to the first geometry
+        strictly closer than that when none contains the point.
+        """
+
+        if not len(self):
+            return None
+        point = shapely.Point(lon, lat)
+
+        for candidate in np.sort(self._tree.query(point)):
+            if self._geometries[candidate].contains(point):
+                return int(candidate)
+
+        if max_distance is not None:
+            for candidate in np.sort(self._tree.query(point, predicate="dwithin", distance=max_distance)):
+                if self._geometries[candidate].distance(point) < max_distance:
+                    return int(candidate)
+        return None
+
+    def contains(self, lat: float, lon: float) -> bool:
+        return self.locate(lat, lon) is not None
+
+    def lookup(self, lat: float, lon: float, max_distance: Optional[float] = None) -> Optional[str]:
+        """Return the name of the geometry located for the point, if any."""
+
+        index = self.locate(lat, lon, max_distance)
+        return self._names[index] if index is not None else None
+
+    # -- batches ----------------------------------------------------------
+
+    def locate_many(self, lats, lons, max_distance: Optional[float] = None) -> np.ndarray:
+        """Vectorized ``locate``; returns ``-1`` where nothing matched."""
+
+        points = shapely.points(np.asarray(lons, dtype=float), np.asarray(lats, dtype=float))
+        result = np.full(len(points), _NO_MATCH, dtype=np.int64)
+        if not len(self) or not len(points):
+            return result
+
+        point_idx, geometry_idx = self._tree.query(points)
+        hits = shapely.contains(self._geometries[geometry_idx], points[point_idx])
+        self._keep_first(result, point_idx[hits], geometry_idx[hits])
+
+        if max_distance is not None:
+            missing = np.flatnonzero(result == _NO_MATCH)
+            if len(missing):
+                near_idx, geometry_idx = self._tree.query(
+                    points[missing], predicate="dwithin", distance=max_distance
+                )
+                close = shapely.distance(self._geometries[geometry_idx], points[missing][near_idx]) < max_distance
+                self._keep_first(result, missing[near_idx[close]], geometry_idx[close])
+        return result
+
+    def contains_many(self, lats, lons) -> np.ndarray:
+        return self.locate_many(lats, lons) != _NO_MATCH
+
+    def lookup_many(self, lats, lons, max_distance: Optional[float] = None) -> List[Optional[str]]:
+        return [
+            self._names[index] if index != _NO_MATCH else None
+            for index in self.locate_many(lats, lons, max_distance)
+        ]
+
+    def _keep_first(self, result: np.ndarray, point_idx: np.ndarray, geometry_idx: np.ndarray) -> None:
+        if not len(point_idx):
+            return
+        first = np.full(len(result), len(self), dtype=np.int64)
+        np.minimum.at(first, point_idx, geometry_idx)
+        matched = (first < len(self)) & (result == _NO_MATCH)
+        result[matched] = first[matched]
+
+
+def _clean_name(value: Any) -> Optional[str]:
+    # GeoDataFrame columns use NaN for missing tags
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    return value
+
+
+__all__ = ["PolygonIndex"]
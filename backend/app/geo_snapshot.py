@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Optional
+
+from config import SEATTLE_GEO_SNAPSHOT_DIR
+
+FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+CRS = "EPSG:4326"
+
+LAYER_BOUNDARY = "boundary"
+LAYER_NEIGHBORHOODS = "neighborhoods"
+LAYERS = (LAYER_BOUNDARY, LAYER_NEIGHBORHOODS)
+
+PLACE_QUERY = "Seattle, Washington"
+NEIGHBORHOOD_TAGS = {"place": ["neighbourhood", "suburb", "quarter"]}
+SOURCE = "OpenStreetMap via OSMnx (© OpenStreetMap contributors, ODbL)"
+
+if TYPE_CHECKING:
+    import geopandas as gpd
+
+
+class SnapshotUnavailable(RuntimeError):
+    """Raised when a snapshot layer is missing, stale or unreadable."""
+
+
+def _directory(directory: Optional[str]) -> str:
+    return directory or SEATTLE_GEO_SNAPSHOT_DIR
+
+
+def read_manifest(directory: Optional[str] = None) -> Dict:
+    path = os.path.join(_directory(directory), MANIFEST_NAME)
+    try:
+        with open(path, "r") as file:
+            manifest = json.load(file)
+    except (OSError, ValueError) as exc:
+        raise SnapshotUnavailable(f"Cannot read geo snapshot manifest at {path}: {exc}") from exc
+
+    if manifest.get("format_version") != FORMAT_VERSION:
+        raise SnapshotUnavailable(
+            f"Geo snapshot at {path} has format {manifest.get('format_version')!r}, "
+            f"expected {FORMAT_VERSION}"
+        )
+    return manifest
+
+
+def load_layer(name: str, directory: Optional[str] = None) -> gpd.GeoDataFrame:
+    """Load one snapshot layer as a GeoDataFrame with a ``name`` column.
+
+    Geometries are stored as concatenated WKB; the file is read once and
+    each geometry is decoded from its slice of it.
+    """
+
+    directory = _directory(directory)
+    layer = read_manifest(directory).get("layers", {}).get(name)
+    if layer is None:
+        raise SnapshotUnavailable(f"Geo snapshot at {directory} has no {name!r} layer")
+
+    path = os.path.join(directory, layer["file"])
+    offsets = layer["offsets"]
+    try:
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size != layer["bytes"]:
+                raise SnapshotUnavailable(f"Geo snapshot file {path} is truncated")
+            data = file.read()
+        blobs = [data[start:end] for start, end in zip([0] + offsets[:-1], offsets)]
+    except OSError as exc:
+        raise SnapshotUnavailable(f"Cannot read geo snapshot file {path}: {exc}") from exc
+
+    import geopandas as gpd
+    import shapely
+
+    return gpd.GeoDataFrame(
+        {"name": layer["names"]},
+        geometry=list(shapely.from_wkb(blobs)) if blobs else [],
+        crs=layer.get("crs", CRS),
+    )
+
+
+def write_snapshot(layers: Dict[str, gpd.GeoDataFrame], directory: Optional[str] = None) -> Dict:
+    """Write ``layers`` as a new snapshot version.
+
+    Data files are named after the snapshot version and the manifest is
+    replaced atomically. The previous version's files are kept, so a process
+    that read the old manifest just before the swap can still open them;
+    they are removed by the next write.
+    """
+
+    import shapely
+
+    directory = _directory(directory)
+    os.makedirs(directory, exist_ok=True)
+    try:
+        previous = {layer["file"] for layer in read_manifest(directory).get("layers", {}).values()}
+    except SnapshotUnavailable:
+        previous = set()
+    created_at = datetime.utcnow()
+    version = created_at.strftime("%Y%m%d%H%M%S")
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "version": version,
+        "created_at": created_at.isoformat() + "Z",
+        "source": SOURCE,
+        "layers": {},
+    }
+
+    for name, gdf in layers.items():
+        gdf = gdf.to_crs(CRS) if gdf.crs is not None else gdf.set_crs(CRS)
+        blobs = [bytes(blob) for blob in shapely.to_wkb(gdf.geometry.values)]
+        offsets, total = [], 0
+        for blob in blobs:
+            total += len(blob)
+            offsets.append(total)
+        names = gdf["name"] if "name" in gdf else [None] * len(gdf)
+
+        filename = f"{name}.{version}.wkb"
+        temporary = os.path.join(directory, f".{filename}.tmp")
+        with open(temporary, "wb") as file:
+            file.write(b"".join(blobs))
+        os.replace(temporary, os.path.join(directory, filename))
+
+        manifest["layers"][name] = {
+            "file": filename,
+            "crs": CRS,
+            "count": len(blobs),
+            "bytes": total,
+            "offsets": offsets,
+            "names": [value if isinstance(value, str) else None for value in names],
+        }
+
+    temporary = os.path.join(directory, f".{MANIFEST_NAME}.tmp")
+    with open(temporary, "w") as file:
+        json.dump(manifest, file, indent=1)
+    os.replace(temporary, os.path.join(directory, MANIFEST_NAME))
+
+    keep = previous | {layer["file"] for layer in manifest["layers"].values()}
+    for filename in os.listdir(directory):
+        if filename.endswith(".wkb") and filename not in keep:
+            os.remove(os.path.join(directory, filename))
+    return manifest
+
+
+def fetch_live_layer(name: str) -> gpd.GeoDataFrame:
+    """Download a layer from Nominatim/Overpass through OSMnx."""
+
+    import osmnx as ox
+
+    ox.settings.use_cache = False
+    if name == LAYER_BOUNDARY:
+        gdf = ox.geocode_to_gdf(PLACE_QUERY)
+    elif name == LAYER_NEIGHBORHOODS:
+        gdf = ox.features.features_from_place(PLACE_QUERY, tags=NEIGHBORHOOD_TAGS)
+    else:
+        raise ValueError(f"Unknown geo layer {name!r}")
+    return gdf.to_crs(epsg=4326)
+
+
+__all__ = [
+    "FORMAT_VERSION",
+    "LAYERS",
+    "LAYER_BOUNDARY",
+    "LAYER_NEIGHBORHOODS",
+    "SnapshotUnavailable",
+    "fetch_live_layer",
+    "load_layer",
+    "read_manifest",
+    "write_snapshot",
+]
@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .local_cache import MISSING as _MISSING, LRUCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SQLITE_PATH = os.path.join(tempfile.gettempdir(), "seattlepulse_geocode_cache.sqlite3")
+
+
+def _green_threads() -> bool:
+    """Whether eventlet has monkey-patched threading in this process."""
+
+    try:
+        from eventlet import patcher
+    except ImportError:
+        return False
+    return patcher.is_monkey_patched("thread")
+
+
+class SQLiteStore:
+    """L2 tier shared by every process on the host through one SQLite file.
+
+    Each store keeps one connection behind a lock. Under eventlet the calls
+    run in its OS thread pool (``eventlet.tpool``), so a busy file never
+    blocks the hub. ``accessed_at`` only drives LRU eviction, so a hit
+    refreshes it at most once per ``touch_interval`` seconds.
+    """
+
+    # Trim expired/overflow rows once every this many writes
+    _PRUNE_EVERY = 256
+
+    def __init__(self, path: str = DEFAULT_SQLITE_PATH, max_entries: int = 200_000,
+                 touch_interval: float = 3600):
+        self.path = path
+        self.max_entries = max_entries
+        self.touch_interval = touch_interval
+        self._green = _green_threads()
+        if self._green:
+            from eventlet import patcher, tpool
+
+            # Taken inside tpool's OS threads, so it must be a real lock
+            self._lock = patcher.original("threading").Lock()
+            self._execute = tpool.execute
+        else:
+            self._lock = threading.Lock()
+            self._execute = lambda fn, *args: fn(*args)
+        self._db: Optional[sqlite3.Connection] = None
+        self._writes = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        # Called with ``_lock`` held
+        if self._db is None:
+            connection = sqlite3.connect(
+                self.path, timeout=5, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS geocode_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS ix_geocode_cache_accessed_at "
+                "ON geocode_cache (accessed_at)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS geocode_lease ("
+                "key TEXT PRIMARY KEY, expires_at REAL NOT NULL)"
+            )
+            self._db = connection
+        return self._db
+
+    def _call(self, fn: Callable, *args) -> Any:
+        def locked():
+            with self._lock:
+                return fn(self._connection(), *args)
+
+        return self._execute(locked)
+
+    def get(self, key: str) -> Any:
+        return self._call(self._get, key)
+
+    def _get(self, connection: sqlite3.Connection, key: str) -> Any:
+        now = time.time()
+        row = connection.execute(
+            "SELECT value, accessed_at FROM geocode_cache WHERE key = ? AND expires_at > ?",
+            (key, now),
+        ).fetchone()
+        if row is None:
+            return _MISSING
+        if now - row[1] >= self.touch_interval:
+            connection.execute(
+                "UPDATE geocode_cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._call(self._set, key, json.dumps(value), ttl)
+
+    def _set(self, connection: sqlite3.Connection, key: str, value: str, ttl: float) -> None:
+        now = time.time()
+        connection.execute(
+            "INSERT OR REPLACE INTO geocode_cache (key, value, expires_at, accessed_at) "
+            "VALUES (?, ?, ?, ?)",
+            (key, value, now + ttl, now),
+        )
+        self._writes += 1
+        if self._writes % self._PRUNE_EVERY == 0:
+            self._prune(connection, now)
+
+    def prune(self, now: Optional[float] = None) -> None:
+        """Drop expired rows, then evict least recently used rows over the cap."""
+
+        self._call(self._prune, time.time() if now is None else now)
+
+    def _prune(self, connection: sqlite3.Connection, now: float) -> None:
+        connection.execute("DELETE FROM geocode_cache WHERE expires_at <= ?", (now,))
+        connection.execute("DELETE FROM geocode_lease WHERE expires_at <= ?", (now,))
+        connection.execute(
+            "DELETE FROM geocode_cache WHERE key IN ("
+            "SELECT key FROM geocode_cache ORDER BY accessed_at "
+            "LIMIT MAX((SELECT COUNT(*) FROM geocode_cache) - ?, 0))",
+            (self.max_entries,),
+        )
+
+    def acquire(self, key: str, ttl: float) -> bool:
+        return self._call(self._acquire, key, ttl)
+
+    def _acquire(self, connection: sqlite3.Connection, key: str, ttl: float) -> bool:
+        now = time.time()
+        connection.execute(
+            "DELETE FROM geocode_lease WHERE key = ? AND expires_at <= ?", (key, now)
+        )
+        cursor = connection.execute(
+            "INSERT OR IGNORE INTO geocode_lease (key, expires_at) VALUES (?, ?)",
+            (key, now + ttl),
+        )
+        return cursor.rowcount == 1
+
+    def release(self, key: str) -> None:
+        self._call(
+            lambda connection: connection.execute("DELETE FROM geocode_lease WHERE key = ?", (key,))
+        )
+
+
+class RedisStore:
+    """L2 tier shared across hosts through Redis.
+
+    Expiry uses Redis TTLs; size-based eviction is left to the server's
+    ``maxmemory-policy`` (``allkeys-lru`` or ``volatile-lru``).
+    """
+
+    def __init__(self, url: str, prefix: str = "geocode:"):
+        import redis
+
+        self._client = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def get(self, key: str) -> Any:
+        raw = self._client.get(self._prefix + key)
+        return _MISSING if raw is None else json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._client.set(self._prefix + key, json.dumps(value), ex=max(int(ttl), 1))
+
+    def acquire(self, key: str, ttl: float) -> bool:
+        return bool(
+            self._client.set(self._prefix + "lease:" + key, b"1", nx=True, px=int(ttl * 1000))
+        )
+
+    def release(self, key: str) -> None:
+        self._client.delete(self._prefix + "lease:" + key)
+
+
+class _Flight:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class CoalescingCache:
+    """Two-tier cache that makes at most one upstream call per key at a time.
+
+    Concurrent callers in the same process wait on the first caller's
+    result. Across processes, the caller that wins the L2 lease fetches while
+    the others poll L2 until it publishes or releases the lease (at most
+    ``lease_seconds``), then fetch themselves. ``None`` results (upstream
+    failures) are cached in both tiers for only ``negative_ttl`` seconds, so
+    waiters don't all retry during an outage but it is retried soon after.
+    """
+
+    def __init__(
+        self,
+        store=None,
+        ttl: float = 30 * 86400,
+        negative_ttl: float = 300,
+        l1_size: int = 4096,
+        lease_seconds: float = 10,
+        poll_interval: float = 0.05,
+    ):
+        self.store = store
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.local = LRUCache(l1_size)
+        self._flights: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def get_or_fetch(self, key: str, fetch: Callable[[], Any]) -> Any:
+        value = self.local.get(key)
+        if value is not _MISSING:
+            return value
+
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = self._load(key, fetch)
+            return flight.value
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    def _remember(self, key: str, value: Any) -> Any:
+        self.local.set(key, value, self.negative_ttl if value is None else self.ttl)
+        return value
+
+    def _load(self, key: str, fetch: Callable[[], Any]) -> Any:
+        value = self._store_call("get", key)
+        if value is not _MISSING:
+            return self._remember(key, value)
+
+        leased = self._store_call("acquire", key, self.lease_seconds)
+        if leased is False:
+            # Another process is fetching this key; wait for it to publish,
+            # or take over as soon as it lets go of the lease
+            deadline = time.monotonic() + self.lease_seconds
+            while time.monotonic() < deadline:
+                time.sleep(self.poll_interval)
+                value = self._store_call("get", key)
+                if value is not _MISSING:
+                    return self._remember(key, value)
+                leased = self._store_call("acquire", key, self.lease_seconds)
+                if leased is not False:
+                    # The holder may have published just before letting go
+                    value = self._store_call("get", key)
+                    if value is not _MISSING:
+                        if leased:
+                            self._store_call("release", key)
+                        return self._remember(key, value)
+                    break
+
+        try:
+            value = fetch()
+            # Publish before releasing so waiters never see the lease gone
+            # without a result; ``None`` is stored as a short-lived marker
+            self._store_call("set", key, value, self.negative_ttl if value is None else self.ttl)
+        finally:
+            if leased:
+                self._store_call("release", key)
+        return self._remember(key, value)
+
+    def _store_call(self, method: str, *args):
+        """Call the L2 store, treating any failure as a miss."""
+
+        if self.store is None:
+            return None if method == "acquire" else _MISSING
+        try:
+            return getattr(self.store, method)(*args)
+        except Exception as exc:
+            logger.warning("Geocode cache %s failed: %s", method, exc)
+            return None if method == "acquire" else _MISSING
+
+
+def build_store(url: Optional[str], default_path: str = DEFAULT_SQLITE_PATH, prefix: str = "geocode:"):
+    """Return the L2 store for ``url``.
+
+    ``redis://``/``rediss://`` URLs use Redis (keys under ``prefix``),
+    ``sqlite:///path`` uses that file, ``memory`` disables L2, and an empty
+    value uses the SQLite file at ``default_path``.
+    """
+
+    if not url:
+        return SQLiteStore(default_path)
+    if url == "memory":
+        return None
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisStore(url, prefix=prefix)
+    if url.startswith("sqlite:///"):
+        return SQLiteStore(url[len("sqlite:///"):])
+    raise ValueError(f"Unsupported cache URL: {url!r}")
+
+
+__all__ = [
+    "CoalescingCache",
+    "RedisStore",
+    "SQLiteStore",
+    "build_store",
+]
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import logging
+from typing import Iterator, List, Optional
+
+from flask import current_app
+from sqlalchemy import select
+
+from app.extensions import db, socketio
+from app.models import GroupChatMember, GroupMessage
+from app.notifications import create_notifications
+from app.socket_events import send_notifications
+from config import GROUP_FANOUT_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+def _recipient_batches(group_chat_id: int, sender_id: int, batch_size: int) -> Iterator[List[int]]:
+    """Member ids other than the sender, ``batch_size`` at a time, in id order.
+
+    Seeks the ``(group_chat_id, user_id)`` index after the last id of the
+    previous batch, so each batch is one short range read.
+    """
+
+    last_id = 0
+    while True:
+        user_ids = db.session.execute(
+            select(GroupChatMember.user_id)
+            .where(
+                GroupChatMember.group_chat_id == group_chat_id,
+                GroupChatMember.user_id > last_id,
+                GroupChatMember.user_id != sender_id,
+            )
+            .order_by(GroupChatMember.user_id)
+            .limit(batch_size)
+        ).scalars().all()
+        if not user_ids:
+            return
+        yield user_ids
+        if len(user_ids) < batch_size:
+            return
+        last_id = user_ids[-1]
+
+
+def _notification(message: GroupMessage):
+    group, sender = message.group_chat, message.sender
+    info = f"{sender.username} posted a new message in {group.name}."
+    return info, {
+        "type": "group_onboarding",
+        "group_chat_id": group.id,
+        "message": message.to_dict(sender=sender),
+        "info": info,
+    }
+
+
+def emit_group_notifications(group_chat_id: int, sender_id: int, notification_data: dict,
+                             batch_size: Optional[int] = None) -> int:
+    """Send ``notification_data`` in real time to every member but the sender."""
+
+    notified = 0
+    for user_ids in _recipient_batches(group_chat_id, sender_id, batch_size or GROUP_FANOUT_BATCH_SIZE):
+        send_notifications(user_ids, notification_data)
+        notified += len(user_ids)
+    return notified
+
+
+def start_group_notification_emits(message: GroupMessage, batch_size: Optional[int] = None) -> None:
+    """Emit ``message``'s real-time notifications from a Socket.IO background task.
+
+    Used when there is no Socket.IO message queue: only the web node holding
+    the sockets can deliver them, but the request only builds the payload
+    and the per-member emits run after it has returned.
+    """
+
+    app = current_app._get_current_object()
+    group_chat_id, sender_id = message.group_chat_id, message.sender_id
+    _info, notification_data = _notification(message)
+
+    def run():
+        with app.app_context():
+            try:
+                emit_group_notifications(group_chat_id, sender_id, notification_data, batch_size)
+            except Exception:
+                logger.exception(f"Emitting notifications for group {group_chat_id} failed")
+
+    socketio.start_background_task(run)
+
+
+def fan_out_group_message(message_id: int, batch_size: Optional[int] = None, emit: bool = True) -> int:
+    """Notify every other member of the message's group; returns recipients notified.
+
+    Runs off the request path (see ``app.tasks``). Each batch of recipients
+    gets its ``Notification`` rows in one bulk INSERT, one unread-counter
+    UPDATE and a commit, then, with ``emit``, its real-time emits. A message
+    deleted before the task ran notifies nobody.
+    """
+
+    message = db.session.get(GroupMessage, message_id)
+    if message is None:
+        logger.info(f"Group message {message_id} is gone; skipping fan-out")
+        return 0
+
+    info, notification_data = _notification(message)
+    notified = 0
+    for user_ids in _recipient_batches(
+        message.group_chat_id, message.sender_id, batch_size or GROUP_FANOUT_BATCH_SIZE
+    ):
+        create_notifications(user_ids, message.sender_id, "group_message", info)
+        db.session.commit()
+        if emit:
+            send_notifications(user_ids, notification_data)
+        notified += len(user_ids)
+
+    logger.info(f"Fanned out group message {message_id} to {notified} member(s)")
+    return notified
+
+
+__all__ = [
+    "emit_group_notifications",
+    "fan_out_group_message",
+    "start_group_notification_emits",
+]
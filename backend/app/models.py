@@ -13,6 +13,7 @@ from sqlalchemy import Enum as SQLEnum
 from sqlalchemy import Enum as SQLAlchemyEnum
 from enum import Enum
 from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import event
 from datetime import datetime, timezone
 
 class Comment(db.Model):
@@ -28,11 +29,25 @@ class Comment(db.Model):
     parent_id = db.Column(
         db.Integer, db.ForeignKey("comment.id"), nullable=True
     )  # Add this line
+    # Direct replies; maintained by app.counters, repaired by reconcile_counters
+    replies_count = db.Column(db.Integer, default=0, server_default="0", nullable=False)
 
     # Relationships
     user = db.relationship("User", backref="comments")
     parent = db.relationship("Comment", remote_side=[id], backref="replies")
 
+    __table_args__ = (
+        db.Index("ix_comment_content_id_created_at", "content_id", "created_at"),
+        # Replies are a minority of comments; top-level lookups never need them
+        db.Index(
+            "ix_comment_parent_id_created_at",
+            "parent_id",
+            "created_at",
+            postgresql_where=db.text("parent_id IS NOT NULL"),
+            sqlite_where=db.text("parent_id IS NOT NULL"),
+        ),
+    )
+
     def __repr__(self):
         return f"<Comment {self.id} Parent={self.parent_id}>"
 
@@ -153,6 +168,11 @@ class User(db.Model, UserMixin):
     accepted_terms_and_conditions = db.Column(db.Boolean, nullable=False, default=False)
     location = db.Column(db.String(255))
     show_home_location = db.Column(db.Boolean, default=True, nullable=False)
+    # Denormalized Follow counts; maintained by app.counters
+    followers_count = db.Column(db.Integer, default=0, server_default="0", nullable=False)
+    following_count = db.Column(db.Integer, default=0, server_default="0", nullable=False)
+    # Maintained by app.notifications so the badge never counts rows
+    unread_notifications_count = db.Column(db.Integer, default=0, server_default="0", nullable=False)
 
     @property
     def name(self) -> str:
@@ -269,6 +289,11 @@ class Reaction(db.Model):
 
     user = db.relationship("User", backref="reactions")
 
+    __table_args__ = (
+        db.Index("ix_reaction_content_id_reaction_type", "content_id", "reaction_type"),
+        db.Index("ix_reaction_user_id_content_id", "user_id", "content_id"),
+    )
+
     def __repr__(self):
         return f"<Reaction {self.id} {self.reaction_type.value}>"
 
@@ -292,6 +317,9 @@ class UserContent(db.Model):
     
     #  Fields for seeding
     news_link = db.Column(db.Text, nullable=True) 
+    # normalize_news_link(news_link) for ingested news; unique so concurrent
+    # fetchers can insert with ON CONFLICT DO NOTHING
+    news_link_key = db.Column(db.Text, nullable=True)
     is_seeded = db.Column(db.Boolean, default=False)
     seed_type = db.Column(db.String, nullable=True)  # e.g. 'news', 'seed'
     seeded_likes_count = db.Column(db.Integer, default=0)
@@ -299,6 +327,12 @@ class UserContent(db.Model):
 
     user = db.relationship("User", backref="user_content")
 
+    __table_args__ = (
+        db.Index("uq_user_content_news_link_key", "news_link_key", unique=True),
+        db.Index("ix_user_content_is_in_seattle_created_at", "is_in_seattle", "created_at"),
+        db.Index("ix_user_content_user_id_created_at", "user_id", "created_at"),
+    )
+
     def __repr__(self):
         return f"<UserContent {self.id} {self.title} at {self.location}>"
 
@@ -337,12 +371,68 @@ class UserContent(db.Model):
         }
 
 
+class ContentScore(db.Model):
+    """
+    Materialized engagement score for a single UserContent row.
+    Counts are maintained incrementally by the reaction/comment/share write
+    paths and ``score`` is re-decayed periodically by a Celery task.
+    """
+
+    __tablename__ = "content_scores"
+
+    content_id = db.Column(
+        db.Integer,
+        db.ForeignKey("user_content.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    reactions_count = db.Column(db.Integer, default=0, nullable=False)
+    comments_count = db.Column(db.Integer, default=0, nullable=False)
+    shares_count = db.Column(db.Integer, default=0, nullable=False)
+    reposts_count = db.Column(db.Integer, default=0, server_default="0", nullable=False)  # Not scored
+    raw_score = db.Column(db.Float, default=0.0, nullable=False)  # Weighted, undecayed
+    score = db.Column(db.Float, default=0.0, nullable=False)  # raw_score with time decay
+    content_created_at = db.Column(db.DateTime, nullable=True)  # Copied for decay
+    updated_at = db.Column(
+        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    __table_args__ = (
+        db.Index("ix_content_scores_score_content_id", "score", "content_id"),
+    )
+
+    def __repr__(self):
+        return f"<ContentScore content_id={self.content_id} score={self.score}>"
+
+
+@event.listens_for(UserContent, "after_insert")
+def _create_content_score(mapper, connection, target):
+    """Every post gets a zero score row so the feed can inner-join on it."""
+    connection.execute(
+        ContentScore.__table__.insert().values(
+            content_id=target.id,
+            reactions_count=0,
+            comments_count=0,
+            shares_count=0,
+            reposts_count=0,
+            raw_score=0.0,
+            score=0.0,
+            content_created_at=target.created_at,
+            updated_at=datetime.utcnow(),
+        )
+    )
+
+
 class Follow(db.Model):
     __tablename__ = "follow"
     follower_id = db.Column(db.Integer, db.ForeignKey("users.id"), primary_key=True)
     followed_id = db.Column(db.Integer, db.ForeignKey("users.id"), primary_key=True)
     timestamp = db.Column(db.DateTime, default=datetime.utcnow)
 
+    # The primary key covers lookups by follower; this one covers "followers of"
+    __table_args__ = (
+        db.Index("ix_follow_followed_id_follower_id", "followed_id", "follower_id"),
+    )
+
     def __repr__(self):
         return f"<Follow follower={self.follower_id} followed={self.followed_id}>"
 
@@ -353,6 +443,11 @@ class Block(db.Model):
     blocked_id = db.Column(db.Integer, db.ForeignKey("users.id"), primary_key=True)
     timestamp = db.Column(db.DateTime, default=datetime.utcnow)
 
+    # The primary key covers lookups by blocker; this one covers "blocked by"
+    __table_args__ = (
+        db.Index("ix_block_blocked_id_blocker_id", "blocked_id", "blocker_id"),
+    )
+
     def __repr__(self):
         return f"<Block blocker={self.blocker_id} blocked={self.blocked_id}>"
 
@@ -517,6 +612,7 @@ class Notification(db.Model):
             "content_reaction",
             "comment_reaction",
             "comment_reply",
+            "group_message",
             name="notification_type",
         ),
         nullable=False,
@@ -526,6 +622,21 @@ class Notification(db.Model):
     is_read = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # The inbox pages newest first on (created_at, id) within one user
+        db.Index("ix_notification_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Unread filters and counts only read the unread rows; each dialect
+        # spells the literal the way its queries compare is_read
+        db.Index(
+            "ix_notification_user_id_unread_created_at_id",
+            "user_id",
+            "created_at",
+            "id",
+            postgresql_where=db.text("is_read = false"),
+            sqlite_where=db.text("is_read = 0"),
+        ),
+    )
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -637,6 +748,15 @@ class DirectChat(db.Model):
     created_at = db.Column(
         db.DateTime, default=datetime.utcnow
     )  # Timestamp when the chat was created
+    # Newest message, maintained by app.chat_inbox when messages are sent or
+    # deleted (no foreign key: direct_messages already references this table)
+    last_message_id = db.Column(db.Integer, nullable=True)
+    last_message_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        db.Index("ix_direct_chats_user1_id_last_message_at", "user1_id", "last_message_at", "id"),
+        db.Index("ix_direct_chats_user2_id_last_message_at", "user2_id", "last_message_at", "id"),
+    )
 
     # Relationships
     user1 = db.relationship(
@@ -690,7 +810,13 @@ class DirectMessage(db.Model):
     )  # Links message to its chat
     sender = db.relationship("User")  # Links sender to the User table
 
-    def to_dict(self):
+    __table_args__ = (
+        db.Index("ix_direct_messages_chat_id_created_at_id", "chat_id", "created_at", "id"),
+    )
+
+    def to_dict(self, sender=None):
+        # Pass ``sender`` when it was loaded in bulk (see app.chat_history)
+        sender = sender or self.sender
         return {
             "id": self.id,
             "chat_id": self.chat_id,
@@ -698,12 +824,12 @@ class DirectMessage(db.Model):
             "content": self.content,
             "created_at": self.created_at.isoformat(),
             "sender": {
-                "id": self.sender.id,
-                "first_name": self.sender.first_name,
-                "last_name": self.sender.last_name,
-                "username": self.sender.username,
-                "email": self.sender.email,
-                "profile_picture_url": self.sender.profile_picture_url or "",
+                "id": sender.id,
+                "first_name": sender.first_name,
+                "last_name": sender.last_name,
+                "username": sender.username,
+                "email": sender.email,
+                "profile_picture_url": sender.profile_picture_url or "",
             },
         }
 
@@ -724,6 +850,13 @@ class GroupChat(db.Model):
     created_at = db.Column(
         db.DateTime, default=datetime.utcnow
     )  # Timestamp when the group was created
+    # Newest message, maintained by app.chat_inbox (see DirectChat)
+    last_message_id = db.Column(db.Integer, nullable=True)
+    last_message_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        db.Index("ix_group_chats_last_message_at", "last_message_at", "id"),
+    )
 
     # Relationships
     messages = db.relationship(
@@ -778,6 +911,11 @@ class GroupChatMember(db.Model):
     )  # Link to the group chat
     user = db.relationship("User")  # Link to the user
 
+    __table_args__ = (
+        db.Index("ix_group_chat_members_group_chat_id_user_id", "group_chat_id", "user_id"),
+        db.Index("ix_group_chat_members_user_id_group_chat_id", "user_id", "group_chat_id"),
+    )
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -814,10 +952,16 @@ class GroupMessage(db.Model):
     )  # Links message to its group chat
     sender = db.relationship("User")  # Links sender to the User table
 
+    __table_args__ = (
+        db.Index("ix_group_messages_group_chat_id_created_at_id", "group_chat_id", "created_at", "id"),
+    )
+
     # ✅ New field for soft delete (only for sender)
     deleted_for_sender = db.Column(db.Boolean, default=False)
 
-    def to_dict(self):
+    def to_dict(self, sender=None):
+        # Pass ``sender`` when it was loaded in bulk (see app.chat_history)
+        sender = sender or self.sender
         return {
             "id": self.id,
             "group_chat_id": self.group_chat_id,
@@ -825,11 +969,11 @@ class GroupMessage(db.Model):
             "content": self.content,
             "created_at": self.created_at.isoformat(),
             "sender": {
-                "id": self.sender.id,
-                "first_name": self.sender.first_name,
-                "last_name": self.sender.last_name,
-                "username": self.sender.username,
-                "profile_picture_url": self.sender.profile_picture_url
+                "id": sender.id,
+                "first_name": sender.first_name,
+                "last_name": sender.last_name,
+                "username": sender.username,
+                "profile_picture_url": sender.profile_picture_url
             }
         }
 
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, insert, select, update
+
+from app.extensions import db
+from app.models import Notification, User
+from app.pagination import fetch_keyset_page
+from app.user_cache import invalidate_after_commit
+
+
+def _adjust_unread(user_id: int, delta: int) -> None:
+    if delta:
+        db.session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(unread_notifications_count=User.unread_notifications_count + delta)
+        )
+        invalidate_after_commit(user_id)
+
+
+def _scoped(statement, user_id: int, ids: Optional[Iterable[int]]):
+    statement = statement.where(Notification.user_id == user_id)
+    if ids is not None:
+        statement = statement.where(Notification.id.in_(list(ids)))
+    return statement
+
+
+def create_notification(
+    user_id: int,
+    sender_id: int,
+    type: str,
+    content: str,
+    post_id: Optional[int] = None,
+) -> Notification:
+    """Add an unread notification and bump the recipient's unread counter.
+
+    The caller commits, so the row and the counter land together.
+    """
+
+    notification = Notification(
+        user_id=user_id,
+        sender_id=sender_id,
+        type=type,
+        content=content,
+        post_id=post_id,
+        is_read=False,
+    )
+    db.session.add(notification)
+    _adjust_unread(user_id, 1)
+    return notification
+
+
+def create_notifications(
+    user_ids: Sequence[int],
+    sender_id: int,
+    type: str,
+    content: str,
+    post_id: Optional[int] = None,
+) -> int:
+    """``create_notification`` for many recipients: one bulk INSERT, one counter UPDATE.
+
+    ``user_ids`` must be distinct. Returns the number of rows added; the
+    caller commits.
+    """
+
+    if not user_ids:
+        return 0
+    created_at = datetime.utcnow()
+    db.session.execute(
+        insert(Notification),
+        [
+            {
+                "user_id": user_id,
+                "sender_id": sender_id,
+                "type": type,
+                "content": content,
+                "post_id": post_id,
+                "is_read": False,
+                "created_at": created_at,
+            }
+            for user_id in user_ids
+        ],
+    )
+    db.session.execute(
+        update(User)
+        .where(User.id.in_(user_ids))
+        .values(unread_notifications_count=User.unread_notifications_count + 1),
+        execution_options={"synchronize_session": False},
+    )
+    invalidate_after_commit(*user_ids)
+    return len(user_ids)
+
+
+def unread_count(user_id: int) -> int:
+    """Return the maintained unread counter (a primary-key lookup)."""
+
+    count = db.session.execute(
+        select(User.unread_notifications_count).where(User.id == user_id)
+    ).scalar()
+    return max(count or 0, 0)
+
+
+def fetch_notifications_page(
+    user_id: int,
+    after: Optional[Sequence],
+    per_page: int,
+    unread_only: bool = False,
+) -> Tuple[List[Notification], bool]:
+    """Return ``(notifications, has_next)`` newest first, after the ``(created_at, id)`` key."""
+
+    query = Notification.query.filter(Notification.user_id == user_id)
+    if unread_only:
+        query = query.filter(Notification.is_read == False)
+    return fetch_keyset_page(
+        query, (Notification.created_at, Notification.id), after, per_page
+    )
+
+
+def mark_read(user_id: int, ids: Optional[Iterable[int]] = None) -> int:
+    """Mark ``ids`` (or every notification) of ``user_id`` read in one UPDATE.
+
+    Returns the number of notifications that were unread; the caller commits.
+    """
+
+    result = db.session.execute(
+        _scoped(update(Notification), user_id, ids)
+        .where(Notification.is_read == False)
+        .values(is_read=True),
+        execution_options={"synchronize_session": False},
+    )
+    _adjust_unread(user_id, -result.rowcount)
+    return result.rowcount
+
+
+def delete_notifications(user_id: int, ids: Optional[Iterable[int]] = None) -> int:
+    """Delete ``ids`` (or every notification) of ``user_id`` in one DELETE.
+
+    Returns the number of rows deleted; the caller commits.
+    """
+
+    deleted = db.session.execute(
+        _scoped(delete(Notification), user_id, ids).returning(Notification.is_read),
+        execution_options={"synchronize_session": False},
+    ).scalars().all()
+    _adjust_unread(user_id, -sum(1 for is_read in deleted if not is_read))
+    return len(deleted)
+
+
+__all__ = [
+    "create_notification",
+    "create_notifications",
+    "delete_notifications",
+    "fetch_notifications_page",
+    "mark_read",
+    "unread_count",
+]
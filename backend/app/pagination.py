@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import tuple_
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Return an opaque, URL-safe cursor for the given sort key values."""
+
+    payload = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], size: int) -> Optional[List[Any]]:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    An empty or missing cursor means "first page" and returns ``None``.
+    """
+
+    if not cursor:
+        return None
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != size:
+            raise ValueError("unexpected cursor shape")
+        return [_decode_value(value) for value in values]
+    except (ValueError, TypeError, binascii.Error, UnicodeError) as exc:
+        raise InvalidCursor("Invalid pagination cursor") from exc
+
+
+def fetch_keyset_page(query, order_columns: Sequence[Any], after, per_page: int) -> Tuple[list, bool]:
+    """Fetch one page of ``query`` ordered descending by ``order_columns``.
+
+    ``after`` holds the sort key of the last row of the previous page (or
+    ``None`` for the first page). One extra row is fetched to compute
+    ``has_next`` so no ``COUNT`` is needed.
+    """
+
+    if after is not None:
+        query = query.filter(tuple_(*order_columns) < tuple_(*after))
+
+    rows = (
+        query.order_by(*[column.desc() for column in order_columns])
+        .limit(per_page + 1)
+        .all()
+    )
+    return rows[:per_page], len(rows) > per_page
+
+
+def cursor_pagination(next_cursor: Optional[str], has_next: bool, per_page: int) -> dict:
+    """Build the ``pagination`` block returned in cursor mode."""
+
+    return {
+        "mode": "cursor",
+        "per_page": per_page,
+        "has_next": has_next,
+        "next_cursor": next_cursor if has_next else None,
+    }
+
+
+__all__ = [
+    "InvalidCursor",
+    "cursor_pagination",
+    "decode_cursor",
+    "encode_cursor",
+    "fetch_keyset_page",
+]
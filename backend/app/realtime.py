@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import logging
+import pickle
+import queue
+import threading
+from typing import Any, Dict, List, Optional
+
+import socketio
+
+from config import SOCKETIO_CHANNEL, SOCKETIO_MESSAGE_QUEUE
+
+from .extensions import socketio as flask_socketio
+
+logger = logging.getLogger(__name__)
+
+_bus: Dict[str, List[queue.Queue]] = {}
+_bus_lock = threading.Lock()
+
+_publisher: Optional[socketio.PubSubManager] = None
+_publisher_lock = threading.Lock()
+
+
+class LocalPubSubManager(socketio.PubSubManager):
+    """Pub/sub client manager backed by an in-process bus.
+
+    Every manager on the same channel in this process sees the others'
+    messages, which is enough to run several Socket.IO servers side by side
+    in tests and benchmarks. Messages are pickled like ``RedisManager`` does,
+    so payloads that would not survive a real queue fail here too.
+    """
+
+    name = "local"
+
+    def __init__(self, url: str = "memory://", channel: str = SOCKETIO_CHANNEL,
+                 write_only: bool = False, logger=None):
+        super().__init__(channel=channel, write_only=write_only, logger=logger)
+        self._inbox: queue.Queue = queue.Queue()
+
+    def initialize(self):
+        if not self.write_only:
+            with _bus_lock:
+                _bus.setdefault(self.channel, []).append(self._inbox)
+        super().initialize()
+
+    def close(self) -> None:
+        """Unsubscribe from the bus; the (daemon) listener then stays idle."""
+        with _bus_lock:
+            subscribers = _bus.get(self.channel, [])
+            if self._inbox in subscribers:
+                subscribers.remove(self._inbox)
+
+    def _publish(self, data):
+        message = pickle.dumps(data)
+        with _bus_lock:
+            subscribers = list(_bus.get(self.channel, []))
+        for inbox in subscribers:
+            inbox.put(message)
+
+    def _listen(self):
+        while True:
+            yield self._inbox.get()
+
+
+def client_manager(url: str, channel: str = SOCKETIO_CHANNEL,
+                   write_only: bool = False) -> Optional[socketio.PubSubManager]:
+    """Build the client manager for a message queue URL (``None`` when unset)."""
+
+    if not url:
+        return None
+    if url.startswith("memory://"):
+        return LocalPubSubManager(url, channel=channel, write_only=write_only)
+    if url.startswith(("redis://", "rediss://")):
+        return socketio.RedisManager(url, channel=channel, write_only=write_only)
+    return socketio.KombuManager(url, channel=channel, write_only=write_only)
+
+
+def socketio_options() -> Dict[str, Any]:
+    """Keyword arguments for ``socketio.init_app`` on a realtime node.
+
+    With a message queue configured, emits from any node are published and
+    delivered by whichever node holds the addressed sockets.
+    """
+
+    manager = client_manager(SOCKETIO_MESSAGE_QUEUE)
+    return {"client_manager": manager} if manager is not None else {}
+
+
+def _external_publisher() -> Optional[socketio.PubSubManager]:
+    global _publisher
+
+    with _publisher_lock:
+        if _publisher is None:
+            _publisher = client_manager(SOCKETIO_MESSAGE_QUEUE, write_only=True)
+        return _publisher
+
+
+def has_message_queue() -> bool:
+    """Whether emits from this process can reach sockets held by other processes."""
+
+    return bool(SOCKETIO_MESSAGE_QUEUE)
+
+
+def _deliverable(server, event: str, to: Optional[str]) -> bool:
+    # A pub/sub manager forwards to the other nodes; a plain one only has
+    # the sockets connected to this process (none in a Celery worker)
+    if isinstance(server.manager, socketio.PubSubManager):
+        return True
+    rooms = server.manager.rooms.get("/", {})
+    if not rooms:
+        logger.warning("No sockets on this node and no message queue; dropping %s", event)
+        return False
+    if to is not None and to not in rooms:
+        logger.debug("Room %s is not on this node; dropping %s", to, event)
+        return False
+    return True
+
+
+def emit(event: str, data: Any, to: Optional[str] = None) -> bool:
+    """Emit a Socket.IO event from any process; returns whether it was sent.
+
+    Web nodes emit through their own server (which fans out over the queue
+    when one is configured). Processes without one, like Celery workers or
+    the news Lambda, publish through a write-only queue client. Without a
+    queue only sockets connected to this process can be reached, so events
+    for anyone else are dropped and ``False`` is returned.
+    """
+
+    server = flask_socketio.server
+    if server is not None:
+        if not _deliverable(server, event, to):
+            return False
+        flask_socketio.emit(event, data, to=to)
+        return True
+
+    publisher = _external_publisher()
+    if publisher is None:
+        logger.warning("No Socket.IO server or message queue; dropping %s", event)
+        return False
+    publisher.emit(event, data, namespace="/", room=to)
+    return True
+
+
+__all__ = [
+    "LocalPubSubManager",
+    "client_manager",
+    "emit",
+    "has_message_queue",
+    "socketio_options",
+]
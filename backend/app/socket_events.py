@@ -1,7 +1,10 @@
 import logging
 from flask import request
+from flask_login import current_user
+from flask_socketio import join_room
 from .models import Notification
 from .extensions import socketio  # Import socketio from extensions
+from . import realtime
 
 # Setup Logger
 socket_logger = logging.getLogger("socketio")
@@ -12,10 +15,24 @@ handler.setFormatter(formatter)
 socket_logger.addHandler(handler)
 
 
+def user_room(user_id):
+    """Name of the room every socket of ``user_id`` joins on connect."""
+    return f"user_{user_id}"
+
+
 @socketio.on("connect")
-def handle_connect():
-    """Handles a new socket connection."""
-    socket_logger.info(f"✅ Client connected: {request.sid}")
+def handle_connect(auth=None):
+    """Handles a new socket connection.
+
+    Only logged-in sessions may connect; each socket joins its user's room so
+    notifications are delivered to that user's sockets instead of broadcast.
+    """
+    if not current_user.is_authenticated:
+        socket_logger.info(f"⛔ Rejected unauthenticated client: {request.sid}")
+        return False
+
+    join_room(user_room(current_user.id))
+    socket_logger.info(f"✅ Client connected: {request.sid} (user {current_user.id})")
 
 
 @socketio.on("disconnect")
@@ -44,18 +61,26 @@ def handle_message(data):
 
 def send_notification(user_id, notification_data):
     """Emit notification event to a specific user."""
-    try:
-        event_name = f"notify_{user_id}"
-        socket_logger.info(f"🔔 Sending notification event: {event_name}")
+    send_notifications([user_id], notification_data)
 
-        socketio.emit(event_name, notification_data)
 
-        socket_logger.info(f"✅ Notification {event_name} sent successfully.")
+def send_notifications(user_ids, notification_data):
+    """Emit ``notification_data`` to each user in ``user_ids``.
 
-    except Exception as e:
-        socket_logger.error(
-            f"⚠️ Error sending notification {event_name}: {e}", exc_info=True
-        )
+    Each recipient gets exactly one emit addressed to its ``user_<id>`` room,
+    so the cost scales with recipients rather than with connected clients.
+    Duplicate ids are sent once.
+    """
+    recipients = list(dict.fromkeys(user_ids))
+    for user_id in recipients:
+        try:
+            realtime.emit(f"notify_{user_id}", notification_data, to=user_room(user_id))
+        except Exception as e:
+            socket_logger.error(
+                f"⚠️ Error sending notification to user {user_id}: {e}", exc_info=True
+            )
+
+    socket_logger.info(f"🔔 Notification sent to {len(recipients)} user room(s).")
 
 
 @socketio.on("private_message")
@@ -70,7 +95,7 @@ def handle_private_message(data):
     socketio.emit(
         f"chat_{receiver_id}",
         {"sender_id": request.sid, "message": message},
-        room=f"user_{receiver_id}",
+        room=user_room(receiver_id),
     )
 
 
@@ -136,9 +161,9 @@ def broadcast_group_message(group_chat_id, message):
     """
     Broadcasts a message to the group chat room.
     """
-    socketio.emit(
+    realtime.emit(
         f"group_chat_{group_chat_id}",
         {"message": message},
-        room=f"group_{group_chat_id}",
+        to=f"group_{group_chat_id}",
     )
     socket_logger.info(f"📤 Message broadcasted to room group_chat_{group_chat_id}")
@@ -0,0 +1,43 @@
+import logging
+import time
+
+from app import celery
+from app.counters import reconcile_counters as reconcile_all_counters
+from app.engagement_scores import decay_content_scores
+from app.group_fanout import fan_out_group_message as fan_out
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+@celery.task(name="app.tasks.refresh_content_scores")
+def refresh_content_scores():
+    """Re-apply time decay to the materialized feed scores."""
+    start_time = time.time()
+    updated = decay_content_scores()
+    logger.info(
+        f"Re-decayed {updated} content scores in {time.time() - start_time:.2f} seconds"
+    )
+    return updated
+
+
+@celery.task(name="app.tasks.reconcile_counters")
+def reconcile_counters():
+    """Repair drift in the follower, reply and per-post counter columns."""
+    start_time = time.time()
+    repaired = reconcile_all_counters()
+    logger.info(
+        f"Reconciled counters in {time.time() - start_time:.2f} seconds: {repaired}"
+    )
+    return repaired
+
+
+@celery.task(name="app.tasks.fan_out_group_message", ignore_result=True)
+def fan_out_group_message(message_id, emit=True):
+    """Notify the other members of a group about a new message."""
+    start_time = time.time()
+    notified = fan_out(message_id, emit=emit)
+    logger.info(
+        f"Notified {notified} member(s) of group message {message_id} in {time.time() - start_time:.2f} seconds"
+    )
+    return notified
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from flask import current_app, has_app_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from config import USER_CACHE_INVALIDATION_URL, USER_CACHE_TTL_SECONDS
+
+from .extensions import db
+from .local_cache import MISSING, LRUCache
+from .models import User
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "seattlepulse:user-cache"
+# Published instead of ids when every cached user must be reloaded
+ALL_USERS = "*"
+
+_snapshots = LRUCache(maxsize=10_000)
+# When each user was last invalidated in this process, so a load that raced
+# an invalidation is not cached
+_invalidated = LRUCache(maxsize=10_000)
+_bus: Any = MISSING
+_bus_lock = threading.Lock()
+
+_local_subscribers: Dict[str, List[Callable]] = {}
+_local_lock = threading.Lock()
+
+
+class LocalInvalidationBus:
+    """In-process bus for ``memory://``: reaches only this process (tests, one dev server)."""
+
+    def __init__(self, channel: str = INVALIDATION_CHANNEL):
+        self.channel = channel
+        self._handler: Optional[Callable] = None
+
+    def subscribe(self, handler: Callable[[list], None]) -> None:
+        self._handler = handler
+        with _local_lock:
+            _local_subscribers.setdefault(self.channel, []).append(handler)
+
+    def publish(self, user_ids: list) -> None:
+        with _local_lock:
+            handlers = list(_local_subscribers.get(self.channel, []))
+        for handler in handlers:
+            handler(json.loads(json.dumps(user_ids)))
+
+    def close(self) -> None:
+        with _local_lock:
+            handlers = _local_subscribers.get(self.channel, [])
+            if self._handler in handlers:
+                handlers.remove(self._handler)
+
+
+class RedisInvalidationBus:
+    """Redis pub/sub: every process subscribes and drops the users any node invalidates.
+
+    Messages sent while a subscriber is disconnected are lost, so a dropped
+    connection clears that process's snapshots; the TTL bounds anything
+    cached during the reconnect.
+    """
+
+    def __init__(self, url: str, channel: str = INVALIDATION_CHANNEL):
+        import redis
+
+        self.channel = channel
+        self._client = redis.Redis.from_url(url)
+        self._thread = None
+
+    def subscribe(self, handler: Callable[[list], None]) -> None:
+        def on_message(message):
+            handler(json.loads(message["data"]))
+
+        def on_error(exc, pubsub, thread):
+            logger.warning("User cache invalidation subscription failed: %s", exc)
+            clear_user_cache()
+            time.sleep(1)
+
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{self.channel: on_message})
+        self._thread = pubsub.run_in_thread(sleep_time=1, daemon=True, exception_handler=on_error)
+
+    def publish(self, user_ids: list) -> None:
+        self._client.publish(self.channel, json.dumps(user_ids))
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._thread.stop()
+
+
+def build_bus(url: Optional[str]):
+    """Return the invalidation bus for ``url`` (``None`` when unset, which disables the cache)."""
+
+    if not url:
+        return None
+    if url.startswith("memory://"):
+        bus = LocalInvalidationBus()
+    elif url.startswith(("redis://", "rediss://", "unix://")):
+        bus = RedisInvalidationBus(url)
+    else:
+        raise ValueError(f"Unsupported user cache invalidation URL: {url!r}")
+    bus.subscribe(_forget)
+    return bus
+
+
+def _invalidation_bus():
+    global _bus
+    with _bus_lock:
+        if _bus is MISSING:
+            try:
+                _bus = build_bus(USER_CACHE_INVALIDATION_URL)
+            except Exception as exc:
+                logger.warning("User cache disabled, invalidation bus unavailable: %s", exc)
+                _bus = None
+        return _bus
+
+
+def _ttl() -> float:
+    if not has_app_context():
+        return USER_CACHE_TTL_SECONDS
+    return float(current_app.config.get("USER_CACHE_TTL_SECONDS", USER_CACHE_TTL_SECONDS))
+
+
+def _forget(user_ids: list) -> None:
+    """Drop snapshots invalidated by this or another node."""
+    if ALL_USERS in user_ids:
+        clear_user_cache()
+        return
+    now = time.monotonic()
+    for user_id in user_ids:
+        _snapshots.delete(str(user_id))
+        _invalidated.set(str(user_id), now, max(_ttl(), 1))
+
+
+def _snapshot(user: User) -> Dict:
+    return {column.key: getattr(user, column.key) for column in User.__mapper__.column_attrs}
+
+
+def _attach(snapshot: Dict) -> User:
+    """Rebuild a ``User`` from its column values and add it to the session without a query.
+
+    Relationships (followers, blocks, ...) are left unloaded and load from the
+    database on first access, so only the row itself is ever stale.
+    """
+    user = User.__mapper__.class_manager.new_instance()
+    for key, value in snapshot.items():
+        set_committed_value(user, key, value)
+    make_transient_to_detached(user)
+    return db.session.merge(user, load=False)
+
+
+def load_session_user(user_id: int) -> Optional[User]:
+    """Flask-Login ``user_loader``: the user's row, from the cache when fresh.
+
+    Snapshots live for ``USER_CACHE_TTL_SECONDS`` in this process and are
+    dropped early when any node publishes an invalidation for the user. The
+    cache is off without ``USER_CACHE_INVALIDATION_URL`` (other nodes could
+    not reach it) or with a TTL of 0.
+    """
+    ttl = _ttl()
+    if ttl <= 0 or _invalidation_bus() is None:
+        return db.session.get(User, user_id)
+
+    key = str(user_id)
+    cached = _snapshots.get(key)
+    if cached is not MISSING:
+        return _attach(cached)
+
+    started = time.monotonic()
+    user = db.session.get(User, user_id)
+    if user is not None and _invalidated.get(key, 0) < started:
+        _snapshots.set(key, _snapshot(user), ttl)
+    return user
+
+
+def invalidate_user(*user_ids) -> None:
+    """Make every node reload these users (or all users, given ``ALL_USERS``).
+
+    Call after the commit that changed them, so no node can cache the old
+    row again once the message arrives.
+    """
+    user_ids = list(user_ids)
+    if not user_ids:
+        return
+    _forget(user_ids)
+    bus = _invalidation_bus()
+    if bus is None:
+        return
+    try:
+        bus.publish(user_ids)
+    except Exception as exc:
+        logger.warning("User cache invalidation publish failed: %s", exc)
+
+
+def invalidate_after_commit(*user_ids) -> None:
+    """Invalidate users changed by Core ``UPDATE``s once the session commits.
+
+    ORM updates and deletes of ``User`` are tracked automatically; bulk
+    statements such as counter increments bypass those events and call this.
+    """
+    db.session.info.setdefault("changed_user_ids", set()).update(user_ids)
+
+
+def clear_user_cache() -> None:
+    _snapshots.clear()
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_changed_user(mapper, connection, target):
+    _snapshots.delete(str(target.id))
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault("changed_user_ids", set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session):
+    user_ids = session.info.pop("changed_user_ids", None)
+    if user_ids:
+        invalidate_user(*(ALL_USERS,) if ALL_USERS in user_ids else user_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_users(session):
+    session.info.pop("changed_user_ids", None)
+
+
+__all__ = [
+    "ALL_USERS",
+    "LocalInvalidationBus",
+    "RedisInvalidationBus",
+    "build_bus",
+    "clear_user_cache",
+    "invalidate_after_commit",
+    "invalidate_user",
+    "load_session_user",
+]
@@ -9,17 +9,21 @@ from datetime import datetime, timedelta
 from functools import lru_cache
 from typing import Dict, Optional
 
-import geopandas as gpd
-import osmnx as ox
 import requests
 from dateutil import parser
 from flask import current_app, render_template, url_for
 from flask_mail import Message
-from shapely.geometry import Point
-from shapely.ops import nearest_points
 from werkzeug.utils import secure_filename
 
 from .extensions import mail
+from .geocode_cache import CoalescingCache, build_store as build_geocode_store
+from .geo_snapshot import (
+    LAYER_BOUNDARY,
+    LAYER_NEIGHBORHOODS,
+    SnapshotUnavailable,
+    fetch_live_layer,
+    load_layer as load_snapshot_layer,
+)
 from .models import News
 from .models import db
 from app.fetchers.search_providers import GoogleImageSearchProvider
@@ -29,6 +33,9 @@ from config import (
     PLACEHOLDER_IMAGE_UNAVAILABLE,
     NOMINATIM_BASE_URL,
     GOOGLE_CUSTOM_SEARCH_API_URL,
+    REVERSE_GEOCODE_CACHE_TTL_SECONDS,
+    REVERSE_GEOCODE_CACHE_URL,
+    SEATTLE_GEO_LIVE_FALLBACK,
     IPINFO_API_URL,
     get_frontend_url,
     get_survey_url,
@@ -338,20 +345,33 @@ def _reverse_geocode_uncached(lat: float, lon: float) -> Optional[Dict[str, str]
     return None
 
 
-@lru_cache(maxsize=512)
-def _reverse_geocode_cached(lat: float, lon: float) -> Optional[Dict[str, str]]:
-    return _reverse_geocode_uncached(lat, lon)
+_reverse_geocode_cache = CoalescingCache(
+    store=build_geocode_store(REVERSE_GEOCODE_CACHE_URL),
+    ttl=REVERSE_GEOCODE_CACHE_TTL_SECONDS,
+)
 
 
 def _reverse_geocode_with_cache(lat: float, lon: float) -> Optional[Dict[str, str]]:
-    return _reverse_geocode_cached(
-        _quantize_coordinate(lat),
-        _quantize_coordinate(lon),
+    lat, lon = _quantize_coordinate(lat), _quantize_coordinate(lon)
+    precision = _REVERSE_GEOCODE_CACHE_PRECISION
+    return _reverse_geocode_cache.get_or_fetch(
+        f"reverse:z14:{lat:.{precision}f},{lon:.{precision}f}",
+        lambda: _reverse_geocode_uncached(lat, lon),
     )
 
 
 def get_neighborhood(lat, lon):
-    """Return a canonical location label for a coordinate."""
+    """Return a canonical location label for a coordinate.
+
+    Points inside the Seattle boundary are labelled from the local
+    neighborhood polygons without a network call; the remote reverse
+    geocoder is only used for points outside Seattle, or when the polygons
+    are unavailable.
+    """
+
+    in_seattle_by_boundary = bool(is_coordinate_in_seattle(lat, lon))
+    if in_seattle_by_boundary and len(_seattle_layer(LAYER_NEIGHBORHOODS)[1]):
+        return get_seattle_neighborhood(lat, lon) or "Seattle"
 
     try:
         address = _reverse_geocode_with_cache(lat, lon)
@@ -396,9 +416,6 @@ def get_neighborhood(lat, lon):
             and (country_code == "us" or (address.get("country") or "").lower().startswith("united states"))
         )
 
-    # Use boundary check as fallback if address data is unclear
-    in_seattle_by_boundary = bool(is_coordinate_in_seattle(lat, lon))
-    
     # Consider it in Seattle if either check indicates so
     # Prioritize boundary check if it's True, as it's more definitive
     in_seattle = in_seattle_by_boundary or in_seattle_by_address
@@ -406,8 +423,8 @@ def get_neighborhood(lat, lon):
     if in_seattle:
         # Use OSM neighborhood boundaries for more accurate neighborhood names
         # This matches what the search API uses and is more reliable than reverse geocoding
-        if not _seattle_neighborhoods.empty:
-            seattle_neighborhood = get_seattle_neighborhood(lat, lon, _seattle_neighborhoods)
+        if len(_seattle_layer(LAYER_NEIGHBORHOODS)[1]):
+            seattle_neighborhood = get_seattle_neighborhood(lat, lon)
             if seattle_neighborhood:
                 return seattle_neighborhood
         
@@ -464,55 +481,112 @@ def is_valid_e164_phone(phone: str) -> bool:
     return bool(re.fullmatch(PHONE_REGEX, phone))
 
 
+def _skip_seattle_neighborhoods():
+    return (
+        os.getenv("APP_ENV", "").lower() == "testing"
+        or os.getenv("SKIP_SEATTLE_NEIGHBORHOODS", "false").lower() == "true"
+    )
+
+
+def _empty_layer():
+    import geopandas as gpd
+
+    return gpd.GeoDataFrame()
+
+
+def _load_seattle_layer(name):
+    try:
+        return load_snapshot_layer(name)
+    except SnapshotUnavailable as exc:
+        if not SEATTLE_GEO_LIVE_FALLBACK:
+            logger.error(
+                "%s; Seattle %s lookups will match nothing. "
+                "Run scripts/refresh_geo_snapshot.py to create the snapshot.",
+                exc,
+                name,
+            )
+            return _empty_layer()
+        logger.warning(
+            "%s; fetching Seattle %s from OSM instead. "
+            "Run scripts/refresh_geo_snapshot.py to avoid the network call.",
+            exc,
+            name,
+        )
+
+    try:
+        return fetch_live_layer(name)
+    except Exception:
+        logger.exception("Could not load Seattle %s; lookups will match nothing", name)
+        return _empty_layer()
+
+
+@lru_cache(maxsize=None)
+def _seattle_layer(name):
+    """Return ``(GeoDataFrame, PolygonIndex)`` for a layer, loaded on first use.
+
+    geopandas and shapely are only imported here, on the first lookup, so
+    processes that never touch geometry don't pay for them at startup.
+    """
+    from .geo_index import PolygonIndex
+
+    if name == LAYER_NEIGHBORHOODS and _skip_seattle_neighborhoods():
+        # Skipping only avoids the live fetch; a snapshot on disk is still used
+        try:
+            gdf = load_snapshot_layer(name)
+        except SnapshotUnavailable:
+            gdf = _empty_layer()
+    else:
+        gdf = _load_seattle_layer(name)
+    return gdf, PolygonIndex.from_geodataframe(gdf)
+
+
 def load_seattle_neighborhoods():
-    if os.getenv("APP_ENV", "").lower() == "testing" or os.getenv("SKIP_SEATTLE_NEIGHBORHOODS", "false").lower() == "true":
-        return gpd.GeoDataFrame()
+    """Return the Seattle neighborhoods frame from the on-disk snapshot."""
+    return _seattle_layer(LAYER_NEIGHBORHOODS)[0]
 
-    gdf = ox.features.features_from_place(
-        "Seattle, Washington",
-        tags={"place": ["neighbourhood", "suburb", "quarter"]}
-    )
-    return gdf.to_crs(epsg=4326)
+
+# Points this close (in degrees) to a neighborhood still snap to it
+_NEIGHBORHOOD_SNAP_DEGREES = 0.005
+
+
+def _neighborhood_index_for(neighborhoods_gdf):
+    gdf, index = _seattle_layer(LAYER_NEIGHBORHOODS)
+    if neighborhoods_gdf is None or neighborhoods_gdf is gdf:
+        return index
+
+    from .geo_index import PolygonIndex
+
+    return PolygonIndex.from_geodataframe(neighborhoods_gdf)
 
 
 # Step 2: Check which one contains the point
-def get_seattle_neighborhood(lat, lon, neighborhoods_gdf):
-    point = Point(lon, lat)
-    match = neighborhoods_gdf[neighborhoods_gdf.contains(point)]
-
-    if not match.empty:
-        name = match.iloc[0].get("name")
-        return name
-
-    # Fallback: try to find closest neighborhood within reasonable distance
-    nearby = neighborhoods_gdf[neighborhoods_gdf.distance(point) < 0.005]
-    if not nearby.empty:
-        # Get the first (closest) nearby neighborhood
-        name = nearby.iloc[0].get("name")
-        if name:
-            logger.debug(f"No direct match for ({lat}, {lon}), using closest: '{name}'")
-            return name
-    return None
+def get_seattle_neighborhood(lat, lon, neighborhoods_gdf=None):
+    """
+    Return the name of the first neighborhood containing the point, or of the
+    first one within ``_NEIGHBORHOOD_SNAP_DEGREES`` when none contains it.
+    Uses the cached spatial index unless a different frame is passed in.
+    """
+    return _neighborhood_index_for(neighborhoods_gdf).lookup(
+        lat, lon, max_distance=_NEIGHBORHOOD_SNAP_DEGREES
+    )
 
-ox.settings.use_cache = False
-# Load the Seattle boundary once at module import; fall back to empty DataFrame if lookup fails
-try:
-    _seattle_boundary = ox.geocode_to_gdf("Seattle, Washington")
-except Exception:
-    _seattle_boundary = gpd.GeoDataFrame()
 
-# Load Seattle neighborhoods once at module import; fall back to empty DataFrame if lookup fails
-try:
-    _seattle_neighborhoods = load_seattle_neighborhoods()
-except Exception:
-    _seattle_neighborhoods = gpd.GeoDataFrame()
+def get_seattle_neighborhoods_many(lats, lons):
+    """Vectorized ``get_seattle_neighborhood`` for backfills over many points."""
+    return _seattle_layer(LAYER_NEIGHBORHOODS)[1].lookup_many(
+        lats, lons, max_distance=_NEIGHBORHOOD_SNAP_DEGREES
+    )
 
 def is_coordinate_in_seattle(lat, lon):
     """
     Check if a coordinate is inside the Seattle city boundary.
     """
-    point = Point(lon, lat)
-    return _seattle_boundary.contains(point).any()
+    return _seattle_layer(LAYER_BOUNDARY)[1].contains(lat, lon)
+
+
+def are_coordinates_in_seattle(lats, lons):
+    """Vectorized ``is_coordinate_in_seattle``; returns a boolean array."""
+    return _seattle_layer(LAYER_BOUNDARY)[1].contains_many(lats, lons)
 
 def get_location_label(lat, lon, address, neighborhoods_gdf=None):
     if neighborhoods_gdf is None:
@@ -524,12 +598,15 @@ def get_location_label(lat, lon, address, neighborhoods_gdf=None):
             return neighborhood
 
         # Attempt snapping
-        point = Point(lon, lat)
-        nearby = neighborhoods_gdf.copy()
-        nearby["distance"] = nearby.centroid.distance(point)
-        close = nearby[nearby["distance"] <= 0.01]  # ~1km buffer
-        if not close.empty:
-            return close.iloc[0].get("name", "Seattle")
+        if not neighborhoods_gdf.empty:
+            from shapely.geometry import Point
+
+            point = Point(lon, lat)
+            nearby = neighborhoods_gdf.copy()
+            nearby["distance"] = nearby.centroid.distance(point)
+            close = nearby[nearby["distance"] <= 0.01]  # ~1km buffer
+            if not close.empty:
+                return close.iloc[0].get("name", "Seattle")
 
         return "Seattle"
     
@@ -544,6 +621,8 @@ def get_location_label(lat, lon, address, neighborhoods_gdf=None):
 
 
 def snap_to_neighborhood_if_close(lat, lon, neighborhoods_gdf, max_distance_km=1):
+    from shapely.geometry import Point
+
     point = Point(lon, lat)
     neighborhoods_gdf = neighborhoods_gdf.copy()
     neighborhoods_gdf["centroid"] = neighborhoods_gdf.centroid
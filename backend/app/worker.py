@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+from flask import Flask, current_app, has_app_context
+
+from app.extensions import db
+
+logger = logging.getLogger(__name__)
+
+_worker_app: Optional[Flask] = None
+_worker_pid: Optional[int] = None
+_lock = threading.Lock()
+
+
+def create_ingest_app(config_name: str | None = None) -> Flask:
+    """Minimal app for news ingestion and other background jobs.
+
+    Only what the fetchers and score tasks use is set up: the database,
+    Google image search keys and the environment name. Blueprints,
+    Socket.IO, login, mail, Twilio, Sentry, AWS clients and the startup
+    connectivity retries of ``create_app`` are skipped, and the schema is
+    left to the web app and migrations.
+    """
+    from app import database_url
+    from app.db_pool import engine_options, instrument_engine
+
+    app = Flask("app")
+    is_testing = config_name == "testing"
+    app_env = "testing" if is_testing else os.getenv("APP_ENV", "local").lower()
+    db_url = database_url(app_env)
+
+    app.config.update(
+        APP_ENV=app_env,
+        TESTING=is_testing,
+        SQLALCHEMY_DATABASE_URI=db_url,
+        SQLALCHEMY_ENGINE_OPTIONS=engine_options(db_url),
+        SECRET_KEY=os.getenv("SECRET_KEY") or os.urandom(16).hex(),
+        AWS_REGION=os.getenv("AWS_REGION", "us-west-2"),
+        GOOGLE_API_KEY=os.getenv("GOOGLE_API_KEY"),
+        GOOGLE_SEARCH_ENGINE_ID=os.getenv("GOOGLE_SEARCH_ENGINE_ID"),
+    )
+    db.init_app(app)
+    with app.app_context():
+        instrument_engine(db.engine)
+    return app
+
+
+def get_worker_app() -> Flask:
+    """Return this process's ingest app, creating it on first use.
+
+    The app, and so its SQLAlchemy engine and pool, is shared by every task
+    the process runs. A forked child builds its own instead of reusing
+    connections inherited from the parent.
+    """
+    global _worker_app, _worker_pid
+
+    with _lock:
+        if _worker_app is None or _worker_pid != os.getpid():
+            _worker_app = create_ingest_app()
+            _worker_pid = os.getpid()
+            logger.info("Created ingest app for worker process %s", _worker_pid)
+        return _worker_app
+
+
+@contextmanager
+def worker_app_context():
+    """Run a task body inside an app context without building a new app.
+
+    Celery tasks already run inside the worker's app context (see
+    ``make_celery``), which is reused as is; otherwise, e.g. in the Lambda
+    handler or a script, the process-wide ingest app is pushed.
+    """
+    if has_app_context():
+        yield current_app._get_current_object()
+        return
+
+    app = get_worker_app()
+    with app.app_context():
+        yield app
+
+
+__all__ = [
+    "create_ingest_app",
+    "get_worker_app",
+    "worker_app_context",
+]
@@ -13,6 +13,20 @@ def _clean(var, fallback):
 
 SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL")
 
+# Connection pool of the single engine each process shares (see app/db_pool.py)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 5))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ["true", "1", "t"]
+# Behind PgBouncer in transaction mode: no client-side pool, PgBouncer does the pooling
+DB_PGBOUNCER = os.getenv("DB_PGBOUNCER", "false").lower() in ["true", "1", "t"]
+# How long Flask-Login may reuse a user's row without querying it again (0 disables)
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", 30))
+# Pub/sub that tells every node to drop a changed user: redis://... across nodes,
+# memory:// within one process only; empty disables the cache
+USER_CACHE_INVALIDATION_URL = os.getenv("USER_CACHE_INVALIDATION_URL", "")
+
 
 def get_database_url() -> str:
     """Resolve database URL lazily so config imports never crash local tooling."""
@@ -27,14 +41,10 @@ def get_database_url() -> str:
 
 def get_engine():
     """Create SQLAlchemy engine lazily when DB access is actually needed."""
-    return create_engine(
-        get_database_url(),
-        pool_size=10,  # Maintain up to 10 open connections
-        max_overflow=5,  # Allow 5 temporary extra connections if needed
-        pool_timeout=30,  # Wait 30 seconds for a connection before raising error
-        pool_recycle=1800,  # Refresh connections every 30 minutes
-        pool_pre_ping=True,  # Auto-reconnect if Neon DB closes the connection
-    )
+    from app.db_pool import engine_options
+
+    db_url = get_database_url()
+    return create_engine(db_url, **engine_options(db_url))
 # Flask app configuration (new addition)
 FLASK_APP = os.getenv("FLASK_APP", "run:app")
 
@@ -101,8 +111,45 @@ IPINFO_API_URL = os.getenv("IPINFO_API_URL", "https://ipinfo.io")
 GOOGLE_FONTS_URL = os.getenv("GOOGLE_FONTS_URL", "https://fonts.googleapis.com/css2?family=Poppins:wght@400;500;600&display=swap")
 ICONS8_BASE_URL = os.getenv("ICONS8_BASE_URL", "https://img.icons8.com")
 
+# Reverse geocode cache shared by web and worker processes: redis://..., sqlite:///path,
+# "memory" (per-process only) or empty for a SQLite file in the temp directory
+REVERSE_GEOCODE_CACHE_URL = os.getenv("REVERSE_GEOCODE_CACHE_URL", "")
+REVERSE_GEOCODE_CACHE_TTL_SECONDS = int(os.getenv("REVERSE_GEOCODE_CACHE_TTL_SECONDS", 30 * 86400))
+
+# Socket.IO pub/sub between realtime nodes: redis://..., amqp://... (Kombu) or
+# "memory://" (in-process only, for tests). Empty runs a single standalone node.
+SOCKETIO_MESSAGE_QUEUE = os.getenv("SOCKETIO_MESSAGE_QUEUE", "")
+SOCKETIO_CHANNEL = os.getenv("SOCKETIO_CHANNEL", "flask-socketio")
+
+# Recipients per notification INSERT/emit when a group message fans out in the
+# background (see app.group_fanout)
+GROUP_FANOUT_BATCH_SIZE = int(os.getenv("GROUP_FANOUT_BATCH_SIZE", 500))
+
+# Seattle boundary/neighborhood snapshot (see scripts/refresh_geo_snapshot.py)
+SEATTLE_GEO_SNAPSHOT_DIR = os.getenv(
+    "SEATTLE_GEO_SNAPSHOT_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "app", "data", "seattle_geo"),
+)
+# Fetch from OSM when the snapshot is missing instead of running without polygons.
+# Deployed images ship the snapshot, so this is only on by default for local/testing.
+SEATTLE_GEO_LIVE_FALLBACK = os.getenv(
+    "SEATTLE_GEO_LIVE_FALLBACK", "true" if APP_ENV in ("local", "testing") else "false"
+).lower() in ["true", "1", "t"]
+
 # News Source URLs
 NEWS_SOURCE_KOMO = os.getenv("NEWS_SOURCE_KOMO", "https://komonews.com/news/local")
+# Concurrent page downloads during a multi-source news fetch, overall and per host
+NEWS_FETCH_MAX_WORKERS = int(os.getenv("NEWS_FETCH_MAX_WORKERS", 16))
+NEWS_FETCH_PER_HOST = int(os.getenv("NEWS_FETCH_PER_HOST", 3))
+# Shared HTTP session used by APIHandler
+NEWS_HTTP_CONNECT_TIMEOUT = float(os.getenv("NEWS_HTTP_CONNECT_TIMEOUT", 5))
+NEWS_HTTP_READ_TIMEOUT = float(os.getenv("NEWS_HTTP_READ_TIMEOUT", 20))
+NEWS_HTTP_RETRIES = int(os.getenv("NEWS_HTTP_RETRIES", 3))
+NEWS_HTTP_BACKOFF_SECONDS = float(os.getenv("NEWS_HTTP_BACKOFF_SECONDS", 0.5))
+# ETag/Last-Modified store for homepages, same URL forms as REVERSE_GEOCODE_CACHE_URL
+NEWS_HTTP_VALIDATOR_CACHE_URL = os.getenv("NEWS_HTTP_VALIDATOR_CACHE_URL", "")
+# Write raw responses and parsed items to /tmp for debugging
+NEWS_DEBUG_DUMP = os.getenv("NEWS_DEBUG_DUMP", "false").lower() in ["true", "1", "t"]
 
 # Placeholder Image URLs
 PLACEHOLDER_IMAGE_BASE_URL = os.getenv("PLACEHOLDER_IMAGE_BASE_URL", "https://via.placeholder.com")
@@ -73,9 +73,12 @@ def main():
             print("ℹ️ Redis check skipped (non-redis broker).")
             sys.stdout.flush()
 
-        print("🚀 Starting Celery worker with Eventlet pool...")
+        # INGEST_ONLY_WORKER=true boots the trimmed ingest app instead of the web app
+        celery_app = "ingest_worker.celery" if os.getenv("INGEST_ONLY_WORKER", "false").lower() == "true" else "run.celery"
+
+        print(f"🚀 Starting Celery worker ({celery_app}) with Eventlet pool...")
         sys.stdout.flush()
-        os.system("celery -A run.celery worker --loglevel=debug -P eventlet")
+        os.system(f"celery -A {celery_app} worker --loglevel=debug -P eventlet")
 
 
     elif command == "beat":
@@ -0,0 +1,10 @@
+# ingest_worker.py
+# Celery entry point for workers that only run background jobs (news
+# ingestion, score refresh). Uses the ingest-only app, so no blueprints,
+# Socket.IO or AWS clients are set up:
+#   celery -A ingest_worker.celery worker
+from app import configure_celery
+from app.worker import get_worker_app
+
+app = get_worker_app()
+celery = configure_celery(app)
@@ -52,8 +52,9 @@ _write_client_secret_from_sm()
 _load_env_from_sm()
 
 # Step 3 → Imports after secrets
-from app import create_app
-from app.fetchers.api_handler import APIHandler
+from app.worker import get_worker_app
+from app.fetchers.api_handler import APIHandler, is_not_modified
+from app.fetchers.concurrent_fetch import NewsSource, fetch_sources
 from app.fetchers.news_fetcher import NewsFetcher
 from app.fetchers.myballard_fetcher import MyBallardFetcher
 from app.fetchers.chs_fetcher import CHSFetcher
@@ -65,7 +66,8 @@ def handler(event, context):
     start_time = datetime.utcnow()
 
     try:
-        app, _ = create_app()
+        # Ingest-only app, built once per Lambda container and reused while warm
+        app = get_worker_app()
         api_handler = APIHandler()
 
         # 🔁 If explicitly requested, run KOMO-only mode
@@ -73,11 +75,14 @@ def handler(event, context):
             logger.info(f"{log_prefix} [Override] KOMO-only mode enabled.")
             from config import NEWS_SOURCE_KOMO
             source = NEWS_SOURCE_KOMO
-            response = api_handler.get_news_data(source)
+            response = api_handler.get_if_modified(source)
 
             if not response:
                 logger.error(f"{log_prefix} ❌ Failed to fetch KOMO")
                 return {"status": "fetch_failed"}
+            if is_not_modified(response):
+                logger.info(f"{log_prefix} KOMO unchanged since last run")
+                return {"source": "komo", "status": "not_modified"}
 
             with app.app_context():
                 komo_fetcher = NewsFetcher(api_handler)
@@ -85,6 +90,7 @@ def handler(event, context):
                 logger.info(f"{log_prefix} ✅ KOMO parsed: {len(parsed)}")
                 saved = komo_fetcher.save_data(parsed)
                 logger.info(f"{log_prefix} ✅ KOMO saved: {len(saved)}")
+                api_handler.remember_validators(response)
 
             return {
                 "source": "komo",
@@ -92,73 +98,21 @@ def handler(event, context):
                 "saved": len(saved)
             }
 
-        # 🌐 DEFAULT: Multi-source fetch
+        # 🌐 DEFAULT: Multi-source fetch. Homepages and article pages for all
+        # sources download concurrently; parsing and saving stay in this order.
         logger.info(f"{log_prefix} Running multi-source fetch (default)")
-        results = []
 
         sources = [
-            {
-                "name": "MyBallard",
-                "url": "https://www.myballard.com/",
-                "fetcher_class": MyBallardFetcher
-            },
-            {
-                "name": "KOMO",
-                "url": "https://komonews.com/news/local",
-                "fetcher_class": NewsFetcher
-            },
-            {
-                "name": "CHS",
-                "url": "https://www.capitolhillseattle.com/",
-                "fetcher_class": CHSFetcher
-            },
-            {
-                "name": "The Stranger",
-                "url": "https://www.thestranger.com/",
-                "fetcher_class": StrangerFetcher
-            },
-            {
-                "name": "The Needling",
-                "url": "https://theneedling.com/",
-                "fetcher_class": TheNeedlingFetcher
-            },
-            {
-                "name": "Seattle Times",
-                "url": "https://www.seattletimes.com/",
-                "fetcher_class": SeattleTimesFetcher
-            }
+            NewsSource("MyBallard", "https://www.myballard.com/", MyBallardFetcher),
+            NewsSource("KOMO", "https://komonews.com/news/local", NewsFetcher),
+            NewsSource("CHS", "https://www.capitolhillseattle.com/", CHSFetcher),
+            NewsSource("The Stranger", "https://www.thestranger.com/", StrangerFetcher),
+            NewsSource("The Needling", "https://theneedling.com/", TheNeedlingFetcher),
+            NewsSource("Seattle Times", "https://www.seattletimes.com/", SeattleTimesFetcher),
         ]
 
         with app.app_context():
-            for src in sources:
-                logger.info(f"{log_prefix} → Fetching {src['name']} from {src['url']}")
-
-                # Special case for MyBallard
-                if src["name"] == "MyBallard":
-                    fetcher = src["fetcher_class"](api_handler)
-                    response = fetcher.fetch_with_headers(src["url"])
-                else:
-                    response = api_handler.get_news_data(src["url"])
-
-                if not response:
-                    logger.warning(f"{log_prefix} ⚠️ No response from {src['name']}")
-                    results.append({"source": src["name"], "status": "fetch_failed"})
-                    continue
-
-                # Continue with normal parsing
-                fetcher = src["fetcher_class"](api_handler)
-                parsed = fetcher.parse_data(response)
-                logger.info(f"{log_prefix} ✅ {src['name']} parsed {len(parsed)} articles")
-
-                saved = fetcher.save_data(parsed)
-                saved_count = saved.get('saved', 0) if isinstance(saved, dict) else len(saved)
-                logger.info(f"{log_prefix} ✅ {src['name']} saved {saved_count} new items")
-
-                results.append({
-                    "source": src["name"],
-                    "parsed": len(parsed),
-                    "saved": saved_count
-                })
+            results = fetch_sources(sources, api_handler)
 
         duration = (datetime.utcnow() - start_time).total_seconds()
         logger.info(f"{log_prefix} ✅ Multi-source fetch completed in {duration:.2f}s")
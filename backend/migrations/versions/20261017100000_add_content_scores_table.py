@@ -0,0 +1,80 @@
+"""add content_scores table for materialized feed ranking
+
+Revision ID: 20261017100000
+Revises: 20251126183723
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261017100000'
+down_revision = '20251126183723'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    # create_app() runs db.create_all(), so the table may already exist
+    if 'content_scores' not in inspector.get_table_names():
+        op.create_table(
+            'content_scores',
+            sa.Column('content_id', sa.Integer(), nullable=False),
+            sa.Column('reactions_count', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column('comments_count', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column('shares_count', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column('raw_score', sa.Float(), nullable=False, server_default='0'),
+            sa.Column('score', sa.Float(), nullable=False, server_default='0'),
+            sa.Column('content_created_at', sa.DateTime(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['content_id'], ['user_content.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('content_id'),
+        )
+        op.create_index(
+            'ix_content_scores_score_content_id',
+            'content_scores',
+            ['score', 'content_id'],
+            unique=False,
+        )
+
+    # Backfill one row per existing post with the same weights/decay as
+    # app.engagement_scores (reaction=2, comment=3, share=5, 1 day decay).
+    op.execute(
+        """
+        INSERT INTO content_scores (
+            content_id, reactions_count, comments_count, shares_count,
+            raw_score, score, content_created_at, updated_at
+        )
+        SELECT
+            uc.id,
+            COALESCE(r.cnt, 0),
+            COALESCE(c.cnt, 0),
+            COALESCE(s.cnt, 0),
+            2 * COALESCE(r.cnt, 0) + 3 * COALESCE(c.cnt, 0) + 5 * COALESCE(s.cnt, 0),
+            COALESCE(
+                (2 * COALESCE(r.cnt, 0) + 3 * COALESCE(c.cnt, 0) + 5 * COALESCE(s.cnt, 0))
+                    * EXP(-(EXTRACT(EPOCH FROM (NOW() AT TIME ZONE 'utc') - uc.created_at) / 86400)),
+                0
+            ),
+            uc.created_at,
+            NOW() AT TIME ZONE 'utc'
+        FROM user_content uc
+        LEFT JOIN (SELECT content_id, COUNT(*) AS cnt FROM reaction GROUP BY content_id) r
+            ON r.content_id = uc.id
+        LEFT JOIN (SELECT content_id, COUNT(*) AS cnt FROM comment GROUP BY content_id) c
+            ON c.content_id = uc.id
+        LEFT JOIN (SELECT content_id, COUNT(*) AS cnt FROM share GROUP BY content_id) s
+            ON s.content_id = uc.id
+        ON CONFLICT (content_id) DO NOTHING
+        """
+    )
+
+
+def downgrade():
+    op.drop_index('ix_content_scores_score_content_id', table_name='content_scores')
+    op.drop_table('content_scores')
@@ -0,0 +1,83 @@
+"""add unique normalized news link key to user_content
+
+Revision ID: 20261017110000
+Revises: 20261017100000
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261017110000'
+down_revision = '20261017100000'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+_TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "mc_cid", "mc_eid")
+
+
+def _normalize_news_link(link):
+    # Frozen copy of app.fetchers.news_dedup.normalize_news_link
+    if not link or not link.strip():
+        return None
+    parts = urlsplit(link.strip().lower())
+    host = parts.netloc[4:] if parts.netloc.startswith("www.") else parts.netloc
+    query = [
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.startswith(_TRACKING_PARAMS)
+    ]
+    key = host + parts.path.rstrip("/")
+    if query:
+        key += "?" + urlencode(sorted(query))
+    return key
+
+
+def upgrade():
+    conn = op.get_bind()
+    columns = {column['name'] for column in sa.inspect(conn).get_columns('user_content')}
+    if 'news_link_key' not in columns:
+        op.add_column('user_content', sa.Column('news_link_key', sa.Text(), nullable=True))
+
+    # Backfill ingested news only; when several rows share a link, the oldest
+    # keeps the key and the later duplicates stay NULL.
+    rows = conn.execute(
+        sa.text(
+            "SELECT id, news_link FROM user_content "
+            "WHERE seed_type = 'news' AND news_link IS NOT NULL AND news_link_key IS NULL "
+            "ORDER BY id"
+        )
+    ).fetchall()
+    seen = set(
+        key for (key,) in conn.execute(
+            sa.text("SELECT news_link_key FROM user_content WHERE news_link_key IS NOT NULL")
+        )
+    )
+    updates = []
+    for content_id, link in rows:
+        key = _normalize_news_link(link)
+        if key and key not in seen:
+            seen.add(key)
+            updates.append({'id': content_id, 'key': key})
+
+    statement = sa.text("UPDATE user_content SET news_link_key = :key WHERE id = :id")
+    for start in range(0, len(updates), BATCH_SIZE):
+        conn.execute(statement, updates[start:start + BATCH_SIZE])
+
+    op.create_index(
+        'uq_user_content_news_link_key',
+        'user_content',
+        ['news_link_key'],
+        unique=True,
+    )
+
+
+def downgrade():
+    op.drop_index('uq_user_content_news_link_key', table_name='user_content')
+    op.drop_column('user_content', 'news_link_key')
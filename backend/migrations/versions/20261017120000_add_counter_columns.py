@@ -0,0 +1,65 @@
+"""add follower, reply and repost counter columns
+
+Revision ID: 20261017120000
+Revises: 20261017110000
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261017120000'
+down_revision = '20261017110000'
+branch_labels = None
+depends_on = None
+
+COUNTERS = (
+    ('users', 'followers_count'),
+    ('users', 'following_count'),
+    ('comment', 'replies_count'),
+    ('content_scores', 'reposts_count'),
+)
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    # create_app() runs db.create_all(), so the columns may already exist
+    for table, column in COUNTERS:
+        if column not in {c['name'] for c in inspector.get_columns(table)}:
+            op.add_column(
+                table,
+                sa.Column(column, sa.Integer(), nullable=False, server_default='0'),
+            )
+
+    # Backfill from the source tables; app.counters.reconcile_counters runs
+    # the same recount periodically to repair drift.
+    op.execute(
+        """
+        UPDATE users SET
+            followers_count = (SELECT COUNT(*) FROM follow WHERE follow.followed_id = users.id),
+            following_count = (SELECT COUNT(*) FROM follow WHERE follow.follower_id = users.id)
+        """
+    )
+    op.execute(
+        """
+        UPDATE comment SET replies_count = (
+            SELECT COUNT(*) FROM comment AS reply WHERE reply.parent_id = comment.id
+        )
+        """
+    )
+    op.execute(
+        """
+        UPDATE content_scores SET reposts_count = (
+            SELECT COUNT(*) FROM reposts WHERE reposts.content_id = content_scores.content_id
+        )
+        """
+    )
+
+
+def downgrade():
+    for table, column in reversed(COUNTERS):
+        op.drop_column(table, column)
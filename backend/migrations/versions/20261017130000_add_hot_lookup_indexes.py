@@ -0,0 +1,92 @@
+"""add composite indexes for hot foreign-key lookups
+
+Revision ID: 20261017130000
+Revises: 20261017120000
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261017130000'
+down_revision = '20261017120000'
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns, partial-index predicate, either one for every
+# dialect or one per dialect name)
+#
+# follow and block already have (follower_id, followed_id) and
+# (blocker_id, blocked_id) primary keys, and hidden_content a unique
+# (user_id, content_id) constraint, so only the reverse directions are added.
+INDEXES = (
+    ('ix_reaction_content_id_reaction_type', 'reaction', ['content_id', 'reaction_type'], None),
+    ('ix_reaction_user_id_content_id', 'reaction', ['user_id', 'content_id'], None),
+    ('ix_comment_content_id_created_at', 'comment', ['content_id', 'created_at'], None),
+    ('ix_comment_parent_id_created_at', 'comment', ['parent_id', 'created_at'], 'parent_id IS NOT NULL'),
+    ('ix_follow_followed_id_follower_id', 'follow', ['followed_id', 'follower_id'], None),
+    ('ix_block_blocked_id_blocker_id', 'block', ['blocked_id', 'blocker_id'], None),
+    ('ix_notification_user_id_created_at_id', 'notification', ['user_id', 'created_at', 'id'], None),
+    ('ix_notification_user_id_unread_created_at_id', 'notification', ['user_id', 'created_at', 'id'],
+     {'postgresql': 'is_read = false', 'sqlite': 'is_read = 0'}),
+    ('ix_direct_messages_chat_id_created_at_id', 'direct_messages', ['chat_id', 'created_at', 'id'], None),
+    ('ix_group_messages_group_chat_id_created_at_id', 'group_messages', ['group_chat_id', 'created_at', 'id'], None),
+    ('ix_group_chat_members_group_chat_id_user_id', 'group_chat_members', ['group_chat_id', 'user_id'], None),
+    ('ix_user_content_is_in_seattle_created_at', 'user_content', ['is_in_seattle', 'created_at'], None),
+    ('ix_user_content_user_id_created_at', 'user_content', ['user_id', 'created_at'], None),
+)
+
+
+def _where(where, dialect):
+    return sa.text(where[dialect] if isinstance(where, dict) else where)
+
+
+def _invalid_postgres_indexes(conn):
+    """Names of indexes left INVALID by an interrupted concurrent build."""
+    rows = conn.execute(sa.text(
+        "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+        "WHERE NOT i.indisvalid"
+    ))
+    return {row[0] for row in rows}
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    postgres = conn.dialect.name == 'postgresql'
+    invalid = _invalid_postgres_indexes(conn) if postgres else set()
+
+    missing = []
+    for name, table, columns, where in INDEXES:
+        # create_app() runs db.create_all(), so the index may already exist
+        if name in {ix['name'] for ix in inspector.get_indexes(table)} and name not in invalid:
+            continue
+        missing.append((name, table, columns, where))
+
+    if not postgres:
+        for name, table, columns, where in missing:
+            kwargs = {'sqlite_where': _where(where, 'sqlite')} if where is not None else {}
+            op.create_index(name, table, columns, **kwargs)
+        return
+
+    # Build without blocking writes to these busy tables; CONCURRENTLY cannot
+    # run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in missing:
+            if name in invalid:
+                op.drop_index(name, table_name=table, postgresql_concurrently=True)
+            kwargs = {'postgresql_concurrently': True}
+            if where is not None:
+                kwargs['postgresql_where'] = _where(where, 'postgresql')
+            op.create_index(name, table, columns, **kwargs)
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    for name, table, _columns, _where in reversed(INDEXES):
+        if name in {ix['name'] for ix in inspector.get_indexes(table)}:
+            op.drop_index(name, table_name=table)
@@ -0,0 +1,42 @@
+"""add users.unread_notifications_count
+
+Revision ID: 20261017140000
+Revises: 20261017130000
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261017140000'
+down_revision = '20261017130000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    # create_app() runs db.create_all(), so the column may already exist
+    if 'unread_notifications_count' not in {c['name'] for c in inspector.get_columns('users')}:
+        op.add_column(
+            'users',
+            sa.Column('unread_notifications_count', sa.Integer(), nullable=False, server_default='0'),
+        )
+
+    # Backfill; app.counters.reconcile_counters repairs drift afterwards
+    op.execute(
+        """
+        UPDATE users SET unread_notifications_count = (
+            SELECT COUNT(*) FROM notification
+            WHERE notification.user_id = users.id AND notification.is_read = false
+        )
+        """
+    )
+
+
+def downgrade():
+    op.drop_column('users', 'unread_notifications_count')
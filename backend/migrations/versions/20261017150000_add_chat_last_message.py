@@ -0,0 +1,89 @@
+"""add last_message_id/last_message_at to direct and group chats
+
+Revision ID: 20261017150000
+Revises: 20261017140000
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261017150000'
+down_revision = '20261017140000'
+branch_labels = None
+depends_on = None
+
+# (chat table, message table, message -> chat column)
+CHATS = (
+    ('direct_chats', 'direct_messages', 'chat_id'),
+    ('group_chats', 'group_messages', 'group_chat_id'),
+)
+
+INDEXES = (
+    ('ix_direct_chats_user1_id_last_message_at', 'direct_chats', ['user1_id', 'last_message_at', 'id']),
+    ('ix_direct_chats_user2_id_last_message_at', 'direct_chats', ['user2_id', 'last_message_at', 'id']),
+    ('ix_group_chats_last_message_at', 'group_chats', ['last_message_at', 'id']),
+    ('ix_group_chat_members_user_id_group_chat_id', 'group_chat_members', ['user_id', 'group_chat_id']),
+)
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    # create_app() runs db.create_all(), so columns and indexes may already exist
+    for table, _messages, _column in CHATS:
+        existing = {c['name'] for c in inspector.get_columns(table)}
+        if 'last_message_id' not in existing:
+            op.add_column(table, sa.Column('last_message_id', sa.Integer(), nullable=True))
+        if 'last_message_at' not in existing:
+            op.add_column(table, sa.Column('last_message_at', sa.DateTime(), nullable=True))
+
+    # Backfill from the newest message of each chat; app.chat_inbox keeps
+    # the columns current from here on.
+    for table, messages, column in CHATS:
+        op.execute(
+            f"""
+            UPDATE {table} SET
+                last_message_id = (
+                    SELECT m.id FROM {messages} AS m
+                    WHERE m.{column} = {table}.id
+                    ORDER BY m.created_at DESC, m.id DESC
+                    LIMIT 1
+                ),
+                last_message_at = (
+                    SELECT MAX(m.created_at) FROM {messages} AS m
+                    WHERE m.{column} = {table}.id
+                )
+            """
+        )
+
+    # Index after the backfill, which then does not have to maintain them
+    missing = [
+        (name, table, columns)
+        for name, table, columns in INDEXES
+        if name not in {ix['name'] for ix in inspector.get_indexes(table)}
+    ]
+    if conn.dialect.name == 'postgresql':
+        # Build without blocking writes to the chat and membership tables;
+        # CONCURRENTLY cannot run inside a transaction block
+        with op.get_context().autocommit_block():
+            for name, table, columns in missing:
+                op.create_index(name, table, columns, postgresql_concurrently=True)
+    else:
+        for name, table, columns in missing:
+            op.create_index(name, table, columns)
+
+
+def downgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    for name, table, _columns in reversed(INDEXES):
+        if name in {ix['name'] for ix in inspector.get_indexes(table)}:
+            op.drop_index(name, table_name=table)
+    for table, _messages, _column in reversed(CHATS):
+        op.drop_column(table, 'last_message_at')
+        op.drop_column(table, 'last_message_id')
@@ -0,0 +1,70 @@
+"""extend message (chat, created_at) indexes with id for keyset history
+
+Revision ID: 20261017160000
+Revises: 20261017150000
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261017160000'
+down_revision = '20261017150000'
+branch_labels = None
+depends_on = None
+
+# (table, old index, new index, chat column)
+#
+# 20261017130000 now builds the new indexes itself; this only replaces the
+# old ones on databases that ran its first version.
+INDEXES = (
+    ('direct_messages', 'ix_direct_messages_chat_id_created_at',
+     'ix_direct_messages_chat_id_created_at_id', 'chat_id'),
+    ('group_messages', 'ix_group_messages_group_chat_id_created_at',
+     'ix_group_messages_group_chat_id_created_at_id', 'group_chat_id'),
+)
+
+
+def _index_names(inspector, table):
+    return {ix['name'] for ix in inspector.get_indexes(table)}
+
+
+def _replace(pending, **kwargs):
+    for table, column, build, drop in pending:
+        if build:
+            op.create_index(build, table, [column, 'created_at', 'id'], **kwargs)
+        if drop:
+            op.drop_index(drop, table_name=table, **kwargs)
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    postgres = conn.dialect.name == 'postgresql'
+
+    # create_app() runs db.create_all(), so the new index may already exist
+    # (table, chat column, index to build or None, index to drop or None)
+    pending = []
+    for table, old, new, column in INDEXES:
+        existing = _index_names(inspector, table)
+        build = new if new not in existing else None
+        drop = old if old in existing else None
+        if build or drop:
+            pending.append((table, column, build, drop))
+    if not pending:
+        return
+
+    if not postgres:
+        _replace(pending)
+        return
+    # Build and drop without blocking writes to the message tables;
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        _replace(pending, postgresql_concurrently=True)
+
+
+def downgrade():
+    # The (chat, created_at, id) indexes belong to 20261017130000 now
+    pass
@@ -0,0 +1,29 @@
+"""add group_message to the notification_type enum
+
+Revision ID: 20261017170000
+Revises: 20261017160000
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261017170000'
+down_revision = '20261017160000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Only PostgreSQL has a native enum type; elsewhere the column is a VARCHAR
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    # ALTER TYPE ... ADD VALUE cannot run inside a transaction block before PG 12
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE notification_type ADD VALUE IF NOT EXISTS 'group_message'")
+
+
+def downgrade():
+    # PostgreSQL cannot drop an enum value; remove the rows that use it instead
+    op.execute("DELETE FROM notification WHERE type = 'group_message'")
@@ -0,0 +1,119 @@
+"""Benchmark for the seeded-news duplicate check.
+
+Times ``NewsDedupIndex.find`` against the original linear scan over every
+seeded row on synthetic corpora of 1k-50k headlines, and checks that both
+give the same answer for every probe. The linear scan is only run up to
+``--legacy-max`` rows.
+
+Usage:
+    python scripts/benchmark_news_dedup.py [--sizes 1000 10000 50000]
+        [--probes 200] [--legacy-max 5000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.fetchers.news_dedup import NewsDedupIndex  # noqa: E402
+from app.fetchers.news_saver import (  # noqa: E402
+    calculate_similarity,
+    get_domain_from_url,
+    is_similar_title,
+    normalize_text,
+)
+
+WORDS = (
+    "seattle council approves new transit plan for ballard light rail station "
+    "police investigate fire near capitol hill park residents react to rising "
+    "rent prices mariners win late game kraken sign defenseman ferry delays "
+    "expected after storm school board votes on budget cuts downtown"
+).split()
+DOMAINS = ["https://mynorthwest.com", "https://www.seattletimes.com", "https://komonews.com"]
+
+
+def legacy_check_for_duplicates(headline, link, existing_news_data):
+    normalized_headline = normalize_text(headline)
+    current_domain = get_domain_from_url(link)
+    for existing_uc in existing_news_data:
+        if not existing_uc.title or not existing_uc.news_link:
+            continue
+        existing_title = existing_uc.title.strip()
+        existing_link = existing_uc.news_link.strip()
+        if headline.lower() == existing_title.lower():
+            return True, "exact_title_match"
+        if link.lower() == existing_link.lower():
+            return True, "exact_link_match"
+        if normalized_headline == normalize_text(existing_title):
+            return True, "normalized_title_match"
+        if current_domain and current_domain == get_domain_from_url(existing_link):
+            if is_similar_title(headline, existing_title, threshold=0.8):
+                return True, "similar_title_same_domain"
+        similarity = calculate_similarity(headline, existing_title)
+        if similarity >= 0.9:
+            return True, f"high_similarity_{similarity:.2f}"
+    return False, None
+
+
+def headline(rng):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 12))).capitalize()
+
+
+def perturb(rng, title):
+    words = title.split()
+    words[rng.randrange(len(words))] = rng.choice(WORDS)
+    return " ".join(words)
+
+
+def corpus(rng, size):
+    rows = []
+    for i in range(size):
+        title = perturb(rng, rows[rng.randrange(len(rows))].title) if rows and rng.random() < 0.3 \
+            else headline(rng)
+        rows.append(SimpleNamespace(title=title, news_link=f"{rng.choice(DOMAINS)}/story/{i}"))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--probes", type=int, default=200)
+    parser.add_argument("--legacy-max", type=int, default=5_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'rows':>7} {'build (s)':>10} {'index/probe (ms)':>17} {'linear/probe (ms)':>18}")
+    for size in args.sizes:
+        rng = random.Random(args.seed)
+        rows = corpus(rng, size)
+        probes = [
+            (perturb(rng, rng.choice(rows).title) if rng.random() < 0.7 else headline(rng),
+             f"{rng.choice(DOMAINS)}/new/{i}")
+            for i in range(args.probes)
+        ]
+
+        started = time.perf_counter()
+        index = NewsDedupIndex()
+        for row in rows:
+            index.add(row.title, row.news_link)
+        build_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        found = [index.find(title, link) for title, link in probes]
+        index_ms = (time.perf_counter() - started) * 1000 / len(probes)
+
+        if size <= args.legacy_max:
+            started = time.perf_counter()
+            expected = [legacy_check_for_duplicates(title, link, rows) for title, link in probes]
+            linear_ms = f"{(time.perf_counter() - started) * 1000 / len(probes):18.2f}"
+            assert found == expected, "index and linear scan disagree"
+        else:
+            linear_ms = f"{'skipped':>18}"
+        print(f"{size:>7} {build_time:10.3f} {index_ms:17.2f} {linear_ms}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Load test for Socket.IO fan-out across several realtime nodes.
+
+Starts N in-process Socket.IO servers sharing one message queue, attaches
+simulated sockets (each in its own ``user_<id>`` room) round-robin across
+them, then emits targeted notifications from random nodes and times how
+long it takes until every one has been delivered by the node that holds the
+recipient. Deliveries are counted instead of written to a transport, so the
+numbers measure routing and queue cost only.
+
+With ``--queue memory://`` (the default) the nodes share the in-process bus
+from ``app.realtime``; pass a ``redis://`` URL to measure a real broker.
+
+Usage:
+    python scripts/benchmark_socketio_fanout.py [--nodes 1 2 4 8]
+        [--sockets 2000] [--messages 5000] [--queue memory://]
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+
+import socketio
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.realtime import client_manager  # noqa: E402
+
+
+class Cluster:
+    def __init__(self, size, queue_url):
+        channel = f"bench-{uuid.uuid4().hex}"
+        self.delivered = 0
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._target = 0
+        self.nodes = []
+        for _ in range(size):
+            server = socketio.Server(
+                async_mode="threading", client_manager=client_manager(queue_url, channel=channel)
+            )
+            server._send_eio_packet = self._deliver
+            server._handle_eio_connect("bootstrap", {})
+            self.nodes.append(server)
+
+    def _deliver(self, eio_sid, pkt):
+        with self._lock:
+            self.delivered += 1
+            if self.delivered >= self._target:
+                self._done.set()
+
+    def attach(self, sockets):
+        for user_id in range(sockets):
+            node = self.nodes[user_id % len(self.nodes)]
+            sid = node.manager.connect(uuid.uuid4().hex, "/")
+            node.manager.enter_room(sid, "/", f"user_{user_id}")
+
+    def run(self, messages, sockets, timeout):
+        with self._lock:
+            self.delivered = 0
+            self._target = messages
+            self._done.clear()
+        payload = {"type": "follow", "content": "x" * 200}
+        start = time.perf_counter()
+        for _ in range(messages):
+            user_id = random.randrange(sockets)
+            random.choice(self.nodes).emit(f"notify_{user_id}", payload, to=f"user_{user_id}")
+        finished = self._done.wait(timeout)
+        return time.perf_counter() - start, finished
+
+    def close(self):
+        for server in self.nodes:
+            close = getattr(server.manager, "close", None)
+            if close:
+                close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--sockets", type=int, default=2000)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--queue", default="memory://")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    print(f"queue={args.queue} sockets={args.sockets} messages={args.messages}")
+    print(f"{'nodes':>5} {'seconds':>9} {'msg/s':>10} {'delivered':>10}")
+    for size in args.nodes:
+        cluster = Cluster(size, args.queue)
+        try:
+            cluster.attach(args.sockets)
+            elapsed, finished = cluster.run(args.messages, args.sockets, args.timeout)
+        finally:
+            cluster.close()
+        note = "" if finished else "  (timed out)"
+        print(f"{size:>5} {elapsed:>9.3f} {args.messages / elapsed:>10.0f} {cluster.delivered:>10}{note}")
+
+
+if __name__ == "__main__":
+    main()
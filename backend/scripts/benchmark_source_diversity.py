@@ -0,0 +1,124 @@
+"""Micro-benchmark for the feed source-diversity helpers.
+
+Times ``distribute_sources`` and ``avoid_consecutive_sources`` from
+``app.api.content`` on 10k-1M synthetic items across skewed source
+distributions. The original quadratic implementations are included for
+comparison at the sizes where they finish in reasonable time.
+
+Usage:
+    python scripts/benchmark_source_diversity.py [--sizes 10000 100000 1000000]
+        [--legacy-max 20000] [--repeat 3]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.api.content import (  # noqa: E402
+    _get_item_user_id,
+    avoid_consecutive_sources,
+    distribute_sources,
+)
+
+
+def legacy_avoid_consecutive_sources(items):
+    result = list(items)
+    for i in range(1, len(result)):
+        prev_id = _get_item_user_id(result[i - 1])
+        curr_id = _get_item_user_id(result[i])
+        if prev_id is not None and curr_id == prev_id:
+            swap_idx = None
+            for j in range(i + 1, len(result)):
+                if _get_item_user_id(result[j]) != prev_id:
+                    swap_idx = j
+                    break
+            if swap_idx is not None:
+                result[i], result[swap_idx] = result[swap_idx], result[i]
+    return result
+
+
+def legacy_distribute_sources(items):
+    groups = OrderedDict()
+    for item in items:
+        groups.setdefault(_get_item_user_id(item), []).append(item)
+
+    result = []
+    active_keys = list(groups.keys())
+    while active_keys:
+        finished = []
+        for uid in active_keys:
+            user_items = groups.get(uid)
+            if user_items:
+                result.append(user_items.pop(0))
+            if not user_items:
+                finished.append(uid)
+        for uid in finished:
+            active_keys.remove(uid)
+            groups.pop(uid, None)
+    return result
+
+
+def uniform(rng, size):
+    return [rng.randrange(1000) for _ in range(size)]
+
+
+def zipf(rng, size):
+    sources = 5000
+    weights = [1 / (rank + 1) ** 1.2 for rank in range(sources)]
+    return rng.choices(range(sources), weights, k=size)
+
+
+def dominant(rng, size):
+    # One prolific source (e.g. a news feed) producing 90% of the posts
+    return [0 if rng.random() < 0.9 else rng.randrange(1, 200) for _ in range(size)]
+
+
+DISTRIBUTIONS = {"uniform": uniform, "zipf": zipf, "dominant": dominant}
+
+
+def best_of(fn, items, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(items)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--legacy-max", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    helpers = [
+        ("distribute_sources", distribute_sources, legacy_distribute_sources),
+        ("avoid_consecutive_sources", avoid_consecutive_sources, legacy_avoid_consecutive_sources),
+    ]
+
+    print(f"{'helper':<26} {'dist':<9} {'items':>9} {'new (s)':>10} {'legacy (s)':>11}")
+    for name, generate in DISTRIBUTIONS.items():
+        for size in args.sizes:
+            rng = random.Random(args.seed)
+            items = [SimpleNamespace(id=i, user_id=uid) for i, uid in enumerate(generate(rng, size))]
+            for label, current, legacy in helpers:
+                new_time = best_of(current, items, args.repeat)
+                if size <= args.legacy_max:
+                    started = time.perf_counter()
+                    expected = legacy(items)
+                    legacy_time = f"{time.perf_counter() - started:11.4f}"
+                    assert current(items) == expected, f"{label} output differs"
+                else:
+                    legacy_time = f"{'skipped':>11}"
+                print(f"{label:<26} {name:<9} {size:>9} {new_time:10.4f} {legacy_time}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Refresh the on-disk Seattle boundary/neighborhood snapshot.
+
+Downloads the layers from OpenStreetMap (Nominatim/Overpass via OSMnx) and
+writes a new snapshot version that app.utils loads lazily at runtime, so web
+and worker processes never hit OSM on cold start.
+
+The Docker images run it with ``--if-missing`` at build time, so a snapshot
+shipped in the build context is kept and otherwise one is fetched; a failed
+fetch fails the build.
+
+Usage:
+    python scripts/refresh_geo_snapshot.py [--output DIR] [--layer boundary --layer neighborhoods]
+    python scripts/refresh_geo_snapshot.py --if-missing
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.geo_snapshot import (  # noqa: E402
+    LAYERS,
+    SnapshotUnavailable,
+    fetch_live_layer,
+    load_layer,
+    write_snapshot,
+)
+from config import SEATTLE_GEO_SNAPSHOT_DIR  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default=SEATTLE_GEO_SNAPSHOT_DIR)
+    parser.add_argument("--layer", action="append", choices=LAYERS, dest="layers")
+    parser.add_argument(
+        "--if-missing",
+        action="store_true",
+        help="only fetch the layers that the current snapshot lacks or cannot load",
+    )
+    args = parser.parse_args()
+
+    if args.if_missing:
+        missing = []
+        for name in args.layers or LAYERS:
+            try:
+                load_layer(name, args.output)
+            except SnapshotUnavailable:
+                missing.append(name)
+        if not missing:
+            print(f"Snapshot in {args.output} is complete; nothing to fetch.")
+            return
+        args.layers = missing
+
+    layers = {}
+    for name in args.layers or LAYERS:
+        print(f"Fetching {name} from OSM...")
+        layers[name] = fetch_live_layer(name)
+        if layers[name].empty:
+            sys.exit(f"OSM returned no features for {name}; keeping the current snapshot.")
+        print(f"  {len(layers[name])} features")
+
+    # Carry over layers that were not refreshed this time
+    for name in LAYERS:
+        if name not in layers:
+            try:
+                layers[name] = load_layer(name, args.output)
+            except SnapshotUnavailable:
+                print(f"  no existing {name} layer to keep")
+
+    manifest = write_snapshot(layers, args.output)
+    print(f"Wrote snapshot {manifest['version']} to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
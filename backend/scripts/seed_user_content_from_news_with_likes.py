@@ -1,7 +1,15 @@
-from app.models import News, UserContent, Like, User, db
-from app.utils import get_top_image
-from datetime import datetime
+import argparse
+import os
 import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.fetchers.news_dedup import normalize_news_link  # noqa: E402
+from app.fetchers.news_saver import insert_news_rows  # noqa: E402
+from app.models import News, UserContent, User, db  # noqa: E402
+from app.utils import get_top_image  # noqa: E402
+
 
 def seed_usercontent_from_news(limit=10):
     komo_user = User.query.filter_by(username="Komo News").first()
@@ -9,39 +17,42 @@ def seed_usercontent_from_news(limit=10):
         raise ValueError("Komo News user not found")
 
     recent_news = News.query.order_by(News.timestamp.desc()).limit(limit).all()
-    all_users = User.query.all()
-    
-    if not all_users:
-        raise ValueError("No users found to seed likes.")
-
-    seeded_posts = []
 
+    # Likes are seeded as counts, the same way the news fetchers do it
+    rows = []
     for news_item in recent_news:
-        content = UserContent(
-            title=news_item.headline[:255],
-            body=news_item.headline,  # Can be replaced with a summarizer
-            thumbnail=news_item.image_url[:255] if news_item.image_url else get_top_image(news_item.headline)[:255],
-            created_at=news_item.timestamp,
-            updated_at=news_item.timestamp,
-            user_id=komo_user.id,
-            unique_id=random.randint(1000000000, 2999999999),
-            location=news_item.location,
-            latitude=None,
-            longitude=None,
-            is_seeded=True
-        )
-        db.session.add(content)
-        seeded_posts.append(content)
+        rows.append({
+            "title": news_item.headline[:255],
+            "body": news_item.headline,  # Can be replaced with a summarizer
+            "thumbnail": news_item.image_url[:255] if news_item.image_url else get_top_image(news_item.headline)[:255],
+            "created_at": news_item.timestamp,
+            "updated_at": news_item.timestamp,
+            "user_id": komo_user.id,
+            "unique_id": random.randint(1000000000, 2999999999),
+            "location": news_item.location,
+            "latitude": None,
+            "longitude": None,
+            "news_link": news_item.link,
+            "news_link_key": normalize_news_link(news_item.link),
+            "is_seeded": True,
+            "seed_type": "news",
+            "seeded_likes_count": random.randint(15, 60),
+            "seeded_comments_count": 0,
+        })
 
+    # Articles seeded before are skipped by the unique link key
+    inserted = insert_news_rows(db.session, UserContent, rows)
     db.session.commit()
-    print(f"✅ Seeded {len(seeded_posts)} UserContent posts from News.")
-
-    # Now, simulate likes
-    for post in seeded_posts:
-        like_count = random.randint(15, 60)
-        selected_users = random.sample(all_users, min(like_count, len(all_users)))
-        for user in selected_users:
-            db.session.add(Like(user_id=user.id, post_id=post.id))
-    
-    db.session.commit()
-    print(f"✅ Added random likes to {len(seeded_posts)} posts.")
+    print(f"✅ Seeded {len(inserted)} UserContent posts from News ({len(rows) - len(inserted)} already present).")
+
+
+if __name__ == "__main__":
+    from app import create_app
+
+    parser = argparse.ArgumentParser(description="Seed UserContent posts from the News table.")
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    app, _ = create_app()
+    with app.app_context():
+        seed_usercontent_from_news(args.limit)
@@ -0,0 +1,154 @@
+import pytest
+from sqlalchemy import event
+
+from app import user_cache
+from app.extensions import db
+from app.models import Notification, User
+from app.notifications import create_notifications
+from app.user_cache import LocalInvalidationBus, build_bus, clear_user_cache, load_session_user
+
+
+@pytest.fixture
+def bus(monkeypatch):
+    bus = build_bus("memory://")
+    monkeypatch.setattr(user_cache, "_bus", bus)
+    yield bus
+    bus.close()
+
+
+@pytest.fixture
+def cached(app, monkeypatch, bus):
+    monkeypatch.setitem(app.config, "USER_CACHE_TTL_SECONDS", 30)
+    clear_user_cache()
+    yield
+    clear_user_cache()
+
+
+@pytest.fixture
+def user_queries(app):
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        if "FROM users" in statement:
+            statements.append(statement)
+
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", count)
+        yield statements
+        event.remove(db.engine, "before_cursor_execute", count)
+
+
+def test_cached_user_is_attached_without_a_query(cached, test_user, user_queries):
+    db.session.expunge_all()
+    assert load_session_user(test_user.id).username == "auth_user"
+    queries = len(user_queries)
+
+    db.session.expunge_all()
+    user = load_session_user(test_user.id)
+
+    assert len(user_queries) == queries
+    assert user in db.session
+    assert user.username == "auth_user"
+    assert user.is_blocking(user) is False  # relationships still load
+
+
+def test_edit_profile_invalidates_the_cached_user(cached, client, test_user, login):
+    login(test_user)
+    load_session_user(test_user.id)
+
+    response = client.patch("/api/v1/profile/edit_profile", json={"bio": "updated"})
+
+    assert response.status_code == 200
+    db.session.expunge_all()
+    assert load_session_user(test_user.id).bio == "updated"
+
+
+def test_block_and_unblock_reload_both_users(cached, client, test_user, users, user_queries, login):
+    login(test_user)
+    load_session_user(test_user.id)
+    load_session_user(users[0].id)
+
+    assert client.post(f"/api/v1/block/{users[0].id}").status_code == 200
+    db.session.expunge_all()
+    queries = len(user_queries)
+    load_session_user(test_user.id)
+    load_session_user(users[0].id)
+
+    assert len(user_queries) == queries + 2
+
+
+def test_ttl_zero_disables_the_cache(app, test_user, user_queries):
+    user_id = test_user.id
+    queries = len(user_queries)
+    for _ in range(2):
+        db.session.expunge_all()
+        load_session_user(user_id)
+
+    assert len(user_queries) == queries + 2
+
+
+def test_without_an_invalidation_bus_the_cache_is_off(app, monkeypatch, test_user, user_queries):
+    monkeypatch.setitem(app.config, "USER_CACHE_TTL_SECONDS", 30)
+    monkeypatch.setattr(user_cache, "_bus", None)
+    user_id = test_user.id
+    queries = len(user_queries)
+    for _ in range(2):
+        db.session.expunge_all()
+        load_session_user(user_id)
+
+    assert len(user_queries) == queries + 2
+
+
+def test_invalidation_from_another_node_reloads_the_user(cached, test_user, user_queries):
+    load_session_user(test_user.id)
+    db.session.expunge_all()
+    queries = len(user_queries)
+
+    # Another web node on the same channel updates the user
+    LocalInvalidationBus().publish([test_user.id])
+    load_session_user(test_user.id)
+
+    assert len(user_queries) == queries + 1
+
+
+def test_orm_update_publishes_after_commit(cached, test_user, bus, monkeypatch):
+    published = []
+    monkeypatch.setattr(bus, "publish", published.append)
+
+    user = db.session.get(User, test_user.id)
+    user.bio = "changed"
+    db.session.flush()
+    assert published == []  # not visible to other nodes yet
+
+    db.session.commit()
+    assert published == [[test_user.id]]
+
+
+def test_core_counter_updates_invalidate_the_user(cached, test_user, users, user_queries):
+    load_session_user(test_user.id)
+
+    create_notifications([test_user.id], users[0].id, "group_message", "hi")
+    db.session.commit()
+    db.session.expunge_all()
+
+    assert load_session_user(test_user.id).unread_notifications_count == 1
+    assert Notification.query.filter_by(user_id=test_user.id).count() == 1
+
+
+def test_load_racing_an_invalidation_is_not_cached(cached, test_user, monkeypatch, user_queries):
+    user_id = test_user.id
+    real_get = db.session.get
+
+    def get_then_invalidated(model, ident):
+        row = real_get(model, ident)
+        LocalInvalidationBus().publish([ident])  # committed elsewhere mid-load
+        return row
+
+    monkeypatch.setattr(db.session, "get", get_then_invalidated)
+    load_session_user(user_id)
+    monkeypatch.undo()
+
+    db.session.expunge_all()
+    queries = len(user_queries)
+    load_session_user(user_id)
+    assert len(user_queries) == queries + 1
@@ -0,0 +1,131 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.extensions import db
+from app.models import DirectChat, DirectMessage, GroupChat, GroupChatMember, GroupMessage, RoleEnum
+
+
+@pytest.fixture
+def history(session, users):
+    """Seven messages in a direct chat and a group; the last three share a timestamp."""
+    start = datetime(2026, 1, 1, 12)
+    times = [start + timedelta(minutes=i) for i in range(4)] + [start + timedelta(minutes=5)] * 3
+
+    chat = DirectChat(user1_id=users[0].id, user2_id=users[1].id)
+    group = GroupChat(name="Neighbors", created_by=users[0].id)
+    session.add_all([chat, group])
+    session.commit()
+    session.add_all(
+        GroupChatMember(group_chat_id=group.id, user_id=user.id, role=RoleEnum.MEMBER) for user in users
+    )
+    direct_ids, group_ids = [], []
+    for i, at in enumerate(times):
+        direct = DirectMessage(chat_id=chat.id, sender_id=users[i % 2].id, content=f"d{i}", created_at=at)
+        grouped = GroupMessage(group_chat_id=group.id, sender_id=users[i % 5].id, content=f"g{i}", created_at=at)
+        session.add_all([direct, grouped])
+        session.flush()
+        direct_ids.append(direct.id)
+        group_ids.append(grouped.id)
+    session.commit()
+    return {"chat": chat.id, "group": group.id, "direct_ids": direct_ids, "group_ids": group_ids}
+
+
+def _page(client, url, **params):
+    response = client.get(url, query_string=params)
+    assert response.status_code == 200, response.get_json()
+    data = response.get_json()["data"]
+    return [m["id"] for m in data["messages"]], data["pagination"]
+
+
+def test_before_pages_back_through_equal_timestamps(client, users, history, login):
+    login(users[0])
+    url = f"/api/v1/chat/direct/{history['chat']}/messages"
+    expected = list(reversed(history["direct_ids"]))
+
+    seen, cursor = [], ""
+    while cursor is not None:
+        ids, pagination = _page(client, url, before=cursor, limit=3)
+        assert pagination["mode"] == "cursor"
+        seen += ids
+        cursor = pagination["next_cursor"]
+
+    assert seen == expected
+
+
+def test_after_returns_newer_messages_oldest_first(client, users, history, login):
+    login(users[2])
+    url = f"/api/v1/group/messages/{history['group']}"
+    ids = history["group_ids"]
+
+    page, pagination = _page(client, url, after=ids[2], limit=3)
+    assert page == ids[3:6]
+    assert pagination["has_more"] is True
+
+    page, pagination = _page(client, url, after=pagination["next_cursor"], limit=3)
+    assert page == ids[6:]
+    assert (pagination["has_more"], pagination["next_cursor"]) == (False, None)
+
+
+def test_page_mode_is_unchanged(client, users, history, login):
+    login(users[0])
+
+    response = client.get(f"/api/v1/chat/direct/{history['chat']}/messages", query_string={"limit": 3})
+
+    data = response.get_json()["data"]
+    assert data["pagination"]["total_items"] == 7
+    assert [m["id"] for m in data["messages"]] == list(reversed(history["direct_ids"]))[:3]
+
+
+@pytest.mark.parametrize("params", [{"before": "abc"}, {"before": "1", "after": "2"}, {"after": "0"}])
+def test_malformed_cursor_is_rejected(client, users, history, params, login):
+    login(users[0])
+
+    response = client.get(f"/api/v1/chat/direct/{history['chat']}/messages", query_string=params)
+
+    assert response.status_code == 400
+
+
+def test_cursor_from_another_chat_is_rejected(client, session, users, history, login):
+    other = DirectChat(user1_id=users[0].id, user2_id=users[2].id)
+    session.add(other)
+    session.commit()
+    foreign = DirectMessage(chat_id=other.id, sender_id=users[2].id, content="elsewhere")
+    session.add(foreign)
+    session.commit()
+    login(users[0])
+
+    response = client.get(f"/api/v1/chat/direct/{history['chat']}/messages", query_string={"before": foreign.id})
+
+    assert response.status_code == 400
+
+
+@pytest.fixture
+def user_queries(app):
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        if "FROM users" in statement:
+            statements.append(statement)
+
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", count)
+        yield statements
+        event.remove(db.engine, "before_cursor_execute", count)
+
+
+def test_senders_load_with_one_query_per_page(client, session, users, history, user_queries, login):
+    login(users[0])
+    url = f"/api/v1/group/messages/{history['group']}"
+    _page(client, url, before="")  # loads the session user
+
+    counts = []
+    for limit in (1, 7):
+        session.expunge_all()
+        del user_queries[:]
+        ids, _ = _page(client, url, before="", limit=limit)
+        assert len(ids) == limit
+        counts.append(len(user_queries))
+
+    assert counts[0] == counts[1]
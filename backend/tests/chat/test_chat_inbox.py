@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.chat_inbox import record_direct_message, record_group_message
+from app.models import DirectChat, DirectMessage, GroupChat, GroupChatMember, GroupMessage, RoleEnum
+
+
+def _chat(session, a, b):
+    chat = DirectChat(user1_id=a.id, user2_id=b.id)
+    session.add(chat)
+    session.commit()
+    return chat
+
+
+def _message(session, chat, sender, content, at):
+    message = DirectMessage(chat_id=chat.id, sender_id=sender.id, content=content, created_at=at)
+    session.add(message)
+    record_direct_message(message)
+    session.commit()
+    return message
+
+
+@pytest.fixture
+def inbox(session, users):
+    """users[0] has three direct chats and one group, each with one message a minute apart."""
+    me = users[0]
+    start = datetime(2026, 1, 1, 12)
+    chats = [_chat(session, me, users[i]) for i in (1, 2, 3)]
+    _message(session, chats[0], users[1], "oldest", start)
+    _message(session, chats[1], me, "middle", start + timedelta(minutes=2))
+    _message(session, chats[2], users[3], "newest", start + timedelta(minutes=3))
+
+    group = GroupChat(name="Neighbors", created_by=users[4].id)
+    session.add(group)
+    session.commit()
+    session.add(GroupChatMember(group_chat_id=group.id, user_id=me.id, role=RoleEnum.MEMBER))
+    message = GroupMessage(group_chat_id=group.id, sender_id=users[4].id, content="group",
+                           created_at=start + timedelta(minutes=1))
+    session.add(message)
+    record_group_message(message)
+    session.commit()
+    return {"chats": [c.id for c in chats], "group": group.id}
+
+
+def test_sending_moves_the_last_message_pointer(client, session, users, inbox, login):
+    login(users[1])
+
+    response = client.post("/api/v1/chat/direct/send", json={"chat_id": inbox["chats"][0], "content": "hi"})
+
+    assert response.status_code == 201
+    message_id = response.get_json()["data"]["message_data"]["id"]
+    session.expire_all()
+    assert session.get(DirectChat, inbox["chats"][0]).last_message_id == message_id
+
+
+def test_older_message_does_not_move_the_pointer_back(session, users, inbox):
+    chat = session.get(DirectChat, inbox["chats"][2])
+    newest = chat.last_message_id
+
+    _message(session, chat, users[0], "late arrival", datetime(2025, 1, 1))
+
+    session.expire_all()
+    assert session.get(DirectChat, chat.id).last_message_id == newest
+
+
+def test_deleting_the_last_message_falls_back_to_the_previous_one(client, session, users, inbox, login):
+    chat = session.get(DirectChat, inbox["chats"][1])
+    previous = chat.last_message_id
+    login(users[0])
+    response = client.post("/api/v1/chat/direct/send", json={"chat_id": chat.id, "content": "oops"})
+    message_id = response.get_json()["data"]["message_data"]["id"]
+
+    response = client.delete(
+        f"/api/v1/chat/direct-chat/delete-message/{message_id}", json={"delete_for_all": True}
+    )
+
+    assert response.status_code == 200
+    session.expire_all()
+    assert session.get(DirectChat, chat.id).last_message_id == previous
+
+
+def test_direct_list_pages_newest_first(client, users, inbox, login):
+    login(users[0])
+
+    page = client.get("/api/v1/chat/direct/list?limit=2").get_json()["data"]
+    assert [c["latest_message"]["content"] for c in page["chats"]] == ["newest", "middle"]
+    assert (page["total_chats"], page["total_pages"]) == (3, 2)
+    assert page["chats"][0]["receiver"]["id"] == users[3].id
+
+    first = client.get("/api/v1/chat/direct/list?limit=2&cursor=").get_json()["data"]
+    cursor = first["pagination"]["next_cursor"]
+    rest = client.get(f"/api/v1/chat/direct/list?limit=2&cursor={cursor}").get_json()["data"]
+    assert [c["latest_message"]["content"] for c in rest["chats"]] == ["oldest"]
+    assert rest["pagination"]["has_next"] is False
+
+
+def test_combined_list_interleaves_direct_and_group_chats(client, users, inbox, login):
+    login(users[0])
+
+    page = client.get("/api/v1/chat/list/all?limit=10").get_json()["data"]
+    assert [(c["type"], c["latest_message"]["content"]) for c in page["chats"]] == [
+        ("direct", "newest"),
+        ("direct", "middle"),
+        ("group", "group"),
+        ("direct", "oldest"),
+    ]
+    assert page["chats"][2]["name"] == "Neighbors"
+
+    seen, cursor = [], ""
+    while cursor is not None:
+        data = client.get(f"/api/v1/chat/list/all?limit=3&cursor={cursor}").get_json()["data"]
+        seen += [c["chat_id"] for c in data["chats"]]
+        cursor = data["pagination"]["next_cursor"]
+    assert seen == [c["chat_id"] for c in page["chats"]]
@@ -0,0 +1,128 @@
+import pytest
+from sqlalchemy import event
+
+from app import realtime
+from app.extensions import db
+from app.group_fanout import fan_out_group_message
+from app.models import GroupChat, GroupChatMember, GroupMessage, Notification, RoleEnum, User
+
+
+@pytest.fixture
+def group(session, users):
+    group = GroupChat(name="Neighbors", created_by=users[0].id)
+    session.add(group)
+    session.commit()
+    session.add_all(
+        GroupChatMember(group_chat_id=group.id, user_id=user.id, role=RoleEnum.MEMBER) for user in users
+    )
+    session.commit()
+    return group.id
+
+
+@pytest.fixture
+def eager_tasks(monkeypatch):
+    from app.tasks import celery
+
+    monkeypatch.setitem(celery.conf, "task_always_eager", True)
+
+
+@pytest.fixture
+def emitted(monkeypatch):
+    batches = []
+    monkeypatch.setattr(
+        "app.group_fanout.send_notifications", lambda user_ids, data: batches.append((list(user_ids), data))
+    )
+    return batches
+
+
+def _message(session, group_id, sender):
+    message = GroupMessage(group_chat_id=group_id, sender_id=sender.id, content="hello")
+    session.add(message)
+    session.commit()
+    return message.id
+
+
+@pytest.fixture
+def queued(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        "app.tasks.fan_out_group_message.delay", lambda *args, **kwargs: calls.append((args, kwargs))
+    )
+    return calls
+
+
+def test_send_enqueues_fan_out_instead_of_notifying_inline(client, users, group, queued, emitted, monkeypatch,
+                                                          login):
+    monkeypatch.setattr(realtime, "SOCKETIO_MESSAGE_QUEUE", "memory://")
+    login(users[0])
+
+    response = client.post("/api/v1/group/message/send", json={"group_chat_id": group, "content": "hi"})
+
+    assert response.status_code == 201
+    assert queued == [((response.get_json()["data"]["message"]["id"],), {"emit": True})]
+    assert Notification.query.count() == 0
+    assert emitted == []
+
+
+def test_without_a_queue_this_node_emits_after_the_request(client, users, group, queued, emitted,
+                                                           monkeypatch, login):
+    monkeypatch.setattr(realtime, "SOCKETIO_MESSAGE_QUEUE", "")
+    background = []
+    monkeypatch.setattr("app.group_fanout.socketio.start_background_task", background.append)
+    login(users[0])
+
+    response = client.post("/api/v1/group/message/send", json={"group_chat_id": group, "content": "hi"})
+
+    assert response.status_code == 201
+    assert queued[0][1] == {"emit": False}
+    assert emitted == []
+
+    background[0]()
+    assert sorted(i for user_ids, _ in emitted for i in user_ids) == sorted(user.id for user in users[1:])
+
+
+def test_send_notifies_every_other_member(client, session, users, group, emitted, eager_tasks, monkeypatch,
+                                          login):
+    monkeypatch.setattr(realtime, "SOCKETIO_MESSAGE_QUEUE", "memory://")
+    login(users[0])
+
+    response = client.post("/api/v1/group/message/send", json={"group_chat_id": group, "content": "hi"})
+
+    assert response.status_code == 201
+    recipients = {user.id for user in users[1:]}
+    assert {n.user_id for n in Notification.query.filter_by(type="group_message")} == recipients
+    session.expire_all()
+    assert {u.id: u.unread_notifications_count for u in User.query} == {
+        user.id: int(user.id in recipients) for user in users
+    }
+    assert sorted(i for user_ids, _ in emitted for i in user_ids) == sorted(recipients)
+
+
+def test_fan_out_inserts_and_emits_per_batch(app, session, users, group, emitted):
+    message_id = _message(session, group, users[2])
+    inserts = []
+
+    def count(conn, cursor, statement, *args):
+        if statement.startswith("INSERT INTO notification"):
+            inserts.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", count)
+    try:
+        assert fan_out_group_message(message_id, batch_size=3) == 4
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count)
+
+    others = sorted(user.id for user in users if user.id != users[2].id)
+    assert len(inserts) == 2
+    assert [user_ids for user_ids, _ in emitted] == [others[:3], others[3:]]
+    assert emitted[0][1]["message"]["id"] == message_id
+
+
+def test_deleted_message_notifies_nobody(session, users, group, emitted):
+    message_id = _message(session, group, users[0])
+    session.delete(session.get(GroupMessage, message_id))
+    session.commit()
+
+    assert fan_out_group_message(message_id) == 0
+    assert emitted == []
+    assert Notification.query.count() == 0
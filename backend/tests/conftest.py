@@ -22,6 +22,7 @@ def app():
     app.config["APPLICATION_ROOT"] = "/"
     app.config["PREFERRED_URL_SCHEME"] = "http"
     app.config["TESTING"] = True  # Ensures test mode is enabled
+    app.config["USER_CACHE_TTL_SECONDS"] = 0  # ids are reused after each wipe
 
     with app.app_context():
         db.create_all()
@@ -88,8 +89,16 @@ def session(app):
         session.remove()
 
 
+@pytest.fixture(scope="session")
+def users_password_hash():
+    """One hash shared by every ``users`` fixture; hashing is slow on purpose."""
+    user = User()
+    user.set_password("SecureP@ss123")
+    return user.password_hash
+
+
 @pytest.fixture
-def users(session):
+def users(session, users_password_hash):
     """Creates test users with valid names."""
     users = [
         User(
@@ -101,7 +110,7 @@ def users(session):
         for i in range(5)
     ]
     for user in users:
-        user.set_password("SecureP@ss123")
+        user.password_hash = users_password_hash
         session.add(user)
     session.commit()
     return users
@@ -124,6 +133,21 @@ def client_authenticated(client, test_user):
     return client
 
 
+@pytest.fixture
+def login(client):
+    """Return ``login(user)``, which makes ``client``'s next requests run as ``user``."""
+
+    def _login(user):
+        # The app context is shared, so drop the user Flask-Login cached in g
+        g.pop("_login_user", None)
+        with client.session_transaction() as session:
+            session["_user_id"] = str(user.id)
+            session["_fresh"] = True
+        return client
+
+    return _login
+
+
 @pytest.fixture(scope="function", autouse=True)
 def clear_database(session):
     """Ensure the database is cleaned before each test."""
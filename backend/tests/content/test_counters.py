@@ -0,0 +1,100 @@
+from datetime import datetime
+
+import pytest
+
+from app.counters import reconcile_counters
+from app.models import Comment, ContentScore, Follow, Repost, User, UserContent
+
+
+@pytest.fixture
+def post(session, users):
+    item = UserContent(
+        title="Post",
+        body="",
+        user_id=users[0].id,
+        is_in_seattle=True,
+        created_at=datetime.utcnow(),
+    )
+    session.add(item)
+    session.commit()
+    return item
+
+
+def _user(session, user_id):
+    session.expire_all()
+    return session.get(User, user_id)
+
+
+def test_follow_and_unfollow_maintain_both_counters(client, session, users, login):
+    follower, followed = users[0].id, users[1].id
+    login(users[0])
+
+    assert client.post(f"/api/v1/follow/{followed}").status_code == 200
+    assert (_user(session, follower).following_count, _user(session, followed).followers_count) == (1, 1)
+
+    profile = client.get(f"/api/v1/profile/{users[1].username}").get_json()
+    assert profile["data"]["relationships"]["followers"] == 1
+
+    assert client.post(f"/api/v1/unfollow/{followed}").status_code == 200
+    assert (_user(session, follower).following_count, _user(session, followed).followers_count) == (0, 0)
+
+
+def test_reply_increments_parent_replies_count(client, session, users, post, login):
+    login(users[1])
+    parent = Comment(content="top", content_id=post.id, content_type="user_content", user_id=users[0].id)
+    session.add(parent)
+    session.commit()
+
+    for text in ("one", "two"):
+        response = client.post(
+            "/api/v1/comments/post_comment",
+            json={"content": text, "content_id": post.id, "content_type": "user_content", "parent_id": parent.id},
+        )
+        assert response.status_code == 201
+
+    session.expire_all()
+    assert session.get(Comment, parent.id).replies_count == 2
+
+
+def test_repost_and_undo_maintain_reposts_count(client, session, users, post, login):
+    login(users[1])
+
+    assert client.post(f"/api/v1/content/repost/{post.id}", json={}).status_code == 201
+    session.expire_all()
+    assert session.get(ContentScore, post.id).reposts_count == 1
+
+    assert client.post(f"/api/v1/content/undo_repost/{post.id}").status_code == 200
+    session.expire_all()
+    assert session.get(ContentScore, post.id).reposts_count == 0
+
+
+def test_reconcile_repairs_drift(session, users, post):
+    # Rows written around the endpoints leave the counters stale
+    session.add_all([
+        Follow(follower_id=users[1].id, followed_id=users[0].id),
+        Follow(follower_id=users[2].id, followed_id=users[0].id),
+        Repost(user_id=users[1].id, content_id=post.id),
+    ])
+    parent = Comment(content="top", content_id=post.id, content_type="user_content", user_id=users[0].id)
+    session.add(parent)
+    session.commit()
+    session.add(Comment(content="reply", content_id=post.id, content_type="user_content",
+                        user_id=users[1].id, parent_id=parent.id))
+    session.commit()
+
+    repaired = reconcile_counters()
+
+    assert repaired["followers"] == 1
+    assert repaired["following"] == 2
+    assert repaired["replies"] == 1
+    assert repaired["content_scores"] == 1
+    session.expire_all()
+    assert session.get(User, users[0].id).followers_count == 2
+    assert session.get(User, users[1].id).following_count == 1
+    assert session.get(Comment, parent.id).replies_count == 1
+    score = session.get(ContentScore, post.id)
+    assert (score.reposts_count, score.comments_count) == (1, 2)
+
+    assert reconcile_counters() == {
+        "followers": 0, "following": 0, "unread_notifications": 0, "replies": 0, "content_scores": 0,
+    }
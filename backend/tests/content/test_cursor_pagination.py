@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.engagement_scores import record_engagement
+from app.models import UserContent
+from app.pagination import InvalidCursor, decode_cursor, encode_cursor
+
+
+@pytest.fixture
+def posts(session, users):
+    now = datetime.utcnow()
+    items = [
+        UserContent(
+            title=f"Post {i}",
+            body="",
+            user_id=users[i % len(users)].id,
+            thumbnail=f"https://example.com/post{i}.jpg",
+            is_in_seattle=True,
+            created_at=now - timedelta(minutes=i),
+        )
+        for i in range(12)
+    ]
+    session.add_all(items)
+    session.commit()
+    return items
+
+
+def _walk(client, url, per_page):
+    ids, cursor, pages = [], "", 0
+    while cursor is not None:
+        response = client.get(url, query_string={"per_page": per_page, "cursor": cursor})
+        assert response.status_code == 200
+        payload = response.get_json()
+        ids.extend(item["id"] for item in payload["data"]["content"])
+        cursor = payload["pagination"]["next_cursor"]
+        pages += 1
+    return ids, pages
+
+
+def test_cursor_round_trip_preserves_datetimes():
+    created_at = datetime(2026, 10, 17, 9, 30, 15, 123456)
+    cursor = encode_cursor([created_at, 42])
+    assert decode_cursor(cursor, 2) == [created_at, 42]
+    assert decode_cursor("", 2) is None
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor([1]), "%%%"])
+def test_decode_cursor_rejects_garbage(cursor):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor, 2)
+
+
+def test_ranked_feed_cursor_walk_matches_score_order(client, session, posts):
+    # Ties on score (the untouched posts) fall back to id order
+    record_engagement(posts[3].id, shares=1)
+    record_engagement(posts[1].id, reactions=1)
+    session.commit()
+    post_ids = [post.id for post in posts]
+
+    ids, pages = _walk(client, "/api/v1/content/", per_page=5)
+
+    untouched = [post_id for post_id in post_ids if post_id not in (post_ids[1], post_ids[3])]
+    assert ids == [post_ids[3], post_ids[1]] + sorted(untouched, reverse=True)
+    assert pages == 3
+
+
+def test_ranked_feed_page_mode_still_counts(client, posts):
+    response = client.get("/api/v1/content/", query_string={"page": 2, "per_page": 2})
+
+    pagination = response.get_json()["pagination"]
+    assert pagination["total_items"] == 12
+    assert pagination["has_prev"] is True
+
+
+def test_ranked_feed_rejects_invalid_cursor(client, posts):
+    response = client.get("/api/v1/content/", query_string={"cursor": "bogus"})
+    assert response.status_code == 400
+
+
+def test_recency_feed_cursor_walk(client, posts):
+    post_ids = [post.id for post in posts]
+    ids, cursor, pages = [], "", 0
+    while cursor is not None:
+        pages += 1
+        payload = client.get("/api/v1/content/user-content", query_string={"cursor": cursor}).get_json()
+        ids.extend(item["id"] for item in payload["content"])
+        cursor = payload["nextCursor"]
+        assert payload["hasMore"] is (cursor is not None)
+
+    # Newest first: posts were created one minute apart in index order
+    assert ids == post_ids
+    assert pages == 2
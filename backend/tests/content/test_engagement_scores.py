@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta
+from math import exp
+
+import pytest
+
+from app.api.content import fetch_high_score_content
+from app.engagement_scores import (
+    decay_content_scores,
+    rebuild_content_scores,
+    record_engagement,
+)
+from app.models import Comment, ContentScore, Reaction, ReactionType, UserContent
+
+
+@pytest.fixture
+def posts(session, users):
+    now = datetime.utcnow()
+    items = [
+        UserContent(
+            title=f"Post {i}",
+            body="",
+            user_id=users[i].id,
+            thumbnail=f"https://example.com/post{i}.jpg",
+            is_in_seattle=True,
+            created_at=now - timedelta(hours=i),
+        )
+        for i in range(3)
+    ]
+    session.add_all(items)
+    session.commit()
+    return items
+
+
+def test_new_content_gets_zero_score_row(session, posts):
+    rows = session.query(ContentScore).order_by(ContentScore.content_id).all()
+    assert [row.content_id for row in rows] == [post.id for post in posts]
+    assert all(row.score == 0 and row.raw_score == 0 for row in rows)
+
+
+def test_record_engagement_updates_counts_and_score(session, posts):
+    post = posts[1]
+    now = post.created_at + timedelta(days=1)
+
+    record_engagement(post.id, reactions=2, comments=1, shares=1, now=now)
+    session.commit()
+
+    row = session.get(ContentScore, post.id)
+    session.refresh(row)
+    assert (row.reactions_count, row.comments_count, row.shares_count) == (2, 1, 1)
+    assert row.raw_score == 2 * 2 + 3 * 1 + 5 * 1
+    assert row.score == pytest.approx(12 * exp(-1))
+
+    record_engagement(post.id, reactions=-1, now=now)
+    session.commit()
+    session.refresh(row)
+    assert row.reactions_count == 1
+    assert row.raw_score == 10
+
+
+def test_rebuild_repairs_drift(session, users, posts):
+    post = posts[0]
+    session.add(
+        Reaction(
+            user_id=users[1].id,
+            content_id=post.id,
+            content_type="user_content",
+            reaction_type=ReactionType.LIKE,
+        )
+    )
+    session.add(
+        Comment(content="hi", content_id=post.id, content_type="user_content", user_id=users[2].id)
+    )
+    session.commit()
+
+    assert rebuild_content_scores() == len(posts)
+    session.commit()
+
+    row = session.get(ContentScore, post.id)
+    session.refresh(row)
+    assert (row.reactions_count, row.comments_count, row.raw_score) == (1, 1, 5)
+
+
+def test_decay_content_scores_only_touches_engaged_posts(session, posts):
+    post = posts[2]
+    record_engagement(post.id, shares=1)
+    session.commit()
+
+    later = datetime.utcnow() + timedelta(days=2)
+    assert decay_content_scores(now=later) == 1
+
+    row = session.get(ContentScore, post.id)
+    session.refresh(row)
+    age_days = (later - post.created_at).total_seconds() / 86400
+    assert row.score == pytest.approx(5 * exp(-age_days))
+
+
+def test_feed_orders_by_materialized_score(session, posts):
+    record_engagement(posts[2].id, shares=1)
+    record_engagement(posts[1].id, reactions=1)
+    session.commit()
+
+    items, total = fetch_high_score_content(page=1, per_page=10, user_id=None)
+
+    assert total == 3
+    assert [item.id for item in items] == [posts[2].id, posts[1].id, posts[0].id]
@@ -0,0 +1,83 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from app import db
+from app.feed_hydration import hydrate_feed
+from app.models import Comment, Reaction, ReactionType, Repost, UserContent
+
+
+@pytest.fixture
+def posts(session, users):
+    items = [
+        UserContent(
+            title=f"Post {i}",
+            user_id=users[0].id,
+            thumbnail=f"https://example.com/post{i}.jpg",
+            created_at=datetime.utcnow(),
+        )
+        for i in range(3)
+    ]
+    session.add_all(items)
+    session.commit()
+    return items
+
+
+def _react(session, user, post, reaction_type):
+    session.add(
+        Reaction(
+            user_id=user.id,
+            content_id=post.id,
+            content_type="user_content",
+            reaction_type=reaction_type,
+        )
+    )
+
+
+def test_hydrate_feed_counts_and_top_reactions(session, users, posts):
+    _react(session, users[1], posts[0], ReactionType.LOVE)
+    _react(session, users[2], posts[0], ReactionType.HAHA)
+    _react(session, users[3], posts[0], ReactionType.HAHA)
+    _react(session, users[4], posts[0], ReactionType.LIKE)
+    session.add(Comment(content="hi", content_id=posts[0].id, content_type="user_content", user_id=users[1].id))
+    session.add(Repost(user_id=users[1].id, content_id=posts[1].id))
+    session.commit()
+
+    hydration = hydrate_feed([post.id for post in posts], viewer_id=users[1].id)
+
+    assert hydration.reactions_count == {posts[0].id: 4}
+    assert hydration.comments_count == {posts[0].id: 1}
+    # HAHA leads; LIKE and LOVE tie and LIKE wins on enum order
+    assert hydration.top_reactions[posts[0].id] == ["haha", "like"]
+    assert hydration.viewer_fields(posts[0].id) == {
+        "user_has_reacted": True,
+        "user_reaction_type": "love",
+        "has_user_reposted": False,
+    }
+    assert hydration.viewer_fields(posts[1].id)["has_user_reposted"] is True
+
+
+def test_hydrate_feed_query_count_is_independent_of_page_size(session, users, posts):
+    post_ids = [post.id for post in posts]
+    viewer_id = users[1].id
+    statements = []
+
+    def count(*_):
+        statements.append(1)
+
+    event.listen(db.engine, "before_cursor_execute", count)
+    try:
+        hydrate_feed(post_ids[:1], viewer_id=viewer_id)
+        single = len(statements)
+        statements.clear()
+        hydrate_feed(post_ids, viewer_id=viewer_id)
+        assert len(statements) == single == 4
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count)
+
+
+def test_hydrate_feed_without_ids_runs_no_queries(session):
+    hydration = hydrate_feed([], viewer_id=1)
+    assert hydration.reactions_count == {}
+    assert hydration.viewer_fields(1)["user_has_reacted"] is False
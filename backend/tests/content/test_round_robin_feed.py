@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.api.content import (
+    distribute_sources,
+    fetch_combined_content_round_robin,
+    fetch_seeded_content_round_robin,
+)
+from app.models import UserContent
+
+
+@pytest.fixture
+def posts(session, users):
+    now = datetime.utcnow()
+    # (author index, minutes ago, seeded) -- uneven sources and a timestamp tie
+    layout = [
+        (0, 1, True), (0, 2, True), (0, 3, True), (0, 9, True),
+        (1, 4, False), (1, 4, False), (1, 20, False),
+        (2, 0, True), (2, 30, True),
+        (3, 5, False),
+    ]
+    items = [
+        UserContent(
+            title=f"Post {i}",
+            body="",
+            user_id=users[author].id,
+            thumbnail=f"https://example.com/post{i}.jpg",
+            is_seeded=seeded,
+            seed_type="news" if seeded else None,
+            created_at=now - timedelta(minutes=minutes),
+        )
+        for i, (author, minutes, seeded) in enumerate(layout)
+    ]
+    session.add_all(items)
+    session.commit()
+    return items
+
+
+def _expected(items):
+    newest_first = sorted(items, key=lambda item: (item.created_at, item.id), reverse=True)
+    return [item.id for item in distribute_sources(newest_first)]
+
+
+def _collect(fetch, per_page):
+    ids, page = [], 1
+    while True:
+        posts, total = fetch(page=page, per_page=per_page)
+        if not posts:
+            return ids, total
+        ids.extend(post.id for post in posts)
+        page += 1
+
+
+def test_combined_round_robin_matches_distribute_sources(session, posts):
+    ids, total = _collect(fetch_combined_content_round_robin, per_page=3)
+
+    assert total == len(posts)
+    assert ids == _expected(posts)
+
+
+def test_seeded_round_robin_only_returns_seeded_posts(session, posts):
+    ids, total = _collect(fetch_seeded_content_round_robin, per_page=4)
+
+    seeded = [post for post in posts if post.is_seeded]
+    assert total == len(seeded)
+    assert ids == _expected(seeded)
+
+
+def test_round_robin_page_preloads_authors(session, users, posts):
+    page, _ = fetch_combined_content_round_robin(page=1, per_page=2)
+
+    assert [post.user.username for post in page] == [users[2].username, users[0].username]
@@ -0,0 +1,80 @@
+import random
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+
+from app.api.content import (
+    _get_item_user_id,
+    avoid_consecutive_sources,
+    distribute_sources,
+)
+
+
+def _reference_avoid_consecutive_sources(items):
+    """Original swap-based implementation, kept as the behavioural spec."""
+    result = list(items)
+    for i in range(1, len(result)):
+        prev_id = _get_item_user_id(result[i - 1])
+        curr_id = _get_item_user_id(result[i])
+        if prev_id is not None and curr_id == prev_id:
+            swap_idx = None
+            for j in range(i + 1, len(result)):
+                if _get_item_user_id(result[j]) != prev_id:
+                    swap_idx = j
+                    break
+            if swap_idx is not None:
+                result[i], result[swap_idx] = result[swap_idx], result[i]
+    return result
+
+
+def _reference_distribute_sources(items):
+    """Original list-based round robin, kept as the behavioural spec."""
+    groups = OrderedDict()
+    for item in items:
+        groups.setdefault(_get_item_user_id(item), []).append(item)
+
+    result = []
+    active_keys = list(groups.keys())
+    while active_keys:
+        finished = []
+        for uid in active_keys:
+            user_items = groups.get(uid)
+            if user_items:
+                result.append(user_items.pop(0))
+            if not user_items:
+                finished.append(uid)
+        for uid in finished:
+            active_keys.remove(uid)
+            groups.pop(uid, None)
+    return result
+
+
+def _random_items(rng, size, sources):
+    # Skewed sources (a few prolific users) plus the occasional missing user_id
+    weights = [1 / (rank + 1) ** 1.5 for rank in range(sources)]
+    items = []
+    for index in range(size):
+        uid = rng.choices(range(sources), weights)[0]
+        if rng.random() < 0.05:
+            uid = None
+        if rng.random() < 0.5:
+            items.append({"id": index, "user_id": uid})
+        else:
+            items.append(SimpleNamespace(id=index, user_id=uid))
+    return items
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_helpers_match_reference_implementations(seed):
+    rng = random.Random(seed)
+    items = _random_items(rng, rng.randint(0, 60), rng.randint(1, 6))
+
+    assert avoid_consecutive_sources(items) == _reference_avoid_consecutive_sources(items)
+    assert distribute_sources(items) == _reference_distribute_sources(items)
+
+
+def test_avoid_consecutive_sources_keeps_trailing_run_in_order():
+    items = [{"id": i, "user_id": uid} for i, uid in enumerate([1, 1, 2, 1, 1, 1])]
+
+    assert [item["id"] for item in avoid_consecutive_sources(items)] == [0, 2, 1, 3, 4, 5]
@@ -0,0 +1,103 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.fetchers import api_handler as api_module
+from app.fetchers.api_handler import APIHandler, get_session, is_not_modified
+from app.geocode_cache import SQLiteStore
+
+
+class _Site(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    etag = '"v1"'
+    failures_left = 0
+    hits = []
+
+    def do_GET(self):
+        _Site.hits.append((self.path, self.headers.get("If-None-Match"), self.client_address[1]))
+        if self.path == "/flaky" and _Site.failures_left:
+            _Site.failures_left -= 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == _Site.etag:
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = b"<html>news</html>"
+        self.send_response(200)
+        self.send_header("ETag", _Site.etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def site():
+    _Site.etag = '"v1"'
+    _Site.failures_left = 0
+    _Site.hits = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Site)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def handler(tmp_path, monkeypatch):
+    monkeypatch.setattr(api_module.config, "NEWS_HTTP_BACKOFF_SECONDS", 0)
+    monkeypatch.setattr(api_module, "_session", None)
+    return APIHandler(validators=SQLiteStore(str(tmp_path / "validators.sqlite3")))
+
+
+def test_unchanged_homepage_returns_304_after_it_was_processed(site, handler):
+    first = handler.get_if_modified(f"{site}/")
+    assert first.status_code == 200
+
+    # Not remembered yet (e.g. the save failed), so the page is downloaded again
+    assert handler.get_if_modified(f"{site}/").status_code == 200
+
+    handler.remember_validators(first)
+    assert is_not_modified(handler.get_if_modified(f"{site}/"))
+
+    _Site.etag = '"v2"'
+    assert handler.get_if_modified(f"{site}/").status_code == 200
+
+
+def test_detail_pages_are_never_conditional(site, handler):
+    handler.remember_validators(handler.get_if_modified(f"{site}/story"))
+
+    assert handler.get_news_data(f"{site}/story").status_code == 200
+    assert _Site.hits[-1][1] is None
+
+
+def test_connections_are_reused(site, handler):
+    for _ in range(3):
+        handler.get_news_data(f"{site}/")
+
+    assert handler.session is get_session()
+    assert len({port for _, _, port in _Site.hits}) == 1
+
+
+def test_transient_errors_are_retried(site, handler):
+    _Site.failures_left = 2
+
+    assert handler.get_news_data(f"{site}/flaky").status_code == 200
+    assert len(_Site.hits) == 3
+
+
+def test_no_debug_dump_by_default(site, handler, tmp_path, monkeypatch):
+    writes = []
+    monkeypatch.setattr("builtins.open", lambda *args, **kwargs: writes.append(args))
+
+    handler.get_news_data(f"{site}/")
+
+    assert writes == []
@@ -0,0 +1,151 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from app.fetchers.base_fetcher import DataFetcher
+from app.fetchers.chs_fetcher import CHSFetcher
+from app.fetchers.concurrent_fetch import HostLimitedPool, NewsSource, fetch_sources
+
+DELAY = 0.2
+
+
+class SlowAPIHandler:
+    """Serves canned pages after a fixed delay and tracks per-host concurrency."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requests = []
+        self.active = {}
+        self.peak = {}
+        self._lock = threading.Lock()
+
+    def get_news_data(self, url):
+        host = url.split("/")[2]
+        with self._lock:
+            self.requests.append(url)
+            self.active[host] = self.active.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+        time.sleep(DELAY)
+        with self._lock:
+            self.active[host] -= 1
+        return self.pages.get(url)
+
+
+def _page(text):
+    return SimpleNamespace(content=text.encode(), ok=True, status_code=200)
+
+
+class ListFetcher(DataFetcher):
+    """Homepage lists article URLs one per line; parse reads each article."""
+
+    saved = []
+
+    def __init__(self, api_handler):
+        self.api_handler = api_handler
+
+    def detail_links(self, response):
+        return response.content.decode().split()
+
+    def parse_data(self, response):
+        return [self.api_handler.get_news_data(link).content.decode() for link in self.detail_links(response)]
+
+    def save_data(self, parsed):
+        ListFetcher.saved.extend(parsed)
+        return {"saved": len(parsed)}
+
+
+def _site(host, articles):
+    pages = {f"https://{host}/": _page(" ".join(f"https://{host}/{i}" for i in range(articles)))}
+    pages.update({f"https://{host}/{i}": _page(f"{host}-{i}") for i in range(articles)})
+    return pages
+
+
+def test_downloads_overlap_and_saves_keep_source_order():
+    pages = {}
+    for host in ("a.test", "b.test", "c.test"):
+        pages.update(_site(host, 4))
+    pages.pop("https://c.test/")  # c.test is down
+    api_handler = SlowAPIHandler(pages)
+    ListFetcher.saved = []
+
+    sources = [NewsSource(host, f"https://{host}/", ListFetcher) for host in ("a.test", "b.test", "c.test")]
+    started = time.monotonic()
+    with HostLimitedPool(max_workers=16, per_host=4) as pool:
+        results = fetch_sources(sources, api_handler, pool)
+    elapsed = time.monotonic() - started
+
+    # 11 downloads, sequentially 2.2s; concurrently one homepage + one article round
+    assert elapsed < 5 * DELAY
+    assert results == [
+        {"source": "a.test", "parsed": 4, "saved": 4},
+        {"source": "b.test", "parsed": 4, "saved": 4},
+        {"source": "c.test", "status": "fetch_failed"},
+    ]
+    assert ListFetcher.saved == [f"a.test-{i}" for i in range(4)] + [f"b.test-{i}" for i in range(4)]
+    # Each page is downloaded once even though parse_data asks for it again
+    assert len(api_handler.requests) == len(set(api_handler.requests)) == 11
+
+
+def test_per_host_limit():
+    api_handler = SlowAPIHandler(_site("a.test", 8))
+    ListFetcher.saved = []
+
+    with HostLimitedPool(max_workers=16, per_host=2) as pool:
+        fetch_sources([NewsSource("a", "https://a.test/", ListFetcher)], api_handler, pool)
+
+    assert api_handler.peak["a.test"] == 2
+    assert len(ListFetcher.saved) == 8
+
+
+def test_slow_host_does_not_hold_threads_other_hosts_need():
+    api_handler = SlowAPIHandler({})
+    finished = []
+
+    def fetch(url):
+        api_handler.get_news_data(url)
+        finished.append(url)
+
+    with HostLimitedPool(max_workers=2, per_host=1) as pool:
+        for i in range(4):
+            pool.submit("https://slow.test/", fetch, f"https://slow.test/{i}")
+        # Runs on the second thread while the slow host's downloads queue
+        pool.submit("https://fast.test/", fetch, "https://fast.test/").result(timeout=3 * DELAY)
+
+    assert api_handler.peak == {"slow.test": 1, "fast.test": 1}
+    assert len(finished) == 5
+
+
+def test_chs_detail_links_match_the_pages_parse_data_reads():
+    homepage = _page(
+        "".join(
+            f'<article><header class="entry-header"><h1 class="entry-title">'
+            f'<a href="https://www.capitolhillseattle.com/{i}">Story {i}</a></h1></header>'
+            f'<div class="entry-content"><img src="https://img/{i}.jpg"></div></article>'
+            for i in range(7)
+        )
+    )
+    requested = []
+    fetcher = CHSFetcher(SimpleNamespace(get_news_data=lambda url: requested.append(url)))
+
+    fetcher.parse_data(homepage)
+
+    assert fetcher.detail_links(homepage) == requested
+    assert len(requested) == 5
+
+
+def test_unchanged_homepage_skips_parse_and_only_saved_pages_are_remembered():
+    api_handler = SlowAPIHandler(_site("a.test", 2))
+    remembered = []
+    api_handler.get_if_modified = lambda url: (
+        SimpleNamespace(status_code=304) if url.startswith("https://b.test") else api_handler.get_news_data(url)
+    )
+    api_handler.remember_validators = remembered.append
+    ListFetcher.saved = []
+
+    sources = [NewsSource(host, f"https://{host}/", ListFetcher) for host in ("a.test", "b.test")]
+    with HostLimitedPool() as pool:
+        results = fetch_sources(sources, api_handler, pool)
+
+    assert results[1] == {"source": "b.test", "status": "not_modified"}
+    assert ListFetcher.saved == ["a.test-0", "a.test-1"]
+    assert remembered == [api_handler.pages["https://a.test/"]]
@@ -0,0 +1,52 @@
+from types import SimpleNamespace
+
+from flask import current_app
+
+import app as app_package
+from app import worker
+from app.extensions import db
+from app.fetchers import news_fetcher
+from app.models import User
+
+
+def test_ingest_app_only_sets_up_the_database():
+    ingest_app = worker.create_ingest_app()
+
+    assert ingest_app.blueprints == {}
+    assert not hasattr(ingest_app, "s3_client")
+    with ingest_app.app_context():
+        assert db.session.query(User).count() >= 0
+
+
+def test_worker_app_is_built_once_per_process(monkeypatch):
+    monkeypatch.setattr(worker, "_worker_app", None)
+    first = worker.get_worker_app()
+
+    assert worker.get_worker_app() is first
+
+    # A forked child gets its own app (and connection pool)
+    monkeypatch.setattr(worker.os, "getpid", lambda: -1)
+    assert worker.get_worker_app() is not first
+
+
+def test_worker_context_reuses_the_running_app(app):
+    with app.app_context():
+        with worker.worker_app_context() as task_app:
+            assert task_app is app
+
+
+def test_fetch_data_does_not_build_an_app(app, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("fetch_data should reuse the worker app")
+
+    class UnchangedSource:
+        def get_if_modified(self, source):
+            return SimpleNamespace(status_code=304)
+
+    monkeypatch.setattr(app_package, "create_app", fail)
+    monkeypatch.setattr(worker, "create_ingest_app", fail)
+    monkeypatch.setattr(news_fetcher, "APIHandler", UnchangedSource)
+
+    with app.app_context():
+        news_fetcher.fetch_data.apply(args=("https://komonews.com/news/local",)).get()
+        assert current_app._get_current_object() is app
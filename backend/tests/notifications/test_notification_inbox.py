@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models import Notification
+from app.notifications import create_notification, mark_read, unread_count
+
+
+@pytest.fixture
+def inbox(session, users):
+    """Five notifications for users[0], oldest first; the first two already read."""
+    recipient, sender = users[0], users[1]
+    start = datetime(2026, 1, 1)
+    notifications = []
+    for i in range(5):
+        notification = create_notification(recipient.id, sender.id, "follow", f"n{i}")
+        notification.created_at = start + timedelta(minutes=i)
+        notifications.append(notification)
+    session.commit()
+    ids = [n.id for n in notifications]
+    mark_read(recipient.id, ids[:2])
+    session.commit()
+    return ids
+
+
+def _count(session, user_id):
+    session.expire_all()
+    return unread_count(user_id)
+
+
+def test_create_notification_bumps_unread_counter(session, users):
+    create_notification(users[0].id, users[1].id, "follow", "hello")
+    create_notification(users[0].id, users[2].id, "follow", "hello again")
+    session.commit()
+
+    assert _count(session, users[0].id) == 2
+    assert _count(session, users[1].id) == 0
+
+
+def test_inbox_pages_newest_first_with_cursor(client, users, inbox, login):
+    login(users[0])
+
+    first = client.get(f"/api/v1/notifications/{users[0].id}?per_page=2").get_json()
+    assert [n["id"] for n in first["data"]] == [inbox[4], inbox[3]]
+    assert first["pagination"]["has_next"] is True
+
+    cursor = first["pagination"]["next_cursor"]
+    rest = client.get(f"/api/v1/notifications/{users[0].id}?per_page=3&cursor={cursor}").get_json()
+    assert [n["id"] for n in rest["data"]] == [inbox[2], inbox[1], inbox[0]]
+    assert rest["pagination"] == {"mode": "cursor", "per_page": 3, "has_next": False, "next_cursor": None}
+
+    unread = client.get(f"/api/v1/notifications/unread/{users[0].id}").get_json()
+    assert [n["id"] for n in unread["data"]] == [inbox[4], inbox[3], inbox[2]]
+
+    bad = client.get(f"/api/v1/notifications/{users[0].id}?cursor=nope")
+    assert bad.status_code == 400
+
+
+def test_unread_count_endpoint(client, users, inbox, login):
+    login(users[0])
+
+    response = client.get(f"/api/v1/notifications/unread/count/{users[0].id}")
+
+    assert response.status_code == 200
+    assert response.get_json()["data"] == {"unread_count": 3}
+    assert client.get(f"/api/v1/notifications/unread/count/{users[1].id}").status_code == 403
+
+
+def test_bulk_mark_read_only_touches_own_unread_rows(client, session, users, inbox, login):
+    foreign = create_notification(users[1].id, users[0].id, "follow", "not yours")
+    session.commit()
+    login(users[0])
+
+    response = client.put(
+        "/api/v1/notifications/read", json={"ids": [inbox[0], inbox[3], inbox[4], foreign.id]}
+    )
+
+    assert response.get_json()["data"] == {"updated": 2}
+    assert _count(session, users[0].id) == 1
+    assert session.get(Notification, foreign.id).is_read is False
+
+    assert client.put(f"/api/v1/notifications/read/all/{users[0].id}").status_code == 200
+    assert _count(session, users[0].id) == 0
+    assert client.put("/api/v1/notifications/read", json={"ids": "all"}).status_code == 400
+
+
+def test_single_and_bulk_delete_adjust_counter(client, session, users, inbox, login):
+    login(users[0])
+
+    assert client.delete(f"/api/v1/notifications/delete/{inbox[4]}").status_code == 200
+    assert _count(session, users[0].id) == 2
+
+    response = client.delete("/api/v1/notifications/delete", json={"ids": [inbox[0], inbox[3]]})
+    assert response.get_json()["data"] == {"deleted": 2}
+    assert _count(session, users[0].id) == 1
+
+    assert client.delete(f"/api/v1/notifications/delete/all/{users[0].id}").status_code == 200
+    assert _count(session, users[0].id) == 0
+    assert Notification.query.filter_by(user_id=users[0].id).count() == 0
+
+
+def test_follow_creates_counted_notification(client, session, users, login):
+    login(users[1])
+
+    assert client.post(f"/api/v1/follow/{users[0].id}").status_code == 200
+
+    assert _count(session, users[0].id) == 1
@@ -0,0 +1,129 @@
+import time
+import uuid
+
+import pytest
+import socketio
+
+from app import realtime
+from app.group_fanout import fan_out_group_message
+from app.models import GroupChat, GroupChatMember, GroupMessage, Notification, RoleEnum
+from app.realtime import LocalPubSubManager, client_manager
+
+
+class Node:
+    """A Socket.IO server on the in-memory bus with simulated sockets."""
+
+    def __init__(self, channel):
+        self.server = socketio.Server(async_mode="threading", client_manager=LocalPubSubManager(channel=channel))
+        self.received = []
+        self.server._send_eio_packet = lambda eio_sid, pkt: self.received.append((eio_sid, pkt.data))
+        self.server._handle_eio_connect("bootstrap", {})  # starts the pub/sub listener
+
+    def connect(self, room):
+        eio_sid = uuid.uuid4().hex
+        sid = self.server.manager.connect(eio_sid, "/")
+        self.server.manager.enter_room(sid, "/", room)
+        return eio_sid
+
+    def close(self):
+        self.server.manager.close()
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+@pytest.fixture
+def channel():
+    return f"test-{uuid.uuid4().hex}"
+
+
+@pytest.fixture
+def nodes(channel):
+    cluster = [Node(channel) for _ in range(3)]
+    yield cluster
+    for node in cluster:
+        node.close()
+
+
+def test_emit_on_one_node_reaches_sockets_on_another(nodes):
+    alice = nodes[1].connect("user_1")
+    bob = nodes[2].connect("user_2")
+
+    nodes[0].server.emit("notify_1", {"n": 1}, to="user_1")
+
+    assert _wait_for(lambda: nodes[1].received)
+    assert [sid for sid, _ in nodes[1].received] == [alice]
+    assert "notify_1" in nodes[1].received[0][1]
+    assert bob not in [sid for sid, _ in nodes[2].received]
+    assert nodes[0].received == []
+
+
+def test_write_only_publisher_delivers_without_holding_sockets(channel, nodes):
+    eio_sid = nodes[2].connect("group_7")
+    publisher = client_manager("memory://", channel=channel, write_only=True)
+
+    publisher.emit("group_chat_7", {"message": "hi"}, namespace="/", room="group_7")
+
+    assert _wait_for(lambda: nodes[2].received)
+    assert nodes[2].received[0][0] == eio_sid
+
+
+def test_emit_without_a_server_uses_the_configured_queue(monkeypatch, channel, nodes):
+    eio_sid = nodes[0].connect("user_9")
+    monkeypatch.setattr(realtime.flask_socketio, "server", None)
+    monkeypatch.setattr(realtime, "_publisher", client_manager("memory://", channel=channel, write_only=True))
+
+    assert realtime.emit("notify_9", {"n": 9}, to="user_9") is True
+    assert _wait_for(lambda: nodes[0].received)
+    assert nodes[0].received[0][0] == eio_sid
+
+
+def test_emit_without_server_or_queue_is_dropped(monkeypatch):
+    monkeypatch.setattr(realtime.flask_socketio, "server", None)
+    monkeypatch.setattr(realtime, "SOCKETIO_MESSAGE_QUEUE", "")
+    monkeypatch.setattr(realtime, "_publisher", None)
+
+    assert realtime.emit("notify_1", {}, to="user_1") is False
+
+
+def test_emit_into_a_server_without_sockets_is_dropped(monkeypatch, caplog):
+    # A Celery worker runs socketio.init_app too, but holds no sockets
+    monkeypatch.setattr(realtime.flask_socketio, "server", socketio.Server(async_mode="threading"))
+
+    assert realtime.emit("notify_1", {}, to="user_1") is False
+    assert "dropping notify_1" in caplog.text
+
+
+def test_fan_out_task_in_a_worker_reaches_sockets_through_the_queue(monkeypatch, channel, nodes, session, users):
+    group = GroupChat(name="Neighbors", created_by=users[0].id)
+    session.add(group)
+    session.commit()
+    session.add_all(
+        GroupChatMember(group_chat_id=group.id, user_id=user.id, role=RoleEnum.MEMBER) for user in users[:3]
+    )
+    message = GroupMessage(group_chat_id=group.id, sender_id=users[0].id, content="hello")
+    session.add(message)
+    session.commit()
+    sockets = {user.id: nodes[i].connect(f"user_{user.id}") for i, user in enumerate(users[:3])}
+    monkeypatch.setattr(realtime.flask_socketio, "server", None)
+    monkeypatch.setattr(realtime, "_publisher", client_manager("memory://", channel=channel, write_only=True))
+
+    assert fan_out_group_message(message.id) == 2
+
+    assert Notification.query.count() == 2
+    for i, user in enumerate(users[1:3], start=1):
+        assert _wait_for(lambda: nodes[i].received)
+        assert nodes[i].received[0][0] == sockets[user.id]
+        assert f"notify_{user.id}" in nodes[i].received[0][1]
+    assert nodes[0].received == []
+
+
+def test_client_manager_picks_backend_from_url():
+    assert client_manager("") is None
+    assert isinstance(client_manager("memory://"), LocalPubSubManager)
+    assert isinstance(client_manager("redis://localhost:6379/0", write_only=True), socketio.RedisManager)
+    assert isinstance(client_manager("amqp://guest@localhost//", write_only=True), socketio.KombuManager)
@@ -0,0 +1,59 @@
+import pytest
+from flask import g
+
+from app.extensions import socketio
+from app.socket_events import send_notification, send_notifications
+
+
+def _socket_for(app, user):
+    """Connect a Socket.IO test client carrying ``user``'s login session."""
+    # The test app context is shared, so drop the user Flask-Login cached in g
+    g.pop("_login_user", None)
+    http = app.test_client()
+    if user is not None:
+        with http.session_transaction() as sess:
+            sess["_user_id"] = str(user.id)
+            sess["_fresh"] = True
+    return socketio.test_client(app, flask_test_client=http)
+
+
+@pytest.fixture
+def sockets(app, users):
+    clients = [_socket_for(app, user) for user in users[:3]]
+    for client in clients:
+        client.get_received()
+    yield clients
+    for client in clients:
+        if client.is_connected():
+            client.disconnect()
+
+
+def _events(client):
+    return [(event["name"], event["args"][0]) for event in client.get_received()]
+
+
+def test_unauthenticated_socket_is_rejected(app, session):
+    assert not _socket_for(app, None).is_connected()
+
+
+def test_notification_reaches_only_the_recipient(users, sockets):
+    send_notification(users[1].id, {"n": 1})
+
+    assert _events(sockets[0]) == []
+    assert _events(sockets[1]) == [(f"notify_{users[1].id}", {"n": 1})]
+    assert _events(sockets[2]) == []
+
+
+def test_batched_send_emits_once_per_recipient_room(monkeypatch, users, sockets):
+    emits = []
+    original = socketio.emit
+    monkeypatch.setattr(
+        socketio, "emit", lambda *args, **kwargs: emits.append(kwargs["to"]) or original(*args, **kwargs)
+    )
+
+    send_notifications([users[0].id, users[2].id, users[0].id], {"n": 2})
+
+    assert emits == [f"user_{users[0].id}", f"user_{users[2].id}"]
+    assert _events(sockets[0]) == [(f"notify_{users[0].id}", {"n": 2})]
+    assert _events(sockets[1]) == []
+    assert _events(sockets[2]) == [(f"notify_{users[2].id}", {"n": 2})]
@@ -0,0 +1,74 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import NullPool, QueuePool
+
+from app import db_pool
+from app.db_pool import engine_options, instrument_engine, pool_metrics
+
+
+@pytest.fixture
+def small_engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=QueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+    )
+    instrument_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_postgres_gets_a_tuned_pool_and_sqlite_keeps_defaults(monkeypatch):
+    options = engine_options("postgresql://u:p@db/pulse")
+
+    assert options["poolclass"] is QueuePool
+    assert options["pool_pre_ping"] is True
+    assert {"pool_size", "max_overflow", "pool_timeout", "pool_recycle"} <= options.keys()
+    assert engine_options("sqlite:////tmp/pulse.db") == {}
+
+    monkeypatch.setattr(db_pool, "DB_PGBOUNCER", True)
+    assert engine_options("postgresql://u:p@db/pulse") == {"poolclass": NullPool}
+
+
+def test_checkouts_in_use_and_timeouts_are_counted(small_engine):
+    first = small_engine.connect()
+    first.execute(text("SELECT 1"))
+
+    with pytest.raises(PoolTimeoutError):
+        small_engine.connect()
+
+    stats = pool_metrics(small_engine)
+    assert stats["pool"] == "QueuePool"
+    assert (stats["checkouts"], stats["in_use"], stats["checked_out"], stats["timeouts"]) == (1, 1, 1, 1)
+    assert stats["wait_seconds_max"] >= 0.1
+
+    first.close()
+    with small_engine.connect():
+        pass
+
+    stats = pool_metrics(small_engine)
+    assert (stats["checkouts"], stats["in_use"], stats["peak_in_use"]) == (2, 0, 1)
+
+
+def test_metrics_survive_dispose(small_engine):
+    with small_engine.connect():
+        pass
+    small_engine.dispose()
+    with small_engine.connect():
+        pass
+
+    assert pool_metrics(small_engine)["checkouts"] == 2
+
+
+def test_create_app_has_a_single_engine(app, client, login, test_user):
+    assert not hasattr(app, "db_session")
+    assert client.get("/healthz/db-pool").status_code == 401
+
+    login(test_user)
+    response = client.get("/healthz/db-pool")
+
+    assert response.status_code == 200
+    assert "checkouts" in response.get_json()
@@ -0,0 +1,86 @@
+import random
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+from shapely.geometry import Point, box
+
+from app import utils
+from app.geo_index import PolygonIndex
+
+
+def _neighborhoods():
+    # Overlapping polygons plus point-only features, as OSM "place" tags return
+    return gpd.GeoDataFrame(
+        {
+            "name": ["Ballard", "Fremont", "Wallingford", None, "Green Lake"],
+            "geometry": [
+                box(-122.40, 47.66, -122.36, 47.69),
+                box(-122.37, 47.64, -122.34, 47.67),
+                box(-122.34, 47.65, -122.32, 47.67),
+                box(-122.31, 47.60, -122.30, 47.61),
+                Point(-122.33, 47.68),
+            ],
+        },
+        crs="EPSG:4326",
+    )
+
+
+def _reference_lookup(lat, lon, gdf):
+    """The original GeoDataFrame scan used by get_seattle_neighborhood."""
+    point = Point(lon, lat)
+    match = gdf[gdf.contains(point)]
+    if match.empty:
+        match = gdf[gdf.distance(point) < 0.005]
+    if match.empty:
+        return None
+    # The index reports unnamed features as None rather than NaN
+    name = match.iloc[0].get("name")
+    return None if pd.isna(name) else name
+
+
+def test_lookup_matches_geodataframe_scan():
+    gdf = _neighborhoods()
+    index = PolygonIndex.from_geodataframe(gdf)
+    rng = random.Random(7)
+    points = [
+        (rng.uniform(47.59, 47.70), rng.uniform(-122.41, -122.29))
+        for _ in range(500)
+    ]
+
+    for lat, lon in points:
+        assert index.lookup(lat, lon, max_distance=0.005) == _reference_lookup(lat, lon, gdf)
+
+    lats, lons = np.array(points).T
+    assert index.lookup_many(lats, lons, max_distance=0.005) == [
+        index.lookup(lat, lon, max_distance=0.005) for lat, lon in points
+    ]
+
+
+def test_overlap_resolves_to_first_geometry():
+    index = PolygonIndex.from_geodataframe(_neighborhoods())
+
+    assert index.lookup(47.665, -122.365) == "Ballard"
+    assert index.contains_many([47.665, 10.0], [-122.365, 10.0]).tolist() == [True, False]
+
+
+def test_empty_index_matches_nothing():
+    index = PolygonIndex.from_geodataframe(gpd.GeoDataFrame())
+
+    assert not index.contains(47.6, -122.3)
+    assert index.locate_many([47.6], [-122.3]).tolist() == [-1]
+
+
+def test_utils_route_through_cached_indexes(monkeypatch):
+    gdf = _neighborhoods()
+    boundary = box(-122.45, 47.49, -122.22, 47.74)
+    layers = {
+        utils.LAYER_NEIGHBORHOODS: (gdf, PolygonIndex.from_geodataframe(gdf)),
+        utils.LAYER_BOUNDARY: (gpd.GeoDataFrame(geometry=[boundary], crs="EPSG:4326"), PolygonIndex([boundary])),
+    }
+    monkeypatch.setattr(utils, "_seattle_layer", layers.__getitem__)
+
+    assert utils.is_coordinate_in_seattle(47.6062, -122.3321) is True
+    assert utils.are_coordinates_in_seattle([47.6062, 45.5152], [-122.3321, -122.6784]).tolist() == [True, False]
+    assert utils.get_seattle_neighborhood(47.68, -122.38) == "Ballard"
+    assert utils.get_seattle_neighborhoods_many([47.68, 47.682], [-122.38, -122.331]) == ["Ballard", "Green Lake"]
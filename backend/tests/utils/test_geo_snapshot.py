@@ -0,0 +1,94 @@
+import geopandas as gpd
+import pytest
+from shapely.geometry import Point, box
+
+from app import geo_snapshot, utils
+from app.geo_snapshot import SnapshotUnavailable, load_layer, read_manifest, write_snapshot
+
+
+def _layers():
+    return {
+        "boundary": gpd.GeoDataFrame(
+            {"name": ["Seattle"]},
+            geometry=[box(-122.45, 47.49, -122.22, 47.74)],
+            crs="EPSG:4326",
+        ),
+        "neighborhoods": gpd.GeoDataFrame(
+            {"name": ["Ballard", float("nan"), "Green Lake"]},
+            geometry=[
+                box(-122.40, 47.66, -122.36, 47.69),
+                box(-122.31, 47.60, -122.30, 47.61),
+                Point(-122.33, 47.68),
+            ],
+            crs="EPSG:4326",
+        ),
+    }
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(geo_snapshot, "SEATTLE_GEO_SNAPSHOT_DIR", str(tmp_path))
+    utils._seattle_layer.cache_clear()
+    yield tmp_path
+    utils._seattle_layer.cache_clear()
+
+
+def test_snapshot_round_trip(snapshot_dir):
+    layers = _layers()
+    manifest = write_snapshot(layers)
+
+    loaded = load_layer("neighborhoods")
+    assert list(loaded["name"].fillna("")) == ["Ballard", "", "Green Lake"]
+    assert loaded.geometry.equals(layers["neighborhoods"].geometry)
+    assert read_manifest()["version"] == manifest["version"]
+
+
+def test_new_version_keeps_only_the_previous_files(snapshot_dir, monkeypatch):
+    def write_at(year):
+        class _At:
+            @staticmethod
+            def utcnow():
+                from datetime import datetime
+                return datetime(year, 1, 1)
+
+        monkeypatch.setattr(geo_snapshot, "datetime", _At)
+        write_snapshot(_layers())
+        return {f"boundary.{year}0101000000.wkb", f"neighborhoods.{year}0101000000.wkb"}
+
+    first = write_at(2097)
+    second = write_at(2098)
+
+    # A reader that saw the old manifest just before the swap can still open its files
+    assert {path.name for path in snapshot_dir.glob("*.wkb")} == first | second
+
+    third = write_at(2099)
+    assert {path.name for path in snapshot_dir.glob("*.wkb")} == second | third
+
+
+def test_truncated_layer_is_rejected(snapshot_dir):
+    manifest = write_snapshot(_layers())
+    path = snapshot_dir / manifest["layers"]["boundary"]["file"]
+    path.write_bytes(path.read_bytes()[:-3])
+
+    with pytest.raises(SnapshotUnavailable):
+        load_layer("boundary")
+
+
+def test_utils_load_snapshot_lazily_without_network(snapshot_dir, monkeypatch):
+    write_snapshot(_layers())
+
+    def no_network(name):
+        raise AssertionError(f"unexpected live fetch of {name}")
+
+    monkeypatch.setattr(utils, "fetch_live_layer", no_network)
+
+    assert utils.is_coordinate_in_seattle(47.6062, -122.3321) is True
+    assert utils.are_coordinates_in_seattle([47.6062, 45.5152], [-122.3321, -122.6784]).tolist() == [True, False]
+    assert utils.get_seattle_neighborhood(47.68, -122.38) == "Ballard"
+    assert utils.get_seattle_neighborhoods_many([47.68, 47.682], [-122.38, -122.331]) == ["Ballard", "Green Lake"]
+
+
+def test_missing_snapshot_without_fallback_matches_nothing(snapshot_dir, monkeypatch):
+    monkeypatch.setattr(utils, "SEATTLE_GEO_LIVE_FALLBACK", False)
+
+    assert utils.is_coordinate_in_seattle(47.6062, -122.3321) is False
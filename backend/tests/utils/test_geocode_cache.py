@@ -0,0 +1,199 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from app import utils
+from app.geocode_cache import CoalescingCache, SQLiteStore, build_store
+from app.local_cache import LRUCache
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SQLiteStore(str(tmp_path / "geocode.sqlite3"))
+
+
+def test_lru_evicts_oldest_and_expires():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    cache.get("a")
+    cache.set("c", 3, ttl=60)
+
+    assert cache.get("a") == 1
+    assert cache.get("b", "evicted") == "evicted"  # least recently used
+
+    cache.set("short", 4, ttl=0)
+    assert cache.get("short", "expired") == "expired"
+
+
+def test_l2_is_shared_between_processes(store):
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return {"neighbourhood": "Ballard"}
+
+    first = CoalescingCache(store=store)
+    second = CoalescingCache(store=SQLiteStore(store.path))
+
+    assert first.get_or_fetch("k", fetch) == {"neighbourhood": "Ballard"}
+    assert second.get_or_fetch("k", fetch) == {"neighbourhood": "Ballard"}
+    assert len(calls) == 1
+
+
+def test_concurrent_lookups_make_one_upstream_call(store):
+    cache = CoalescingCache(store=store)
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.1)
+        return {"city": "Seattle"}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_fetch("k", fetch)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"city": "Seattle"}] * 8
+
+
+def test_waits_for_lease_holder_in_another_process(store):
+    cache = CoalescingCache(store=store, lease_seconds=2, poll_interval=0.01)
+    assert store.acquire("k", 2)
+
+    publisher = threading.Timer(
+        0.1, lambda: SQLiteStore(store.path).set("k", {"city": "Seattle"}, 60)
+    )
+    publisher.start()
+
+    def fetch():
+        raise AssertionError("should reuse the other process's result")
+
+    assert cache.get_or_fetch("k", fetch) == {"city": "Seattle"}
+    publisher.join()
+
+
+def test_released_lease_stops_the_wait(store):
+    cache = CoalescingCache(store=store, lease_seconds=5, poll_interval=0.01)
+    assert store.acquire("k", 5)
+    # The other process gives up without publishing anything
+    releaser = threading.Timer(0.1, lambda: SQLiteStore(store.path).release("k"))
+    releaser.start()
+
+    started = time.monotonic()
+    assert cache.get_or_fetch("k", lambda: {"city": "Seattle"}) == {"city": "Seattle"}
+    releaser.join()
+
+    assert time.monotonic() - started < 1
+
+
+def test_failures_are_shared_briefly(store):
+    cache = CoalescingCache(store=store, negative_ttl=60)
+
+    assert cache.get_or_fetch("k", lambda: None) is None
+    # Another process reuses the failure instead of calling upstream again
+    other = CoalescingCache(store=SQLiteStore(store.path))
+    assert other.get_or_fetch("k", lambda: {"city": "Seattle"}) is None
+
+    expired = CoalescingCache(store=store, negative_ttl=0)
+    assert expired.get_or_fetch("j", lambda: None) is None
+    assert CoalescingCache(store=store).get_or_fetch("j", lambda: {"city": "Seattle"}) == {"city": "Seattle"}
+
+
+def test_waiters_get_the_lease_holders_failure(store):
+    cache = CoalescingCache(store=store, lease_seconds=5, poll_interval=0.01)
+    assert store.acquire("k", 5)
+
+    def fail_upstream():
+        other = SQLiteStore(store.path)
+        other.set("k", None, 60)
+        other.release("k")
+
+    publisher = threading.Timer(0.1, fail_upstream)
+    publisher.start()
+
+    def fetch():
+        raise AssertionError("should reuse the other process's failure")
+
+    started = time.monotonic()
+    assert cache.get_or_fetch("k", fetch) is None
+    publisher.join()
+    assert time.monotonic() - started < 1
+
+
+def test_store_shares_one_connection_across_threads(tmp_path, monkeypatch):
+    connects = []
+    real_connect = sqlite3.connect
+
+    def connect(*args, **kwargs):
+        connects.append(args)
+        return real_connect(*args, **kwargs)
+
+    monkeypatch.setattr("app.geocode_cache.sqlite3.connect", connect)
+    store = SQLiteStore(str(tmp_path / "geocode.sqlite3"))
+    store.set("k", 1, 60)
+
+    threads = [threading.Thread(target=store.get, args=("k",)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(connects) == 1
+    assert store.get("k") == 1
+
+
+def test_hits_refresh_accessed_at_only_after_the_touch_interval(store):
+    store.set("k", 1, 60)
+    statements = []
+    store._db.set_trace_callback(statements.append)
+
+    store.get("k")
+    assert not [sql for sql in statements if sql.startswith("UPDATE")]
+
+    store.touch_interval = 0
+    store.get("k")
+    assert [sql for sql in statements if sql.startswith("UPDATE")]
+
+
+def test_broken_store_falls_back_to_fetch():
+    class Broken:
+        def __getattr__(self, name):
+            def fail(*args):
+                raise ConnectionError("redis down")
+            return fail
+
+    cache = CoalescingCache(store=Broken())
+    assert cache.get_or_fetch("k", lambda: {"city": "Seattle"}) == {"city": "Seattle"}
+
+
+def test_build_store_from_url(tmp_path):
+    assert build_store("memory") is None
+    assert build_store(f"sqlite:///{tmp_path}/x.sqlite3").path == f"{tmp_path}/x.sqlite3"
+    with pytest.raises(ValueError):
+        build_store("ftp://nope")
+
+
+def test_reverse_geocode_uses_quantized_shared_cache(monkeypatch):
+    calls = []
+
+    def fake_uncached(lat, lon):
+        calls.append((lat, lon))
+        return {"city": "Seattle"}
+
+    monkeypatch.setattr(utils, "_reverse_geocode_uncached", fake_uncached)
+    monkeypatch.setattr(utils, "_reverse_geocode_cache", CoalescingCache(store=None))
+
+    utils._reverse_geocode_with_cache(47.6062001, -122.3321001)
+    utils._reverse_geocode_with_cache(47.6062002, -122.3321002)
+
+    assert calls == [(47.6062, -122.3321)]
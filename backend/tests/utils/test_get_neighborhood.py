@@ -1,4 +1,7 @@
+from shapely.geometry import box
+
 from app import utils
+from app.geo_index import PolygonIndex
 
 
 def test_get_neighborhood_inside_seattle_prefers_neighborhood(monkeypatch):
@@ -32,3 +35,36 @@ def test_get_neighborhood_outside_uses_city_when_available(monkeypatch):
     monkeypatch.setattr(utils, "_reverse_geocode_with_cache", fake_reverse_geocode)
 
     assert utils.get_neighborhood(45.5152, -122.6784) == "Outside Seattle - Portland"
+
+
+def _with_neighborhood_polygons(monkeypatch):
+    index = PolygonIndex([box(-122.40, 47.66, -122.36, 47.69)], ["Ballard"])
+    monkeypatch.setattr(utils, "_seattle_layer", lambda name: (None, index))
+
+
+def test_get_neighborhood_inside_seattle_skips_reverse_geocode(monkeypatch):
+    monkeypatch.setattr(utils, "is_coordinate_in_seattle", lambda lat, lon: True)
+    _with_neighborhood_polygons(monkeypatch)
+
+    def no_network(lat, lon):
+        raise AssertionError("in-Seattle points should be labelled locally")
+
+    monkeypatch.setattr(utils, "_reverse_geocode_with_cache", no_network)
+
+    assert utils.get_neighborhood(47.6687, -122.3847) == "Ballard"
+    assert utils.get_neighborhood(47.6062, -122.3321) == "Seattle"
+
+
+def test_get_neighborhood_outside_seattle_still_reverse_geocodes(monkeypatch):
+    monkeypatch.setattr(utils, "is_coordinate_in_seattle", lambda lat, lon: False)
+    _with_neighborhood_polygons(monkeypatch)
+    calls = []
+
+    def fake_reverse_geocode(lat, lon):
+        calls.append((lat, lon))
+        return {"city": "Bellevue", "state": "Washington"}
+
+    monkeypatch.setattr(utils, "_reverse_geocode_with_cache", fake_reverse_geocode)
+
+    assert utils.get_neighborhood(47.6101, -122.2015) == "Outside Seattle - Bellevue"
+    assert calls == [(47.6101, -122.2015)]
@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Loaded on the first geometry lookup, never by importing the app
+LAZY_MODULES = ("geopandas", "shapely", "osmnx", "pandas", "pyproj")
+
+# Cumulative import time of the ``app`` package, in milliseconds. Generous
+# enough for a slow CI runner; it's there to catch the geo stack (or
+# something like it) creeping back into the import path.
+IMPORT_BUDGET_MS = int(os.getenv("APP_IMPORT_BUDGET_MS", "4000"))
+
+
+def _import_times():
+    """Run ``from app import create_app`` in a fresh interpreter under -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-X", "importtime", "-c", "from app import create_app"],
+        cwd=BACKEND_DIR,
+        env=os.environ.copy(),
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+def test_create_app_import_skips_geo_stack_and_stays_in_budget():
+    times = _import_times()
+
+    loaded = sorted(name for name in times if name.split(".")[0] in LAZY_MODULES)
+    assert loaded == []
+    assert times["app"] < IMPORT_BUDGET_MS, f"importing app took {times['app']:.0f}ms"
@@ -0,0 +1,142 @@
+"""Query-plan regressions for the hot feed, chat and notification lookups.
+
+Each query is compiled with literal values and run through SQLite's
+``EXPLAIN QUERY PLAN`` so a dropped index or a rewrite that stops using one
+fails here instead of showing up as a slow endpoint.
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import func, text, tuple_
+
+from app.api.content import _high_score_query
+from app.api.feed import _mypulse_query
+from app.chat_inbox import direct_inbox_query
+from app.extensions import db
+from app.location_service import parse_location_filter
+from app.models import (
+    Comment,
+    DirectMessage,
+    Follow,
+    GroupChatMember,
+    GroupMessage,
+    Notification,
+    Reaction,
+)
+
+
+def _plan(query):
+    statement = getattr(query, "statement", query)
+    sql = statement.compile(dialect=db.engine.dialect, compile_kwargs={"literal_binds": True})
+    rows = db.session.execute(text(f"EXPLAIN QUERY PLAN {sql}"))
+    return "\n".join(row[-1] for row in rows)
+
+
+def _uses(plan, index):
+    return f"USING INDEX {index} " in plan or f"USING COVERING INDEX {index} " in plan
+
+
+def test_mypulse_feed_uses_author_and_block_indexes(session):
+    plan = _plan(_mypulse_query(1, parse_location_filter("Anywhere")))
+
+    assert _uses(plan, "ix_user_content_user_id_created_at"), plan
+    assert "SCAN user_content" not in plan, plan
+    assert _uses(plan, "ix_block_blocked_id_blocker_id"), plan
+
+
+def test_seattle_feed_uses_location_index(session):
+    plan = _plan(_high_score_query(1, parse_location_filter("Seattle")))
+
+    assert _uses(plan, "ix_user_content_is_in_seattle_created_at"), plan
+    assert "SCAN user_content" not in plan, plan
+
+
+def test_direct_inbox_uses_participant_indexes(session):
+    plan = _plan(direct_inbox_query(1))
+
+    assert _uses(plan, "ix_direct_chats_user1_id_last_message_at"), plan
+    assert _uses(plan, "ix_direct_chats_user2_id_last_message_at"), plan
+    assert "SCAN direct_messages" not in plan, plan
+
+
+def test_message_history_seeks_without_sorting(session):
+    key = (DirectMessage.created_at, DirectMessage.id)
+    query = (
+        DirectMessage.query.filter(DirectMessage.chat_id == 1, tuple_(*key) < tuple_(datetime(2026, 1, 1), 500))
+        .order_by(DirectMessage.created_at.desc(), DirectMessage.id.desc())
+        .limit(21)
+    )
+    plan = _plan(query)
+
+    assert _uses(plan, "ix_direct_messages_chat_id_created_at_id"), plan
+    assert "TEMP B-TREE" not in plan, plan
+
+
+@pytest.mark.parametrize("unread_only", [False, True])
+def test_notification_inbox_seeks_without_sorting(session, unread_only):
+    query = Notification.query.filter(Notification.user_id == 1)
+    if unread_only:
+        query = query.filter(Notification.is_read == False)
+    key = (Notification.created_at, Notification.id)
+    for after in (None, (datetime(2026, 1, 1), 500)):
+        page = query if after is None else query.filter(tuple_(*key) < tuple_(*after))
+        plan = _plan(page.order_by(Notification.created_at.desc(), Notification.id.desc()).limit(21))
+
+        # Either (user_id, created_at, id) index serves the unread page in order
+        assert _uses(plan, "ix_notification_user_id_created_at_id") or \
+            _uses(plan, "ix_notification_user_id_unread_created_at_id"), plan
+        assert "TEMP B-TREE" not in plan, plan
+
+
+@pytest.mark.parametrize(
+    "build, index",
+    [
+        (
+            lambda: db.session.query(func.count()).filter(Notification.user_id == 1, Notification.is_read == False),
+            "ix_notification_user_id_unread_created_at_id",
+        ),
+        (
+            lambda: DirectMessage.query.filter_by(chat_id=1).order_by(DirectMessage.created_at.desc()).limit(20),
+            "ix_direct_messages_chat_id_created_at_id",
+        ),
+        (
+            lambda: GroupMessage.query.filter_by(group_chat_id=1).order_by(GroupMessage.created_at.desc()).limit(20),
+            "ix_group_messages_group_chat_id_created_at_id",
+        ),
+        (
+            lambda: db.session.query(GroupChatMember.user_id).filter_by(group_chat_id=1),
+            "ix_group_chat_members_group_chat_id_user_id",
+        ),
+        (
+            lambda: db.session.query(GroupChatMember.group_chat_id).filter_by(user_id=1),
+            "ix_group_chat_members_user_id_group_chat_id",
+        ),
+        (
+            lambda: Comment.query.filter_by(content_id=1, parent_id=None).order_by(Comment.created_at),
+            "ix_comment_content_id_created_at",
+        ),
+        (
+            lambda: Comment.query.filter(Comment.parent_id == 1).order_by(Comment.created_at),
+            "ix_comment_parent_id_created_at",
+        ),
+        (
+            lambda: db.session.query(Reaction.reaction_type, func.count())
+            .filter_by(content_id=1)
+            .group_by(Reaction.reaction_type),
+            "ix_reaction_content_id_reaction_type",
+        ),
+        (
+            lambda: Reaction.query.filter_by(user_id=1, content_id=2),
+            "ix_reaction_user_id_content_id",
+        ),
+        (
+            lambda: Follow.query.filter_by(followed_id=1),
+            "ix_follow_followed_id_follower_id",
+        ),
+    ],
+)
+def test_lookup_uses_index(session, build, index):
+    plan = _plan(build())
+
+    assert _uses(plan, index), plan